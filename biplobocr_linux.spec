@@ -35,6 +35,7 @@ a = Analysis(
         'ocrmypdf',
         'pikepdf',
         'fitz',
+        'numpy',
         'lxml',
         'reportlab',
         'reportlab.graphics.barcode',
@@ -23,7 +23,7 @@ if [ ! -f "$PYTHON_BIN" ]; then
 fi
 
 # Ensure PyInstaller is installed
-"$PYTHON_BIN" -m pip install pyinstaller pillow pikepdf pymupdf tkinterdnd2-universal
+"$PYTHON_BIN" -m pip install pyinstaller pillow numpy pikepdf pymupdf tkinterdnd2-universal
 
 # 2. Verify Dependencies
 echo "[2/7] Verifying self-sufficiency..."
@@ -3,51 +3,176 @@ import os
 import subprocess
 
 # 1. Enforcement Logic
-# BiplobOCR is designed to run using its bundled Windows Python.
+# BiplobOCR is designed to run using its bundled Python.
+# The launcher decision (reuse this interpreter vs. hand over to the bundled one) is
+# cached in the app data dir so a normal launch does not probe anything.
+LAUNCHER_CACHE_NAME = "launcher.json"
+LAUNCHER_CACHE_VERSION = 1
+# Packages the app cannot start without; checked with find_spec (no import)
+REQUIRED_MODULES = ("fitz", "pikepdf", "PIL", "ocrmypdf")
+
+def _find_bundled_python(base_dir):
+    """Returns (gui_exe, console_exe) of the bundled interpreter, or (None, None)."""
+    if os.name == 'nt':
+        python_dir = os.path.join(base_dir, "src", "python", "windows")
+        bundled_pyw = os.path.join(python_dir, "pythonw.exe")
+        bundled_py = os.path.join(python_dir, "python.exe")
+        exe_to_use = bundled_pyw if os.path.exists(bundled_pyw) else bundled_py
+        probe_exe = bundled_py if os.path.exists(bundled_py) else exe_to_use
+    else:
+        # Linux: Check for venv or bundled python
+        python_bin_dir = os.path.join(base_dir, "src", "python", "linux", "venv", "bin")
+        if not os.path.exists(python_bin_dir):
+            python_bin_dir = os.path.join(base_dir, "src", "python", "linux", "bin")
+        exe_to_use = os.path.join(python_bin_dir, "python")
+        probe_exe = exe_to_use
+
+    if not os.path.exists(exe_to_use):
+        return None, None
+    return exe_to_use, probe_exe
+
+def _launcher_cache_path():
+    try:
+        from src.core.platform_utils import get_app_data_dir
+        return os.path.join(get_app_data_dir(), LAUNCHER_CACHE_NAME)
+    except Exception:
+        return None
+
+def _load_launcher_cache(path, key):
+    if not path:
+        return None
+    try:
+        import json
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("key") == key:
+            return data
+    except Exception:
+        pass
+    return None
+
+def _save_launcher_cache(path, data):
+    if not path:
+        return
+    try:
+        import json
+        tmp = path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=1)
+        os.replace(tmp, path)
+    except Exception:
+        pass
+
+def _probe_bundled_python(probe_exe):
+    """Asks the bundled interpreter (once per bundle) for its version and site-packages dirs."""
+    import json
+    code = ("import sys, json; print(json.dumps({'version': list(sys.version_info[:2]), "
+            "'site_packages': [p for p in sys.path if p.rstrip('/\\\\').endswith('site-packages')]}))")
+    try:
+        res = subprocess.run([probe_exe, "-c", code], capture_output=True, text=True, timeout=60)
+        return json.loads(res.stdout.strip().splitlines()[-1])
+    except Exception:
+        return None
+
+def _can_reuse_interpreter(site_packages):
+    """True if every required package resolves once the bundled site-packages are on sys.path."""
+    import importlib.util
+    added = [p for p in site_packages if os.path.isdir(p) and p not in sys.path]
+    sys.path[1:1] = added
+    try:
+        return all(importlib.util.find_spec(m) is not None for m in REQUIRED_MODULES)
+    except Exception:
+        return False
+    finally:
+        for p in added:
+            sys.path.remove(p)
+
+def _resolve_launch(exe_to_use, probe_exe):
+    """Returns the cached or freshly computed launcher decision: {"mode": "inject"|"exec", ...}."""
+    try:
+        bundle_mtime = int(os.path.getmtime(exe_to_use))
+    except OSError:
+        bundle_mtime = 0
+    key = {
+        "version": LAUNCHER_CACHE_VERSION,
+        "current": os.path.abspath(sys.executable),
+        "current_version": list(sys.version_info[:2]),
+        "bundle": os.path.abspath(exe_to_use),
+        "bundle_mtime": bundle_mtime,
+    }
+    cache_path = _launcher_cache_path()
+    cached = _load_launcher_cache(cache_path, key)
+    if cached:
+        return cached
+
+    decision = {"key": key, "mode": "exec", "site_packages": []}
+    info = _probe_bundled_python(probe_exe)
+    if info and info.get("version") == key["current_version"]:
+        site_packages = [p for p in info.get("site_packages", []) if os.path.isdir(p)]
+        # Same major.minor: the bundled packages are ABI-compatible with this interpreter
+        if site_packages and _can_reuse_interpreter(site_packages):
+            decision["mode"] = "inject"
+            decision["site_packages"] = site_packages
+
+    _save_launcher_cache(cache_path, decision)
+    return decision
+
+def _hand_over(exe_to_use, base_dir):
+    """Replaces this process with the bundled interpreter (POSIX) or runs it and forwards its exit code."""
+    # Set a flag to prevent infinite loops
+    os.environ["BIPLO_OCR_BOOTSTRAPPED"] = "1"
+    os.environ["PYTHONPATH"] = base_dir + os.pathsep + os.environ.get("PYTHONPATH", "")
+    argv = [exe_to_use] + sys.argv
+
+    sys.stdout.flush()
+    sys.stderr.flush()
+    if os.name != 'nt':
+        # Same PID: supervisors, signals and exit codes keep working
+        os.execv(exe_to_use, argv)
+
+    # os.execv on Windows spawns and detaches; wait instead so the exit code is preserved
+    sys.exit(subprocess.call(argv))
+
 def bootstrap():
     # Only enforce on Windows/Linux if not already bootstrapped
     if getattr(sys, 'frozen', False):
         return
 
-    if "BIPLO_OCR_BOOTSTRAPPED" not in os.environ:
-        base_dir = os.path.dirname(os.path.abspath(__file__))
-        
-        if os.name == 'nt':
-            python_dir = os.path.join(base_dir, "src", "python", "windows")
-            bundled_pyw = os.path.join(python_dir, "pythonw.exe")
-            bundled_py = os.path.join(python_dir, "python.exe")
-            exe_to_use = bundled_pyw if os.path.exists(bundled_pyw) else bundled_py
-        else:
-            # Linux: Check for venv or bundled python
-            python_bin_dir = os.path.join(base_dir, "src", "python", "linux", "venv", "bin")
-            if not os.path.exists(python_bin_dir):
-                python_bin_dir = os.path.join(base_dir, "src", "python", "linux", "bin")
-            exe_to_use = os.path.join(python_bin_dir, "python")
-        
-        if not os.path.exists(exe_to_use):
-            # If bundled not found, do not bootstrap, just continue with system
-            return 
+    if "BIPLO_OCR_BOOTSTRAPPED" in os.environ:
+        return
 
-        # 1. Check if we are already running from the bundled folder
-        current_exe = os.path.abspath(sys.executable).lower()
-        bundle_exe_abs = os.path.abspath(exe_to_use).lower()
-        
-        if current_exe == bundle_exe_abs:
-            return # We are already in the right place!
+    base_dir = os.path.dirname(os.path.abspath(__file__))
+    exe_to_use, probe_exe = _find_bundled_python(base_dir)
+    if not exe_to_use:
+        # If bundled not found, do not bootstrap, just continue with system
+        return
 
-        # Set a flag to prevent infinite loops
-        env = os.environ.copy()
-        env["BIPLO_OCR_BOOTSTRAPPED"] = "1"
-        env["PYTHONPATH"] = base_dir + os.pathsep + env.get("PYTHONPATH", "")
-        
-        try:
-            # Re-launch and exit
-            subprocess.Popen([exe_to_use] + sys.argv, env=env)
-            sys.exit(0)
-        except Exception as e:
-            print(f"CRITICAL ERROR: Failed to launch bundled Python: {e}")
-            # Fallback to system if bootstrap fails
-            return
+    # Check if we are already running from the bundled folder
+    current_exe = os.path.abspath(sys.executable).lower()
+    if current_exe in (os.path.abspath(exe_to_use).lower(), os.path.abspath(probe_exe).lower()):
+        return # We are already in the right place!
+
+    # BIPLOB_OCR_LAUNCHER=exec forces the old hand-over behaviour
+    if os.environ.get("BIPLOB_OCR_LAUNCHER", "").lower() == "exec":
+        decision = {"mode": "exec"}
+    else:
+        decision = _resolve_launch(exe_to_use, probe_exe)
+
+    if decision.get("mode") == "inject":
+        # Compatible interpreter: use the bundled packages in-process, no second interpreter
+        for p in reversed(decision.get("site_packages", [])):
+            if p not in sys.path:
+                sys.path.insert(1, p)
+        os.environ["PYTHONPATH"] = os.pathsep.join(decision.get("site_packages", []) + [base_dir, os.environ.get("PYTHONPATH", "")])
+        os.environ["BIPLO_OCR_BOOTSTRAPPED"] = "1"
+        return
+
+    try:
+        _hand_over(exe_to_use, base_dir)
+    except Exception as e:
+        print(f"CRITICAL ERROR: Failed to launch bundled Python: {e}")
+        # Fallback to system if bootstrap fails
+        return
 
 
 def setup_linux_bundle_env():
@@ -63,11 +188,17 @@ def setup_linux_bundle_env():
             os.environ['TK_LIBRARY'] = tk_dir
 
 if __name__ == "__main__":
+    # Frozen builds: lets process-pool children (PDF sanitize) start as workers, not as the app
+    import multiprocessing
+    multiprocessing.freeze_support()
     setup_linux_bundle_env()
-    bootstrap()
     
-    # Add the current directory to sys.path
+    # Add the current directory to sys.path (the launcher cache lives in the app data dir)
     sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+    bootstrap()
+
+    from src.core import startup_profile
+    startup_profile.mark("bootstrap")
 
     # Force UTF-8 for Windows consoles
     if sys.platform == "win32":
@@ -80,7 +211,9 @@ if __name__ == "__main__":
     setup_python_environment()
     setup_tesseract_environment()
     setup_ghostscript_environment()
+    startup_profile.mark("environment setup")
     loaded_font = setup_fonts()
+    startup_profile.mark("font registration")
     # loaded_font = None # Disable global registration to avoid X11 BadLength crash
 
     # If font failed to load, set fallbacks in the theme
@@ -100,4 +233,5 @@ if __name__ == "__main__":
 
 
     from src.main import main
+    startup_profile.mark("import GUI modules")
     main()
@@ -0,0 +1,240 @@
+"""
+Calibration - Measures this machine once and derives OCR tuning values.
+
+A short benchmark renders a synthetic A4 page and OCRs it with a single Tesseract
+worker, recording render time, OCR time and peak worker memory. From that and the
+usable cores/available memory (gpu_manager) it derives chunk size/threshold,
+ocrmypdf --jobs, batch document concurrency and an automatic render DPI cap.
+Results are persisted in ConfigManager under "tuning".
+"""
+import os
+import sys
+import time
+import shutil
+import logging
+import tempfile
+import threading
+import subprocess
+
+# Pre-calibration behaviour (previously hard-coded in ocr_engine)
+DEFAULT_TUNING = {
+    "chunk_threshold": 50,
+    "chunk_size": 20,
+    "jobs": 2,
+    "doc_concurrency": 1,
+    "max_dpi": 600,
+}
+
+MEMORY_BUDGET_FRACTION = 0.6        # Share of available RAM OCR workers may plan for
+TARGET_CHUNK_SECONDS = 60           # Wall time a chunk should take with all workers busy
+FALLBACK_WORKER_BYTES = 300 * 1024 * 1024
+FALLBACK_PAGE_SECONDS = 3.0
+
+_calibration_lock = threading.Lock()
+_calibration_thread = None
+
+
+def hardware_signature():
+    """Identifies the hardware a calibration was made on; a change triggers re-calibration."""
+    from . import gpu_manager
+    return {"cpu": gpu_manager.get_usable_cpu_count(), "platform": sys.platform}
+
+
+def get_tuning():
+    """Tuned values when auto-tune is on and a calibration exists, otherwise the defaults."""
+    from .config_manager import state as app_state
+    tuning = dict(DEFAULT_TUNING)
+    if app_state.get("auto_tune", True):
+        stored = app_state.get("tuning") or {}
+        for k in DEFAULT_TUNING:
+            if isinstance(stored.get(k), int) and stored[k] > 0:
+                tuning[k] = stored[k]
+    return tuning
+
+
+def needs_calibration():
+    from .config_manager import state as app_state
+    if not app_state.get("auto_tune", True):
+        return False
+    stored = app_state.get("tuning") or {}
+    return stored.get("hardware") != hardware_signature()
+
+
+def compute_tuning(cpu_count, mem_available, page_seconds, worker_bytes, page_bytes_300):
+    """
+    Derives tuning values from measurements.
+    page_seconds: single-worker OCR time of one 300 DPI A4 page.
+    worker_bytes: peak RSS of one Tesseract worker; page_bytes_300: raw RGB pixmap size at 300 DPI.
+    """
+    cpu_count = max(1, int(cpu_count or 1))
+    if not mem_available:
+        mem_available = 4 * 1024 ** 3
+    budget = mem_available * MEMORY_BUDGET_FRACTION
+
+    # ocrmypdf keeps the rendered page plus a preprocessed copy per worker
+    per_worker = worker_bytes + page_bytes_300 * 2
+    jobs = max(1, min(cpu_count, int(budget // max(1, per_worker))))
+
+    # Batches of small documents are dominated by per-document startup; run a few side by side
+    doc_concurrency = 1 if jobs < 6 else min(4, jobs // 4)
+
+    chunk_size = int(TARGET_CHUNK_SECONDS * jobs / max(0.25, page_seconds))
+    chunk_size = max(20, min(200, chunk_size))
+    chunk_threshold = max(50, chunk_size * 2)
+
+    # Highest automatic DPI whose per-worker footprint still fits the budget
+    per_job_budget = budget / jobs
+    max_dpi = 200
+    for dpi in (600, 450, 400, 300):
+        scale = (dpi / 300.0) ** 2
+        if worker_bytes + page_bytes_300 * scale * 2 <= per_job_budget:
+            max_dpi = dpi
+            break
+
+    return {
+        "chunk_threshold": chunk_threshold,
+        "chunk_size": chunk_size,
+        "jobs": jobs,
+        "doc_concurrency": doc_concurrency,
+        "max_dpi": max_dpi,
+    }
+
+
+def _find_tesseract():
+    from . import platform_utils
+    base_dir = platform_utils.get_base_dir()
+    bundled = os.path.join(base_dir, "tesseract", platform_utils.get_tesseract_dir_name(),
+                           platform_utils.get_tesseract_executable_name())
+    if os.path.exists(bundled):
+        return bundled
+    return shutil.which(platform_utils.get_tesseract_executable_name())
+
+
+def _children_max_rss():
+    """Peak RSS (bytes) of waited-for child processes, or None where unsupported."""
+    try:
+        import resource
+        rss = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+        return rss if sys.platform == "darwin" else rss * 1024
+    except Exception:
+        return None
+
+
+def _benchmark(work_dir):
+    """Returns (render_seconds, ocr_seconds, worker_bytes, page_bytes_300) for one synthetic page."""
+    import fitz
+    from . import platform_utils
+
+    doc = fitz.open()
+    page = doc.new_page(width=595, height=842) # A4 in points
+    line = "The quick brown fox jumps over the lazy dog. 0123456789 ABCDEFGHIJ"
+    y = 60
+    while y < 800:
+        page.insert_text((50, y), line, fontsize=10)
+        y += 14
+
+    t0 = time.perf_counter()
+    pix = page.get_pixmap(dpi=300)
+    render_seconds = time.perf_counter() - t0
+    page_bytes = pix.width * pix.height * pix.n
+    img_path = os.path.join(work_dir, "calib.png")
+    pix.save(img_path)
+    doc.close()
+
+    ocr_seconds = FALLBACK_PAGE_SECONDS
+    worker_bytes = FALLBACK_WORKER_BYTES
+    tess = _find_tesseract()
+    if tess:
+        env = os.environ.copy()
+        env["OMP_THREAD_LIMIT"] = "1"
+        env["TESSDATA_PREFIX"] = platform_utils.get_app_data_dir()
+        kwargs = {"stdout": subprocess.DEVNULL, "stderr": subprocess.DEVNULL, "env": env}
+        if os.name == 'nt':
+            kwargs["creationflags"] = platform_utils.get_subprocess_creation_flags()
+        rss_before = _children_max_rss()
+        t0 = time.perf_counter()
+        rc = subprocess.run([tess, img_path, os.path.join(work_dir, "calib"), "-l", "eng", "txt"], **kwargs).returncode
+        if rc == 0:
+            ocr_seconds = time.perf_counter() - t0 + render_seconds
+            rss = _children_max_rss()
+            # RUSAGE_CHILDREN is a running maximum; only trust it if Tesseract raised it
+            if rss and (rss_before is None or rss > rss_before):
+                worker_bytes = rss
+    return render_seconds, ocr_seconds, worker_bytes, page_bytes
+
+
+def _threads_untouched():
+    """True while max_cpu_threads is the default or the previous calibration's value (not set by the user)."""
+    from .config_manager import state as app_state, DEFAULT_CONFIG
+    current = app_state.get("max_cpu_threads")
+    previous = (app_state.get("tuning") or {}).get("jobs")
+    return current in (None, DEFAULT_CONFIG["max_cpu_threads"], previous)
+
+
+def run_calibration(save=True, apply_threads=False):
+    """
+    Runs the benchmark synchronously and (optionally) persists the result. Returns the tuning dict.
+    The thread setting takes the measured jobs only with apply_threads (the Settings button)
+    or while the user has not changed it; otherwise the result stays in tuning["jobs"].
+    """
+    from . import gpu_manager
+    from .config_manager import state as app_state
+
+    cpu = gpu_manager.get_usable_cpu_count()
+    mem = gpu_manager.get_available_memory()
+    work_dir = tempfile.mkdtemp(prefix="biplob_calib_")
+    try:
+        try:
+            render_s, page_s, worker_bytes, page_bytes = _benchmark(work_dir)
+        except Exception as e:
+            logging.warning(f"Calibration benchmark failed, using estimates: {e}")
+            render_s, page_s, worker_bytes, page_bytes = 0.0, FALLBACK_PAGE_SECONDS, FALLBACK_WORKER_BYTES, 2480 * 3508 * 3
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    tuning = compute_tuning(cpu, mem, page_s, worker_bytes, page_bytes)
+    tuning["hardware"] = hardware_signature()
+    tuning["measured"] = {
+        "render_seconds": round(render_s, 3),
+        "page_seconds": round(page_s, 3),
+        "worker_mb": int(worker_bytes / (1024 * 1024)),
+        "mem_available_mb": int(mem / (1024 * 1024)) if mem else None,
+    }
+    tuning["calibrated_at"] = int(time.time())
+    logging.info(f"Calibration result: {tuning}")
+
+    if save:
+        # jobs also becomes the thread setting shown in Settings (still user-adjustable)
+        new_config = {"tuning": tuning}
+        if apply_threads or _threads_untouched():
+            new_config["max_cpu_threads"] = tuning["jobs"]
+        app_state.save_config(new_config)
+    return tuning
+
+
+def start_background_calibration(callback=None, apply_threads=False):
+    """Runs run_calibration() in a daemon thread; `callback(tuning)` is called from that thread."""
+    global _calibration_thread
+    with _calibration_lock:
+        if _calibration_thread is not None and _calibration_thread.is_alive():
+            return _calibration_thread
+
+        def _worker():
+            try:
+                tuning = run_calibration(apply_threads=apply_threads)
+            except Exception as e:
+                logging.error(f"Calibration failed: {e}")
+                tuning = None
+            if callback:
+                try:
+                    callback(tuning)
+                except Exception:
+                    pass
+
+        _calibration_thread = threading.Thread(target=_worker, name="calibration", daemon=True)
+        _calibration_thread.start()
+        return _calibration_thread
+
+
+def is_running():
+    return _calibration_thread is not None and _calibration_thread.is_alive()
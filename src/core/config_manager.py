@@ -19,8 +19,23 @@ DEFAULT_CONFIG = {
     "gpu_device": "Auto",
     "max_cpu_threads": 2,
     "rasterize": False,
+    "two_pass": False,
+    "two_pass_threshold": 70,
+    "script_detection": True,
+    "model_tier": "standard",
+    "blank_detection": True,
+    "remove_blank_pages": False,
+    "text_fast_path": True,
     "dpi": 0,
-    "last_open_dir": ""
+    "last_open_dir": "",
+    "glyph_disk_cache": True,
+    "lazy_views": True,
+    "auto_tune": True,
+    "tuning": {},
+    "memory_budget_mb": 0,
+    "search_index": True,
+    "word_boxes": True,
+    "ocr_backend": "api"
 }
 
 TRANSLATIONS = {
@@ -39,8 +54,12 @@ TRANSLATIONS = {
         "opt_rotate": "Auto-Rotate Pages",
         "opt_force": "Force OCR (Ignore existing text)",
         "opt_rasterize": "Rasterize Images (Fixes errors, flattens annotations)",
+        "opt_two_pass": "Two-Pass (Re-read unclear pages at higher quality)",
+        "opt_remove_blank": "Remove Blank Pages",
         "lbl_dpi": "Rasterization DPI (0 = Auto/Original)",
         "lbl_optimize": "Optimization Level (0=None, 3=Max)",
+        "lbl_model_tier": "Model Quality (fast / standard / best)",
+        "lbl_pack_tier": "Install into:",
         "lbl_lang": "Interface Language",
         "lbl_ocr_lang": "OCR Language (Data Pack)",
         "lbl_theme": "Theme",
@@ -53,6 +72,11 @@ TRANSLATIONS = {
 
         "lbl_gpu": "Enable GPU Acceleration (Safe Mode)",
         "lbl_threads": "Max CPU Threads",
+        "lbl_search_text": "Search OCR text",
+        "msg_no_results": "No matching pages",
+        "lbl_auto_tune": "Auto-tune for this machine (chunking, parallel jobs, DPI cap)",
+        "btn_calibrate": "Run Calibration",
+        "lbl_calibrating": "Calibrating... this takes a few seconds.",
         "lbl_hw_settings": "Performance & Hardware",
         "lbl_dev_select": "Primary Processing Device (GPU/CPU):",
         "msg_restart": "Restart required for language change.",
@@ -96,8 +120,12 @@ TRANSLATIONS = {
         "opt_rotate": "পেজ ঘোরান (Rotate)",
         "opt_force": "জোরপূর্বক OCR করুন",
         "opt_rasterize": "ইমেজ রাস্টারাইজ করুন (ত্রুটি ঠিক করে)",
+        "opt_two_pass": "দুই ধাপে OCR (অস্পষ্ট পৃষ্ঠা আবার পড়ুন)",
+        "opt_remove_blank": "ফাঁকা পৃষ্ঠা বাদ দিন",
         "lbl_dpi": "রাস্টারাইজেশন DPI (0 = অটো/আসল)",
         "lbl_optimize": "অপ্টিমাইজেশন (0=নাই, 3=সর্বোচ্চ)",
+        "lbl_model_tier": "মডেলের মান (দ্রুত / সাধারণ / সেরা)",
+        "lbl_pack_tier": "যেখানে ইনস্টল হবে:",
 
         "lbl_lang": "ইন্টারফেস ভাষা (Interface)",
         "lbl_ocr_lang": "OCR ভাষা (ডাটা প্যাক)",
@@ -111,6 +139,11 @@ TRANSLATIONS = {
 
         "lbl_gpu": "GPU এক্সিলারেশন চালু করুন (নিরাপদ মোড)",
         "lbl_threads": "সর্বোচ্চ CPU থ্রেড",
+        "lbl_search_text": "OCR টেক্সটে খুঁজুন",
+        "msg_no_results": "কোনো মিল পাওয়া যায়নি",
+        "lbl_auto_tune": "এই কম্পিউটারের জন্য স্বয়ংক্রিয় টিউনিং (চাঙ্ক, সমান্তরাল কাজ, DPI সীমা)",
+        "btn_calibrate": "ক্যালিব্রেশন চালান",
+        "lbl_calibrating": "ক্যালিব্রেশন চলছে... কয়েক সেকেন্ড লাগবে।",
         "lbl_hw_settings": "হার্ডওয়্যার ও পারফরম্যান্স",
         "lbl_dev_select": "প্রাথমিক ডিভাইস (GPU/CPU):",
         "msg_restart": "ভাষা পরিবর্তনের জন্য রিস্টার্ট প্রয়োজন।",
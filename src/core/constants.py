@@ -1,4 +1,3 @@
-
 import os
 import tempfile
 
@@ -6,11 +5,20 @@ APP_NAME = "Biplob OCR"
 
 # Standardize pathing using platform_utils
 from . import platform_utils
-user_data_dir = platform_utils.get_app_data_dir()
-TEMP_DIR = os.path.join(user_data_dir, "temp")
+
+
+def get_temp_dir():
+    """
+    <app data>/temp, resolved on every call: the data directory can move while the app
+    runs (see platform_utils.revalidate_app_data_dir), so the path is never cached.
+    """
+    path = os.path.join(platform_utils.revalidate_app_data_dir(), "temp")
+    try:
+        os.makedirs(path, exist_ok=True)
+    except OSError:
+        pass
+    return path
+
 
 # Ensure it exists immediately
-try:
-    os.makedirs(TEMP_DIR, exist_ok=True)
-except:
-    pass
+get_temp_dir()
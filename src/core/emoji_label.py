@@ -1,18 +1,30 @@
 import tkinter as tk
 from tkinter import ttk
-from PIL import Image, ImageTk, ImageDraw, ImageFont
 import os
 import sys
 from .platform_utils import IS_LINUX
+from .glyph_cache import glyph_cache, get_font, font_signature
 
-try:
-    from pilmoji import Pilmoji
-except ImportError:
-    Pilmoji = None
+# PIL/Pilmoji are only needed for Linux image rendering; import them on first use
+Pilmoji = None
+_PILMOJI_CHECKED = False
+
+def _get_pilmoji():
+    global Pilmoji, _PILMOJI_CHECKED
+    if not _PILMOJI_CHECKED:
+        _PILMOJI_CHECKED = True
+        try:
+            from pilmoji import Pilmoji as _Pilmoji
+            Pilmoji = _Pilmoji
+        except ImportError:
+            Pilmoji = None
+    return Pilmoji
+
+EMOJI_FONT_PATH = "/usr/share/fonts/truetype/noto/NotoColorEmoji.ttf"
 
 def render_emoji_image(text, font_spec=("DejaVu Sans", 12), fg="white", master=None):
     """Utility to render text with emojis to an ImageTk.PhotoImage."""
-    if not Pilmoji or not IS_LINUX:
+    if not IS_LINUX or not _get_pilmoji():
         return None
         
     try:
@@ -35,36 +47,30 @@ def render_emoji_image(text, font_spec=("DejaVu Sans", 12), fg="white", master=N
             os.path.join(base_dir, "assets", "AdorNoirrit.ttf"),
             "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf"
         ]
-        
-        pil_font = None
-        for p in fallbacks:
-            if os.path.exists(p):
-                try:
-                    pil_font = ImageFont.truetype(p, size)
-                    break
-                except: continue
-        
-        if not pil_font: pil_font = ImageFont.load_default()
-        
-        w = int(pil_font.getlength(text)) + 30 # More padding
-        h = int(size * 1.8) + 10 # More height for comfort
-        
-        img = Image.new("RGBA", (w, h), (0,0,0,0))
-        # Use Noto Color Emoji if available
-        emoji_fpath = "/usr/share/fonts/truetype/noto/NotoColorEmoji.ttf"
-        with Pilmoji(img) as pilmoji:
-            pilmoji.text((10, 8), text, font=pil_font, fill=fg, 
-                         emoji_font_res=emoji_fpath if os.path.exists(emoji_fpath) else None)
+        font_path = next((p for p in fallbacks if os.path.exists(p)), None)
 
-        
-        bbox = img.getbbox()
-        if bbox:
-            # Add a bit of padding to the bbox to prevent clipping
-            img = img.crop((bbox[0]-5, bbox[1]-5, bbox[2]+5, bbox[3]+5))
+        def draw():
+            from PIL import Image
+            pil_font = get_font(font_path, size)
+            
+            w = int(pil_font.getlength(text)) + 30 # More padding
+            h = int(size * 1.8) + 10 # More height for comfort
+            
+            img = Image.new("RGBA", (w, h), (0,0,0,0))
+            # Use Noto Color Emoji if available
+            with Pilmoji(img) as pilmoji:
+                pilmoji.text((10, 8), text, font=pil_font, fill=fg, 
+                             emoji_font_res=EMOJI_FONT_PATH if os.path.exists(EMOJI_FONT_PATH) else None)
 
+            bbox = img.getbbox()
+            if bbox:
+                # Add a bit of padding to the bbox to prevent clipping
+                img = img.crop((bbox[0]-5, bbox[1]-5, bbox[2]+5, bbox[3]+5))
+            return img
 
-        
-        return ImageTk.PhotoImage(img, master=master)
+        key = ("button", text, font_path, font_signature(font_path), size, fg)
+        img = glyph_cache.get_or_render(key, draw)
+        return glyph_cache.get_photo(key, img, master)
     except Exception as e:
         import logging
         from . import platform_utils
@@ -110,7 +116,7 @@ class EmojiLabel(ttk.Label):
             super().config(text="", image="")
             return
 
-        if not IS_LINUX or not Pilmoji:
+        if not IS_LINUX or not _get_pilmoji():
             try:
                 from . import platform_utils
                 text = platform_utils.sanitize_for_linux(text)
@@ -144,44 +150,40 @@ class EmojiLabel(ttk.Label):
             if not os.path.exists(font_path):
                 # Fallback to system font if custom font is missing
                 font_path = "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf"
-            
-            try:
-                pil_font = ImageFont.truetype(font_path, size)
-            except:
-                pil_font = ImageFont.load_default()
-
-            # Measure and Draw
-            dummy_img = Image.new("RGBA", (1, 1), (0,0,0,0))
-            draw = ImageDraw.Draw(dummy_img)
-            
-            # We use a large enough image then crop
-            w = int(pil_font.getlength(text)) + 50
-            h = int(size * 2) + 20
-            
-            img = Image.new("RGBA", (w, h), (0,0,0,0))
-            
-            # Check if text has emojis
-            has_emoji = any(ord(c) > 0x2000 for c in text)
-            
-            if has_emoji:
-                # Use Noto Color Emoji if available
-                emoji_fpath = "/usr/share/fonts/truetype/noto/NotoColorEmoji.ttf"
-                with Pilmoji(img) as pilmoji:
-                    # Y offset for emojis to align with text
-                    pilmoji.text((5, 10), text, font=pil_font, fill=fg,
-                                 emoji_font_res=emoji_fpath if os.path.exists(emoji_fpath) else None)
-            else:
-                draw = ImageDraw.Draw(img)
-                draw.text((5, 10), text, font=pil_font, fill=fg)
 
+            def draw():
+                from PIL import Image, ImageDraw
+                pil_font = get_font(font_path, size)
 
-            # Crop and set
-            bbox = img.getbbox()
-            if bbox:
-                # Add a bit of padding to prevent clipping
-                img = img.crop((bbox[0]-5, bbox[1]-5, bbox[2]+5, bbox[3]+5))
-            
-            self._image_ref = ImageTk.PhotoImage(img)
+                # We use a large enough image then crop
+                w = int(pil_font.getlength(text)) + 50
+                h = int(size * 2) + 20
+                
+                img = Image.new("RGBA", (w, h), (0,0,0,0))
+                
+                # Check if text has emojis
+                has_emoji = any(ord(c) > 0x2000 for c in text)
+                
+                if has_emoji:
+                    # Use Noto Color Emoji if available
+                    with Pilmoji(img) as pilmoji:
+                        # Y offset for emojis to align with text
+                        pilmoji.text((5, 10), text, font=pil_font, fill=fg,
+                                     emoji_font_res=EMOJI_FONT_PATH if os.path.exists(EMOJI_FONT_PATH) else None)
+                else:
+                    canvas = ImageDraw.Draw(img)
+                    canvas.text((5, 10), text, font=pil_font, fill=fg)
+
+                # Crop
+                bbox = img.getbbox()
+                if bbox:
+                    # Add a bit of padding to prevent clipping
+                    img = img.crop((bbox[0]-5, bbox[1]-5, bbox[2]+5, bbox[3]+5))
+                return img
+
+            key = ("label", text, font_path, font_signature(font_path), size, fg)
+            img = glyph_cache.get_or_render(key, draw)
+            self._image_ref = glyph_cache.get_photo(key, img, self)
             super().config(image=self._image_ref, text="")
 
         except Exception as e:
@@ -0,0 +1,222 @@
+"""
+Glyph Cache - Process-wide cache of loaded fonts and rendered text images.
+
+On Linux every label/button text is rasterised through PIL/Pilmoji (see emoji_label.py).
+Identical (text, font, size, colour) combinations are rendered once, kept in a bounded
+in-memory LRU and optionally persisted to disk so the next launch skips rasterisation.
+"""
+import os
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+
+CACHE_VERSION = 1
+MAX_MEMORY_BYTES = 32 * 1024 * 1024   # Rendered RGBA images kept in RAM
+MAX_PHOTO_IMAGES = 512                # Tk PhotoImages kept alive per process
+MAX_DISK_ENTRIES = 2000               # PNGs kept in the on-disk cache
+
+_font_lock = threading.Lock()
+_fonts = {}
+_font_signatures = {}
+
+
+def get_font(path, size):
+    """Returns a cached ImageFont for (path, size). Falls back to PIL's default font."""
+    key = (path, size)
+    with _font_lock:
+        font = _fonts.get(key)
+        if font is not None:
+            return font
+
+    from PIL import ImageFont
+    try:
+        font = ImageFont.truetype(path, size) if path else ImageFont.load_default()
+    except Exception:
+        font = ImageFont.load_default()
+
+    with _font_lock:
+        _fonts[key] = font
+    return font
+
+
+def font_signature(path):
+    """Identifies a font file version so cached renders are invalidated when the file changes."""
+    sig = _font_signatures.get(path)
+    if sig is None:
+        try:
+            st = os.stat(path)
+            sig = f"{st.st_size}:{int(st.st_mtime)}"
+        except Exception:
+            sig = "missing"
+        _font_signatures[path] = sig
+    return sig
+
+
+class GlyphCache:
+    """Bounded LRU of rendered text images with optional PNG persistence."""
+
+    def __init__(self, max_bytes=MAX_MEMORY_BYTES, max_photos=MAX_PHOTO_IMAGES,
+                 max_disk_entries=MAX_DISK_ENTRIES):
+        self.max_bytes = max_bytes
+        self.max_photos = max_photos
+        self.max_disk_entries = max_disk_entries
+        self._lock = threading.Lock()
+        self._images = OrderedDict()   # key -> PIL.Image
+        self._bytes = 0
+        self._photos = OrderedDict()   # (key, interp) -> ImageTk.PhotoImage
+        self._disk_dir = None
+        self._disk_checked = False
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    # ==================== DISK LAYER ====================
+
+    def _get_disk_dir(self):
+        if self._disk_checked:
+            return self._disk_dir
+        self._disk_checked = True
+        try:
+            from .config_manager import state as app_state
+            if not app_state.get("glyph_disk_cache", True):
+                return None
+            from . import platform_utils
+            d = os.path.join(platform_utils.get_app_data_dir(), "cache", "glyphs")
+            os.makedirs(d, exist_ok=True)
+            self._disk_dir = d
+            threading.Thread(target=self._prune_disk, daemon=True).start()
+        except Exception as e:
+            logging.warning(f"Glyph disk cache disabled: {e}")
+            self._disk_dir = None
+        return self._disk_dir
+
+    def _disk_path(self, key):
+        d = self._get_disk_dir()
+        if not d:
+            return None
+        digest = hashlib.sha1(repr((CACHE_VERSION, key)).encode("utf-8")).hexdigest()
+        return os.path.join(d, digest + ".png")
+
+    def _load_from_disk(self, key):
+        path = self._disk_path(key)
+        if not path or not os.path.exists(path):
+            return None
+        try:
+            from PIL import Image
+            with Image.open(path) as f:
+                img = f.convert("RGBA")
+            return img
+        except Exception:
+            try: os.remove(path)
+            except: pass
+            return None
+
+    def _save_to_disk(self, key, img):
+        path = self._disk_path(key)
+        if not path:
+            return
+        try:
+            tmp = path + ".tmp"
+            img.save(tmp, "PNG")
+            os.replace(tmp, path)
+        except Exception as e:
+            logging.debug(f"Glyph cache write failed: {e}")
+
+    def _prune_disk(self):
+        """Keeps the on-disk cache bounded by dropping the least recently written entries."""
+        try:
+            d = self._disk_dir
+            entries = [e for e in os.scandir(d) if e.name.endswith(".png")]
+            if len(entries) <= self.max_disk_entries:
+                return
+            entries.sort(key=lambda e: e.stat().st_mtime)
+            for e in entries[:len(entries) - self.max_disk_entries]:
+                try: os.remove(e.path)
+                except: pass
+        except Exception:
+            pass
+
+    # ==================== MEMORY LAYER ====================
+
+    def get(self, key):
+        with self._lock:
+            img = self._images.get(key)
+            if img is not None:
+                self._images.move_to_end(key)
+                self.hits += 1
+                return img
+
+        img = self._load_from_disk(key)
+        if img is not None:
+            self.disk_hits += 1
+            self._remember(key, img)
+        return img
+
+    def _remember(self, key, img):
+        size = img.width * img.height * 4
+        with self._lock:
+            if key in self._images:
+                return
+            self._images[key] = img
+            self._bytes += size
+            while self._bytes > self.max_bytes and len(self._images) > 1:
+                _, old = self._images.popitem(last=False)
+                self._bytes -= old.width * old.height * 4
+
+    def put(self, key, img):
+        self._remember(key, img)
+        self._save_to_disk(key, img)
+
+    def get_or_render(self, key, render_fn):
+        """Returns the cached image for `key`, calling `render_fn()` only on a miss."""
+        img = self.get(key)
+        if img is not None:
+            return img
+        self.misses += 1
+        img = render_fn()
+        if img is not None:
+            self.put(key, img)
+        return img
+
+    def get_photo(self, key, img, master=None):
+        """Returns a shared ImageTk.PhotoImage for `key` (one per Tk interpreter)."""
+        from PIL import ImageTk
+        interp = id(master.tk) if master is not None else None
+        pkey = (key, interp)
+        with self._lock:
+            photo = self._photos.get(pkey)
+            if photo is not None:
+                self._photos.move_to_end(pkey)
+                return photo
+
+        photo = ImageTk.PhotoImage(img, master=master) if master is not None else ImageTk.PhotoImage(img)
+        with self._lock:
+            self._photos[pkey] = photo
+            # Widgets hold their own reference, so evicting here never blanks a visible image
+            while len(self._photos) > self.max_photos:
+                self._photos.popitem(last=False)
+        return photo
+
+    def clear(self, disk=False):
+        with self._lock:
+            self._images.clear()
+            self._photos.clear()
+            self._bytes = 0
+        if disk and self._get_disk_dir():
+            for e in os.scandir(self._disk_dir):
+                try: os.remove(e.path)
+                except: pass
+
+    def stats(self):
+        return {
+            "entries": len(self._images),
+            "bytes": self._bytes,
+            "photos": len(self._photos),
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+        }
+
+
+glyph_cache = GlyphCache()
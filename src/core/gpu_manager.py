@@ -1,20 +1,33 @@
 
+
 import subprocess
 import os
+import sys
+import json
+import time
+import logging
+import threading
+
+DEVICE_CACHE_NAME = "devices.json"
+DEVICE_CACHE_VERSION = 1
+
+_devices = None              # In-memory result of the last discovery/cache load
+_devices_lock = threading.Lock()
+_discovery_thread = None
 
-def get_available_gpus():
+def _discover_gpus():
     """
     Detects available GPUs on Windows (PowerShell) and Linux (lspci).
     Returns a list of strings including CPU and GPUs.
     """
     devices = ["CPU (Default)"]
-    
+
     if os.name == 'nt':
         try:
             # PowerShell is often more reliable/cleaner than wmic for this
             cmd = ["powershell", "-Command", "Get-CimInstance Win32_VideoController | Select-Object -ExpandProperty Name"]
             proc = subprocess.run(cmd, capture_output=True, text=True, creationflags=subprocess.CREATE_NO_WINDOW)
-            
+
             if proc.returncode == 0:
                 lines = proc.stdout.strip().split('\n')
                 for line in lines:
@@ -31,7 +44,7 @@ def get_available_gpus():
                     clean = line.strip()
                     if clean and clean not in devices:
                         devices.append(clean)
-            except: 
+            except:
                 pass
     elif os.name == 'posix':
         # Linux/Mac
@@ -44,21 +57,247 @@ def get_available_gpus():
                 for line in lines:
                     if "VGA" in line or "3D controller" in line or "Display controller" in line:
                          # Extract the device name (usually after the address)
-                         parts = line.split(":", 2) 
+                         parts = line.split(":", 2)
                          if len(parts) > 2:
                              clean = parts[2].strip()
                              if clean and clean not in devices:
                                  devices.append(clean)
         except:
             pass
-            
+
     return devices
 
+# ==================== DEVICE CACHE ====================
+
+def get_boot_id():
+    """Identifies the current boot so cached hardware info is re-checked after a reboot."""
+    try:
+        if sys.platform.startswith('linux'):
+            with open("/proc/sys/kernel/random/boot_id", "r") as f:
+                return f.read().strip()
+        if os.name == 'nt':
+            import ctypes
+            uptime = ctypes.windll.kernel32.GetTickCount64() / 1000.0
+            # Boot time rounded to a minute absorbs clock jitter between calls
+            return str(int((time.time() - uptime) // 60))
+        if sys.platform == 'darwin':
+            proc = subprocess.run(["sysctl", "-n", "kern.boottime"], capture_output=True, text=True)
+            return proc.stdout.strip() or None
+    except Exception:
+        pass
+    return None
+
+def _cache_path():
+    try:
+        from . import platform_utils
+        d = os.path.join(platform_utils.get_app_data_dir(), "cache")
+        os.makedirs(d, exist_ok=True)
+        return os.path.join(d, DEVICE_CACHE_NAME)
+    except Exception:
+        return None
+
+def _load_cached_devices():
+    path = _cache_path()
+    boot_id = get_boot_id()
+    if not path or not boot_id or not os.path.exists(path):
+        return None
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") == DEVICE_CACHE_VERSION and data.get("boot_id") == boot_id:
+            return data.get("gpus") or None
+    except Exception:
+        pass
+    return None
+
+def _save_cached_devices(gpus):
+    path = _cache_path()
+    boot_id = get_boot_id()
+    if not path or not boot_id:
+        return
+    try:
+        tmp = path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"version": DEVICE_CACHE_VERSION, "boot_id": boot_id, "gpus": gpus}, f)
+        os.replace(tmp, path)
+    except Exception as e:
+        logging.debug(f"Failed to write device cache: {e}")
+
+def get_cached_gpus():
+    """Returns the known device list without probing hardware (["CPU (Default)"] if none yet)."""
+    global _devices
+    with _devices_lock:
+        if _devices is not None:
+            return list(_devices)
+    cached = _load_cached_devices()
+    if cached:
+        with _devices_lock:
+            _devices = cached
+        return list(cached)
+    return ["CPU (Default)"]
+
+def get_available_gpus(refresh=False):
+    """
+    Returns the device list. Uses the in-memory/on-disk cache (valid for the current boot)
+    and only shells out to lspci/PowerShell when there is none, or when refresh=True.
+    """
+    global _devices
+    if not refresh:
+        with _devices_lock:
+            if _devices is not None:
+                return list(_devices)
+        cached = _load_cached_devices()
+        if cached:
+            with _devices_lock:
+                _devices = cached
+            return list(cached)
+
+    gpus = _discover_gpus()
+    with _devices_lock:
+        _devices = gpus
+    _save_cached_devices(gpus)
+    return list(gpus)
+
+def start_discovery(callback=None):
+    """
+    Runs get_available_gpus() in a daemon thread. `callback(gpus)` is invoked from that
+    thread when done; GUI callers must marshal it onto the Tk thread (e.g. app.after).
+    """
+    global _discovery_thread
+    if _discovery_thread is not None and _discovery_thread.is_alive():
+        return _discovery_thread
+
+    def _worker():
+        try:
+            gpus = get_available_gpus()
+        except Exception as e:
+            logging.warning(f"Device discovery failed: {e}")
+            gpus = ["CPU (Default)"]
+        if callback:
+            try:
+                callback(gpus)
+            except Exception:
+                pass
+
+    _discovery_thread = threading.Thread(target=_worker, name="device-discovery", daemon=True)
+    _discovery_thread.start()
+    return _discovery_thread
+
+# ==================== CPU / MEMORY ====================
+
+def _read_first_line(path):
+    try:
+        with open(path, "r") as f:
+            return f.readline().strip()
+    except Exception:
+        return None
+
+def _cgroup_cpu_limit():
+    """CPU quota from cgroup v2 (cpu.max) or v1 (cfs_quota/period), as a core count, or None."""
+    line = _read_first_line("/sys/fs/cgroup/cpu.max")
+    if line:
+        parts = line.split()
+        if len(parts) == 2 and parts[0] != "max":
+            try:
+                return max(1, int(int(parts[0]) / int(parts[1]) + 0.999))
+            except (ValueError, ZeroDivisionError):
+                pass
+        return None
+
+    quota = _read_first_line("/sys/fs/cgroup/cpu/cpu.cfs_quota_us") or _read_first_line("/sys/fs/cgroup/cpu,cpuacct/cpu.cfs_quota_us")
+    period = _read_first_line("/sys/fs/cgroup/cpu/cpu.cfs_period_us") or _read_first_line("/sys/fs/cgroup/cpu,cpuacct/cpu.cfs_period_us")
+    try:
+        quota, period = int(quota), int(period)
+        if quota > 0 and period > 0:
+            return max(1, int(quota / period + 0.999))
+    except (TypeError, ValueError):
+        pass
+    return None
+
+def get_usable_cpu_count():
+    """
+    Cores this process may actually use: the CPU affinity mask, further limited by a
+    cgroup CPU quota (containers, systemd slices). Falls back to os.cpu_count().
+    """
+    count = None
+    if hasattr(os, "process_cpu_count"):
+        count = os.process_cpu_count()
+    elif hasattr(os, "sched_getaffinity"):
+        try:
+            count = len(os.sched_getaffinity(0))
+        except Exception:
+            count = None
+    if not count:
+        count = os.cpu_count() or 4
+
+    if sys.platform.startswith('linux'):
+        limit = _cgroup_cpu_limit()
+        if limit:
+            count = min(count, limit)
+    return max(1, count)
+
+def _cgroup_memory_available():
+    """Remaining memory under a cgroup limit (v2 memory.max or v1 limit_in_bytes), or None."""
+    candidates = [
+        ("/sys/fs/cgroup/memory.max", "/sys/fs/cgroup/memory.current"),
+        ("/sys/fs/cgroup/memory/memory.limit_in_bytes", "/sys/fs/cgroup/memory/memory.usage_in_bytes"),
+    ]
+    for limit_path, usage_path in candidates:
+        limit = _read_first_line(limit_path)
+        if not limit or limit == "max":
+            continue
+        try:
+            limit = int(limit)
+            # cgroup v1 reports "unlimited" as a huge number
+            if limit >= 1 << 60:
+                continue
+            usage = int(_read_first_line(usage_path) or 0)
+            return max(0, limit - usage)
+        except ValueError:
+            continue
+    return None
+
+def get_available_memory():
+    """Available memory in bytes (respecting cgroup limits on Linux), or None if unknown."""
+    try:
+        if sys.platform.startswith('linux'):
+            available = None
+            with open("/proc/meminfo", "r") as f:
+                for line in f:
+                    if line.startswith("MemAvailable:"):
+                        available = int(line.split()[1]) * 1024
+                        break
+            limit = _cgroup_memory_available()
+            if limit is not None:
+                available = limit if available is None else min(available, limit)
+            return available
+
+        if os.name == 'nt':
+            import ctypes
+
+            class MEMORYSTATUSEX(ctypes.Structure):
+                _fields_ = [("dwLength", ctypes.c_ulong), ("dwMemoryLoad", ctypes.c_ulong),
+                            ("ullTotalPhys", ctypes.c_ulonglong), ("ullAvailPhys", ctypes.c_ulonglong),
+                            ("ullTotalPageFile", ctypes.c_ulonglong), ("ullAvailPageFile", ctypes.c_ulonglong),
+                            ("ullTotalVirtual", ctypes.c_ulonglong), ("ullAvailVirtual", ctypes.c_ulonglong),
+                            ("ullAvailExtendedVirtual", ctypes.c_ulonglong)]
+
+            stat = MEMORYSTATUSEX()
+            stat.dwLength = ctypes.sizeof(MEMORYSTATUSEX)
+            if ctypes.windll.kernel32.GlobalMemoryStatusEx(ctypes.byref(stat)):
+                return int(stat.ullAvailPhys)
+    except Exception:
+        pass
+    return None
+
 def get_system_info():
     """
-    Returns dict with cpu_count and gpus
+    Returns dict with cpu_count (usable cores), cpu_total, memory_available and gpus.
+    Never probes hardware: gpus comes from the cache, see start_discovery().
     """
     return {
-        "cpu_count": os.cpu_count() or 4,
-        "gpus": get_available_gpus()
+        "cpu_count": get_usable_cpu_count(),
+        "cpu_total": os.cpu_count() or 4,
+        "memory_available": get_available_memory(),
+        "gpus": get_cached_gpus()
     }
@@ -1,6 +1,7 @@
 import json
 import os
 import time
+import threading
 
 # HISTORY_FILE moved to instance level
 
@@ -9,6 +10,7 @@ class HistoryManager:
         from . import platform_utils
         self.history_path = os.path.join(platform_utils.get_app_data_dir(), "history.json")
         self.history = self.load_history()
+        self._lock = threading.Lock() # Batch documents may finish concurrently
 
     def load_history(self):
         if os.path.exists(self.history_path):
@@ -35,8 +37,9 @@ class HistoryManager:
             "source_path": source_path,
             "output_path": output_path
         }
-        self.history.insert(0, entry) # Prepend
-        self.save_history()
+        with self._lock:
+            self.history.insert(0, entry) # Prepend
+            self.save_history()
 
     def update_output_path(self, filename, new_path):
         # Update specific item by filename (the most recent one usually)
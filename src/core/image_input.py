@@ -0,0 +1,119 @@
+"""
+Image Input - Scanner image files (multi-page TIFF, JPEG, PNG, BMP) as OCR input.
+
+run_ocr takes these directly instead of a PDF made from them first: every frame goes
+to Tesseract at its own resolution, and the searchable PDF is assembled once at the
+end from the original image data (see ocr_engine._run_ocr_images):
+
+  - single-frame JPEG:  the file's bytes are embedded as they are (DCT pass-through)
+  - 1-bit frames:       CCITT G4 (see sanitize.encode_g4), 1-bit Flate without libtiff
+  - anything else:      lossless PNG (Flate)
+
+Frames are read one at a time (PIL seeks multi-page TIFFs lazily), so memory holds one
+frame, not the document.
+"""
+import io
+import os
+
+IMAGE_EXTENSIONS = (".tif", ".tiff", ".jpg", ".jpeg", ".png", ".bmp")
+DEFAULT_DPI = 300       # for files without (or with an implausible) resolution tag
+MIN_DPI = 50
+
+# Formats Tesseract (Leptonica) reads itself: a single frame is handed over as the file
+TESSERACT_FORMATS = ("TIFF", "JPEG", "PNG", "BMP")
+
+
+def is_image_file(path):
+    return bool(path) and path.lower().endswith(IMAGE_EXTENSIONS)
+
+
+def is_ocr_input(path):
+    """PDFs and supported image files."""
+    return bool(path) and (path.lower().endswith(".pdf") or is_image_file(path))
+
+
+def input_file_types():
+    """filedialog filetypes for OCR input (zenity filters are case-sensitive)."""
+    images = " ".join(f"*{ext} *{ext.upper()}" for ext in IMAGE_EXTENSIONS)
+    return [("PDF & Images", "*.pdf *.PDF " + images), ("PDF files", "*.pdf *.PDF"), ("Images", images)]
+
+
+def _stated_dpi(img):
+    dpi = img.info.get("dpi")
+    try:
+        return float(dpi[0]) if dpi else 0.0
+    except (TypeError, ValueError, IndexError):
+        return 0.0
+
+
+def has_dpi(img):
+    """True if the file states a plausible resolution (Tesseract would guess otherwise)."""
+    return _stated_dpi(img) >= MIN_DPI
+
+
+def frame_dpi(img):
+    """Horizontal resolution of a PIL image from its metadata, or DEFAULT_DPI."""
+    return int(round(_stated_dpi(img))) if has_dpi(img) else DEFAULT_DPI
+
+
+def iter_frames(path):
+    """Yields (index, PIL image) for every frame of an image file, one frame at a time."""
+    from PIL import Image
+    with Image.open(path) as img:
+        for index in range(getattr(img, "n_frames", 1)):
+            img.seek(index)
+            yield index, img
+
+
+def count_frames(path):
+    from PIL import Image
+    with Image.open(path) as img:
+        return getattr(img, "n_frames", 1)
+
+
+def page_size(img, dpi):
+    """Page size in PDF points of a frame shown at `dpi`."""
+    return img.width * 72.0 / dpi, img.height * 72.0 / dpi
+
+
+def ocr_ready(img):
+    """The frame in a mode Tesseract and PNG both handle (1, L, RGB)."""
+    if img.mode in ("1", "L", "RGB"):
+        return img
+    if img.mode in ("I;16", "I;16B", "I;16L", "I"):
+        return img.point(lambda v: v / 256).convert("L")
+    if img.mode == "P" and "transparency" not in img.info:
+        return img.convert("RGB")
+    if img.mode in ("RGBA", "LA", "PA", "P"):
+        # Transparent scans are rare; flatten onto white paper
+        from PIL import Image
+        rgba = img.convert("RGBA")
+        flat = Image.new("RGB", rgba.size, (255, 255, 255))
+        flat.paste(rgba, mask=rgba.getchannel("A"))
+        return flat
+    return img.convert("RGB")
+
+
+def page_stream(img, path, frame_count):
+    """
+    The image stream for the output page of a frame: (kind, data, extra) as taken by
+    sanitize.StreamingWriter.add.
+    """
+    from . import sanitize
+    if frame_count == 1 and img.format == "JPEG" and img.mode in ("L", "RGB", "CMYK"):
+        with open(path, "rb") as f:
+            return "image", f.read(), None
+    img = ocr_ready(img)
+    if img.mode == "1":
+        g4 = sanitize.encode_g4(img)
+        if g4:
+            return "ccitt", g4[0], (img.width, img.height, g4[1])
+    buf = io.BytesIO()
+    img.save(buf, "PNG")
+    return "image", buf.getvalue(), None
+
+
+def output_name(path):
+    """File name of the searchable PDF made from `path` (scan.tif -> scan.pdf)."""
+    name = os.path.basename(path)
+    return os.path.splitext(name)[0] + ".pdf" if is_image_file(name) else name
@@ -7,37 +7,193 @@ import shutil
 import tempfile
 import sys
 import math
+import time
 import logging
-from .constants import APP_NAME, TEMP_DIR
+import threading
+from contextlib import contextmanager
+from .constants import APP_NAME, get_temp_dir
 from . import platform_utils
+from . import sidecar as sidecar_index
+from . import word_boxes
+from . import ocr_worker
+from . import tess_pool
+from . import tessdata_manager
+from . import script_detect
+from . import page_analysis
+from . import preprocess
+from . import image_input
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 
-# Try importing dependencies safely to avoid immediate crashes
-try:
-    import fitz  # PyMuPDF
-except ImportError:
-    fitz = None
-    logging.warning("PyMuPDF (fitz) not found. PDF detection may be limited.")
-
-try:
-    import pikepdf
-except ImportError:
-    pikepdf = None
-    logging.warning("pikepdf not found. PDF operations will be restricted.")
-
-# Store active process for cancellation
-ACTIVE_PROCESS = None
+# PDF libraries are imported on first use (see _load_pdf_libs) to keep app startup fast
+fitz = None  # PyMuPDF
+pikepdf = None
+_PDF_LIBS_LOADED = False
+
+def _load_pdf_libs():
+    """Import PyMuPDF/pikepdf safely on first use to avoid immediate crashes."""
+    global fitz, pikepdf, _PDF_LIBS_LOADED
+    if _PDF_LIBS_LOADED:
+        return
+    _PDF_LIBS_LOADED = True
+
+    try:
+        import fitz as _fitz
+        fitz = _fitz
+    except ImportError:
+        logging.warning("PyMuPDF (fitz) not found. PDF detection may be limited.")
+
+    try:
+        import pikepdf as _pikepdf
+        pikepdf = _pikepdf
+    except ImportError:
+        logging.warning("pikepdf not found. PDF operations will be restricted.")
+
+# Store active processes for cancellation (several when batch documents run concurrently)
+ACTIVE_PROCESSES = set()
+_ACTIVE_LOCK = threading.Lock()
 CANCEL_FLAG = False
 
 class OCRError(Exception):
     """Custom Exception for OCR errors to provide better user feedback."""
     pass
 
-# Initialize environment immediately
-platform_utils.setup_tesseract_environment()
-platform_utils.setup_ghostscript_environment()
+# ocrmypdf exit codes that are not caused by one page's content (bad arguments, missing
+# dependency, file access, encryption, configuration, interrupt): no page bisection
+NON_PAGE_EXIT_CODES = {1, 3, 5, 8, 9, 130}
+MIN_BISECT_FAILURES = 3
+
+# Born-digital fast path: a page "has text" with this many characters, or with no images at all
+MIN_TEXT_CHARS = 50
+EXTRACT_SHARD_PAGES = 64    # pages per extraction thread
+
+# Two-pass mode: fast first read, then re-OCR of low-confidence pages
+FAST_PASS_DPI = 200
+RETRY_DPI = 400
+
+# ==================== RESOURCE GOVERNOR ====================
+
+class ResourceGovernor:
+    """
+    Memory-aware admission control for OCR work.
+
+    Work is described by its estimated peak memory (see estimate_page_bytes). It is
+    admitted only while reserved + requested stays under the budget; otherwise callers
+    wait, or ask plan_dpi()/plan_jobs() for a cheaper configuration up front.
+    The budget is 'memory_budget_mb' from config, or (0 = auto) a share of the
+    currently available memory.
+    """
+
+    AUTO_BUDGET_FRACTION = 0.6
+    DEFAULT_WORKER_BYTES = 250 * 1024 * 1024   # Tesseract LSTM instance + process overhead
+    MIN_DPI = 150
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._reserved = 0
+
+    def budget(self):
+        """Current budget in bytes (re-evaluated on every call in auto mode)."""
+        from .config_manager import state as app_state
+        configured = int(app_state.get("memory_budget_mb", 0) or 0)
+        if configured > 0:
+            return configured * 1024 * 1024
+        from . import gpu_manager
+        available = gpu_manager.get_available_memory()
+        if not available:
+            return 4 * 1024 ** 3
+        # Memory we already reserved is part of what the OS now reports as used
+        return int((available + self._reserved) * self.AUTO_BUDGET_FRACTION)
+
+    def worker_bytes(self):
+        """Fixed per-worker cost, taken from the calibration measurement when available."""
+        from .config_manager import state as app_state
+        measured = ((app_state.get("tuning") or {}).get("measured") or {}).get("worker_mb")
+        return int(measured) * 1024 * 1024 if measured else self.DEFAULT_WORKER_BYTES
+
+    def estimate_page_bytes(self, width_pt, height_pt, dpi, channels=3):
+        """Peak memory of OCRing one page: RGB raster, a processed copy, the 1-bit/grey image and the worker."""
+        pixels = (width_pt / 72.0 * dpi) * (height_pt / 72.0 * dpi)
+        return int(pixels * channels * 2 + pixels + self.worker_bytes())
+
+    def plan_dpi(self, width_pt, height_pt, dpi, workers=1):
+        """Highest DPI <= `dpi` whose estimate fits the per-worker share of the budget."""
+        share = self.budget() / max(1, workers)
+        planned = dpi
+        while planned > self.MIN_DPI and self.estimate_page_bytes(width_pt, height_pt, planned) > share:
+            planned = max(self.MIN_DPI, int(planned * 0.85))
+        return planned
+
+    def plan_jobs(self, width_pt, height_pt, dpi, jobs):
+        """Largest worker count <= `jobs` whose combined estimate fits the budget."""
+        per_job = self.estimate_page_bytes(width_pt, height_pt, dpi)
+        return max(1, min(jobs, int(self.budget() // max(1, per_job))))
+
+    def acquire(self, nbytes, timeout=None):
+        """
+        Blocks until `nbytes` fit in the budget. Work larger than the whole budget is
+        still admitted when nothing else is running, so a single job never deadlocks.
+        """
+        if nbytes <= 0:
+            return True # Nothing to admit (e.g. covered by a caller's reservation)
+        with self._cond:
+            start = time.monotonic()
+            while self._reserved > 0 and self._reserved + nbytes > self.budget():
+                if CANCEL_FLAG:
+                    raise OCRError("Process Cancelled")
+                if timeout is not None and time.monotonic() - start > timeout:
+                    return False
+                self._cond.wait(1.0)
+            self._reserved += nbytes
+            return True
+
+    def release(self, nbytes):
+        with self._cond:
+            self._reserved = max(0, self._reserved - nbytes)
+            self._cond.notify_all()
+
+    @contextmanager
+    def reserve(self, nbytes):
+        self.acquire(nbytes)
+        try:
+            yield
+        finally:
+            self.release(nbytes)
+
+
+governor = ResourceGovernor()
+
+def _page_profile(input_path, custom_dpi=0, sample=10):
+    """(width_pt, height_pt, dpi) of the most demanding page among the first `sample` pages."""
+    profile = (595.0, 842.0, custom_dpi if custom_dpi > 0 else 300)
+    if not fitz:
+        return profile
+    try:
+        with fitz.open(input_path) as doc:
+            worst = 0
+            for i in range(min(len(doc), sample)):
+                page = doc[i]
+                dpi = custom_dpi if custom_dpi > 0 else _get_page_max_dpi(page)
+                cost = page.rect.width * page.rect.height * dpi * dpi
+                if cost > worst:
+                    worst = cost
+                    profile = (page.rect.width, page.rect.height, dpi)
+    except Exception:
+        pass
+    return profile
+
+def _ensure_environment():
+    """Make sure the bundled Tesseract/Ghostscript environment is set (no-op if run.py already did)."""
+    # Cheap stat-based check that the cached data dir (tessdata/temp) has not disappeared
+    platform_utils.revalidate_app_data_dir()
+    platform_utils.setup_tesseract_environment()
+    platform_utils.setup_ghostscript_environment()
+    # Language packs may still be installing from the bundle on first launch
+    from . import tessdata_manager
+    if tessdata_manager.is_sync_running():
+        logging.info("Waiting for tessdata sync to finish...")
+        tessdata_manager.wait_for_sync()
 
 def get_tessdata_dir():
     return platform_utils.get_tessdata_dir()
@@ -56,6 +212,7 @@ def detect_pdf_type(file_path, password=None):
     Check if PDF is text-based (Digital), scanned images, or encrypted.
     Returns: 'text', 'image', 'mixed', 'encrypted', or 'unknown'
     """
+    _load_pdf_libs()
     if not fitz:
         return 'unknown'
 
@@ -99,27 +256,37 @@ def cancel_ocr():
     """
     Terminates the currently running OCR process and its children.
     """
-    global ACTIVE_PROCESS, CANCEL_FLAG
+    global CANCEL_FLAG
     CANCEL_FLAG = True
     
-    if ACTIVE_PROCESS:
+    with _ACTIVE_LOCK:
+        procs = list(ACTIVE_PROCESSES)
+        ACTIVE_PROCESSES.clear()
+    for proc in procs:
         try:
-            platform_utils.kill_process_tree(ACTIVE_PROCESS.pid)
-            ACTIVE_PROCESS = None
+            platform_utils.kill_process_tree(proc.pid)
         except Exception as e:
             logging.error(f"Error killing process: {e}")
 
+def reset_cancel():
+    """
+    Clears a previous cancel. Called once when a single-file run or a batch starts, never
+    per document: batch documents run concurrently and must all keep seeing a cancel.
+    """
+    global CANCEL_FLAG
+    CANCEL_FLAG = False
+
 def _decrypt_pdf(input_path, password):
     """
     Decrypts a PDF using pikepdf and saves it to a temporary file.
     Returns the path to the temporary decrypted file.
     """
+    _load_pdf_libs()
     if not pikepdf:
         raise OCRError("pikepdf module missing. Cannot handle password protected files.")
         
     try:
-        temp_decrypted = os.path.join(TEMP_DIR, f"decrypted_{os.path.basename(input_path)}")
-        os.makedirs(TEMP_DIR, exist_ok=True)
+        temp_decrypted = os.path.join(get_temp_dir(), f"decrypted_{os.path.basename(input_path)}")
         
         with pikepdf.open(input_path, password=password) as pdf:
             pdf.save(temp_decrypted)
@@ -129,39 +296,20 @@ def _decrypt_pdf(input_path, password):
     except Exception as e:
         raise OCRError(f"Failed to decrypt PDF: {str(e)}")
 
-def _merge_pdfs(pdf_list, output_path):
-    """
-    Merges a list of PDFs into one output file using pikepdf.
-    """
-    if not pikepdf:
-        raise OCRError("pikepdf module missing. Cannot merge PDF chunks.")
-        
-    merger = pikepdf.Pdf.new()
-    for pdf_file in pdf_list:
-        try:
-            with pikepdf.open(pdf_file) as src:
-                merger.pages.extend(src.pages)
-        except Exception as e:
-            logging.error(f"Error merging chunk {pdf_file}: {e}")
-            raise OCRError(f"Failed to merge chunk {os.path.basename(pdf_file)}")
-    
-    merger.save(output_path)
-    merger.close()
-
-
-
 def run_ocr(input_path, output_path, password=None, force=False, options=None, progress_callback=None, log_callback=None):
     """
     Executes OCRmyPDF on the input file.
     
     Features:
      - Handles Password Protection (auto-decrypt)
+     - Accepts image files / multi-page TIFFs directly (see image_input.py)
+     - Born-digital PDFs (text on every page) skip OCR unless forced
      - Handles Large Files (Chunking > 50 pages)
      - Error Management (Retry on CPU if GPU fails)
      - Resource Cleanup
     
     Args:
-        input_path (str): Path to source PDF.
+        input_path (str): Path to source PDF or image file.
         output_path (str): Path to save result.
         password (str): PDF password (optional).
         force (bool): Force OCR even if text exists.
@@ -170,15 +318,27 @@ def run_ocr(input_path, output_path, password=None, force=False, options=None, p
         
     Returns:
         str: Path to the sidecar text file generated.
+
+    A cancel (cancel_ocr) stays in effect until reset_cancel() is called.
     """
-    global CANCEL_FLAG
-    CANCEL_FLAG = False
+    if CANCEL_FLAG: raise OCRError("Process Cancelled")
+    _ensure_environment()
+    _load_pdf_libs()
     
     # 1. Setup & Decryption
     working_input = input_path
     decrypted_temp = None
+    indexer = None
     
     try:
+        # Image files (TIFF/JPEG/PNG) are OCRed frame by frame, without a PDF made first
+        if image_input.is_image_file(input_path):
+            indexer = _begin_search_indexing(output_path, input_path)
+            sidecar_file = _run_ocr_images(input_path, output_path, options, progress_callback, log_callback, on_page=indexer)
+            if indexer: indexer.finish()
+            indexer = None
+            return sidecar_file
+
         # Detect if we need decryption
         ftype = detect_pdf_type(input_path, password)
         if password or ftype == 'encrypted':
@@ -188,8 +348,11 @@ def run_ocr(input_path, output_path, password=None, force=False, options=None, p
 
         # 2. Check File Size / Page Count for Chunking
         # Strategy: Limit chunking to ensure stability on low-mem systems
-        CHUNK_THRESHOLD = 50
-        CHUNK_SIZE = 20
+        # (limits come from the hardware calibration, see calibration.py)
+        from . import calibration
+        tuning = calibration.get_tuning()
+        CHUNK_THRESHOLD = tuning["chunk_threshold"]
+        CHUNK_SIZE = tuning["chunk_size"]
         
         total_pages = 0
         try:
@@ -202,187 +365,977 @@ def run_ocr(input_path, output_path, password=None, force=False, options=None, p
         except Exception: 
             total_pages = 0 # Proceed without chunking if detection fails
             
+        # Full-text search: pages are indexed as the sidecar is written
+        indexer = _begin_search_indexing(output_path, input_path)
+
+        # --- BORN-DIGITAL FAST PATH ---
+        if not force and fitz and total_pages:
+            sidecar_file = _run_text_extraction(working_input, output_path, total_pages, options,
+                                                progress_callback, log_callback, on_page=indexer)
+            if sidecar_file:
+                if indexer: indexer.finish()
+                indexer = None
+                return sidecar_file
+
         # --- CHUNKING STRATEGY ---
-        if total_pages > CHUNK_THRESHOLD and pikepdf:
+        if total_pages > CHUNK_THRESHOLD and fitz:
             logging.info(f"Large PDF detected ({total_pages} pages). Engaging chunking mode...")
-            return _run_ocr_chunked(
+            sidecar_file = _run_ocr_chunked(
                 working_input, output_path, total_pages, CHUNK_SIZE, 
-                force, options, progress_callback, log_callback
+                force, options, progress_callback, log_callback, on_page=indexer
             )
+            _write_word_boxes_from_pdf(output_path)
         else:
             # --- CHOOSE STRATEGY ---
             do_rasterize = options.get("rasterize", False) if options else False
             
             if do_rasterize:
                 # --- STANDARD OCR (Destructive/Fixing) ---
-                return _run_ocr_single(working_input, output_path, force, options, progress_callback, log_callback)
+                sidecar_file = _run_ocr_single(working_input, output_path, force, options, progress_callback, log_callback)
+                _index_sidecar(sidecar_file, on_page=indexer)
+                _write_word_boxes_from_pdf(output_path)
             else:
                 # --- LAYER INJECTION (Non-destructive) ---
-                return _run_ocr_layer_injection(working_input, output_path, options, progress_callback, log_callback)
+                sidecar_file = _run_ocr_layer_injection(working_input, output_path, options, progress_callback, log_callback, on_page=indexer)
+
+        if indexer: indexer.finish()
+        indexer = None
+        return sidecar_file
             
     except OCRError as e:
         raise e
     except Exception as e:
         raise OCRError(f"OCR Execution Failed: {str(e)}")
     finally:
+        if indexer:
+            try: indexer.abort()
+            except: pass
         # Cleanup decrypted temp file
         if decrypted_temp and os.path.exists(decrypted_temp):
             try: os.remove(decrypted_temp)
             except: pass
 
-def _run_ocr_chunked(input_path, output_path, total_pages, chunk_size, force, options, progress_callback, log_callback):
+def _has_text_layer(page, text):
+    """
+    A real text layer: enough characters, or some text on a page without images.
+    A page without text counts only if it is empty (outlined text and drawings need OCR).
+    """
+    if text.strip():
+        return len(text.strip()) >= MIN_TEXT_CHARS or not page.get_images()
+    return not page.get_images() and not page.get_drawings()
+
+def _extract_text_pages(input_path, start, end, with_words=False):
+    """
+    (text, width, height, words) of pages start..end-1, from one text extraction per page
+    (own Document, so shards can run on threads). None at the first page without text.
+    """
+    pages = []
+    with fitz.open(input_path) as doc:
+        for i in range(start, end):
+            if CANCEL_FLAG: raise OCRError("Process Cancelled")
+            page = doc[i]
+            textpage = page.get_textpage()
+            text = page.get_text(textpage=textpage)
+            if not _has_text_layer(page, text):
+                return None
+            words = _page_words(page, textpage) if with_words else None
+            pages.append((text, page.rect.width, page.rect.height, words))
+    return pages
+
+def _run_text_extraction(input_path, output_path, total_pages, options, progress_callback, log_callback, on_page=None):
+    """
+    Fast path for born-digital PDFs: when every page already has a text layer, the
+    sidecar is extracted with PyMuPDF (page shards on several threads, one Document
+    each) and the PDF is copied byte for byte; no OCR process is started.
+    Returns the sidecar path, or None if some page needs OCR (nothing is written then).
+    """
+    from .config_manager import state as app_state
+    if not app_state.get("text_fast_path", True):
+        return None
+    with fitz.open(input_path) as doc:
+        # Cheap early exit for scans: the first page decides most documents
+        if not _has_text_layer(doc[0], doc[0].get_text()):
+            return None
+
+    with_words = _word_boxes_enabled()
+    jobs = max(1, int(options.get("max_cpu_threads", 1))) if options else 1
+    shards = [(start, min(total_pages, start + EXTRACT_SHARD_PAGES))
+              for start in range(0, total_pages, EXTRACT_SHARD_PAGES)]
+    if len(shards) > 1 and jobs > 1:
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=min(jobs, len(shards))) as executor:
+            results = list(executor.map(lambda shard: _extract_text_pages(input_path, *shard, with_words), shards))
+    else:
+        results = []
+        for shard in shards:
+            results.append(_extract_text_pages(input_path, *shard, with_words))
+            if results[-1] is None:
+                break
+    if any(pages is None for pages in results):
+        logging.info("Some pages have no text layer: OCR needed.")
+        return None
+
+    if log_callback: log_callback("Born-digital PDF: every page has text. Extracting it without OCR...")
+    shutil.copyfile(input_path, output_path)
+    sidecar_file = output_path.replace(".pdf", ".txt")
+    with sidecar_index.SidecarWriter(sidecar_file, on_page=on_page) as writer:
+        for pages in results:
+            for text, _, _, _ in pages:
+                writer.write_page(text)
+    if with_words:
+        try:
+            with word_boxes.WordBoxWriter(word_boxes.words_path_for_pdf(output_path)) as writer:
+                for pages in results:
+                    for _, width, height, words in pages:
+                        writer.write_page(width, height, words)
+        except Exception as e:
+            logging.warning(f"Failed to write word boxes: {e}")
+    if progress_callback: progress_callback(total_pages)
+    return sidecar_file
+
+def _index_sidecar(sidecar_file, on_page=None):
+    """Builds the per-page offset index for a sidecar written by ocrmypdf."""
+    try:
+        if sidecar_file and os.path.exists(sidecar_file):
+            sidecar_index.build_index(sidecar_file, on_page=on_page)
+    except Exception as e:
+        logging.warning(f"Failed to index sidecar: {e}")
+
+def _word_boxes_enabled():
+    from .config_manager import state as app_state
+    return app_state.get("word_boxes", True)
+
+def _page_words(page, textpage=None):
+    """Words of a page's text layer as WordBoxWriter entries, in displayed coordinates."""
+    lines = {}
+    words = []
+    # page.rotation is a PDF lookup per access: read it once per page
+    rotation_matrix = page.rotation_matrix if page.rotation else None
+    for x0, y0, x1, y1, text, block_no, line_no, _ in page.get_text("words", textpage=textpage):
+        line = lines.setdefault((block_no, line_no), len(lines) + 1)
+        if rotation_matrix:
+            # get_text reports unrotated coordinates; store them as displayed
+            x0, y0, x1, y1 = fitz.Rect(x0, y0, x1, y1) * rotation_matrix
+        words.append((x0, y0, x1, y1, text, None, line))
+    return words
+
+def _write_word_boxes_from_pdf(pdf_path):
+    """
+    Writes `<name>.words` from the text layer ocrmypdf produced. Tesseract's confidences
+    are not kept in the PDF, so these words are stored with CONF_UNKNOWN.
+    """
+    if not fitz or not _word_boxes_enabled():
+        return None
+    words_path = word_boxes.words_path_for_pdf(pdf_path)
+    try:
+        with fitz.open(pdf_path) as doc, word_boxes.WordBoxWriter(words_path) as writer:
+            for page in doc:
+                writer.write_page(page.rect.width, page.rect.height, _page_words(page))
+        return words_path
+    except Exception as e:
+        logging.warning(f"Failed to write word boxes: {e}")
+        return None
+
+def _write_word_boxes_from_hocr(hocr_path, doc, words_path, retry_hocr=None, retried=None, page_map=None,
+                                transforms=None, retry_transforms=None):
+    """
+    Converts Tesseract's hOCR (pixel boxes + x_wconf) into `<name>.words` in PDF points.
+    Pages in `retried` (hOCR page -> position in retry_hocr) come from the re-OCR pass.
+    page_map[i] is the hOCR page of doc page i (None: not OCRed, e.g. blank); default 1:1.
+    transforms / retry_transforms hold the geometry of turned renders (see _render_page_images).
+    """
+    try:
+        hocr_pages = iter(word_boxes.iter_hocr_pages(hocr_path))
+        hocr_pos = -1
+        retry_pages = iter(word_boxes.iter_hocr_pages(retry_hocr)) if retry_hocr else None
+        retry_pos = -1
+        if page_map is None:
+            page_map = range(len(doc))
+        with word_boxes.WordBoxWriter(words_path) as writer:
+            for i, n in enumerate(page_map):
+                rect = doc[i].rect
+                words = []
+                if n is not None:
+                    # Both hOCR files are in ascending page order: advance to this page's entry
+                    while hocr_pos < n:
+                        hocr_pos, img_w, img_h, words = next(hocr_pages, (n, 0, 0, []))
+                    transform = (transforms or {}).get(n)
+                    if retried and n in retried and retry_pages is not None:
+                        while retry_pos < retried[n]:
+                            retry_pos, img_w, img_h, words = next(retry_pages, (retried[n], 0, 0, []))
+                        transform = (retry_transforms or {}).get(retried[n])
+                    if words and transform:
+                        angle, orig_w, orig_h, turned_w, turned_h = transform
+                        # hOCR is in the turned image's pixels; Tesseract may report its own size
+                        sx, sy = turned_w / img_w if img_w else 1.0, turned_h / img_h if img_h else 1.0
+                        words = [(x0 * sx, y0 * sy, x1 * sx, y1 * sy, t, c, l) for x0, y0, x1, y1, t, c, l in words]
+                        words, img_w, img_h = word_boxes.unrotate_words(words, angle, turned_w, turned_h, orig_w, orig_h)
+                    if words:
+                        words = word_boxes.scale_words(words, img_w, img_h, rect.width, rect.height)
+                writer.write_page(rect.width, rect.height, words)
+        return words_path
+    except Exception as e:
+        logging.warning(f"Failed to write word boxes from hOCR: {e}")
+        return None
+
+def _begin_search_indexing(output_path, input_path):
+    """Returns a page hook feeding the full-text index, or None if disabled/unavailable."""
+    from .config_manager import state as app_state
+    if not app_state.get("search_index", True):
+        return None
+    try:
+        from .search_index import search_index
+        return search_index.begin_document(output_path, source_path=input_path,
+                                           filename=os.path.basename(input_path))
+    except Exception as e:
+        logging.warning(f"Search indexing disabled for this run: {e}")
+        return None
+
+def _run_ocr_chunked(input_path, output_path, total_pages, chunk_size, force, options, progress_callback, log_callback, on_page=None):
     """
     Splits PDF into chunks, OCRs them individually, and merges them back.
+    Streaming: each chunk is extracted just before it is processed, its result is
+    appended to the output (incremental save) and both files are deleted right away,
+    so at most one chunk exists on disk/in memory at a time.
+    Blank pages are left out of the chunk sent to OCR and put back (or dropped) afterwards.
+    With deskew/clean/rotate (and no rasterizing) chunks go through layer injection, whose
+    in-process preprocessing replaces ocrmypdf's --deskew/--clean/--rotate-pages. Deskew and
+    clean need NumPy there; without it such chunks keep ocrmypdf's flags.
     """
-    chunks_dir = os.path.join(TEMP_DIR, f"chunks_{os.getpid()}")
-    os.makedirs(chunks_dir, exist_ok=True)
-    
-    chunk_files = []     # (path, start_page)
-    processed_chunks = []
+    # Unique per call: batch documents may be chunked concurrently
+    chunks_dir = tempfile.mkdtemp(prefix="chunks_", dir=get_temp_dir())
+    merged_path = os.path.join(chunks_dir, "merged.pdf")
+    sidecar_file = output_path.replace(".pdf", ".txt")
     
+    src = None
+    merged = None
     try:
-        # 1. Split PDF
-        with pikepdf.open(input_path) as pdf:
-            num_chunks = math.ceil(total_pages / chunk_size)
-            
+        src = fitz.open(input_path)
+        num_chunks = math.ceil(total_pages / chunk_size)
+        remove_blanks = bool(options.get("remove_blank_pages")) if options else False
+        prep = bool(options and (options.get("deskew") or options.get("clean")))
+        inject = bool(options and not options.get("rasterize") and (prep or options.get("rotate"))
+                      and (not prep or preprocess._load_numpy() is not None))
+        
+        with sidecar_index.SidecarWriter(sidecar_file, on_page=on_page) as sidecar:
             for i in range(num_chunks):
+                if CANCEL_FLAG: 
+                    raise OCRError("Process Cancelled")
+
                 start_page = i * chunk_size
                 end_page = min((i + 1) * chunk_size, total_pages)
                 
-                # Extract chunk
-                dst = pikepdf.Pdf.new()
-                for p in range(start_page, end_page):
-                    dst.pages.append(pdf.pages[p])
-                    
-                chunk_name = f"chunk_{i}.pdf"
-                chunk_path = os.path.join(chunks_dir, chunk_name)
-                dst.save(chunk_path)
-                chunk_files.append((chunk_path, start_page)) # Stores path and page offset
-        
-        # 2. Process Each Chunk
-        for i, (c_path, offset) in enumerate(chunk_files):
-            if CANCEL_FLAG: 
-                raise OCRError("Process Cancelled")
+                chunk_pages = range(start_page, end_page)
+                blanks = _find_blank_pages(src, chunk_pages, log_callback)
 
-            c_out = c_path.replace(".pdf", "_ocr.pdf")
-            
-            # Wrapper for progress callback to map chunk page -> global page
-            def chunk_progress_wrapper(p):
-                if progress_callback:
-                    progress_callback(offset + p)
-            
-            logging.info(f"Processing chunk {i+1}/{len(chunk_files)}...")
-            
-            # Recursive call to single runner
-            _run_ocr_single(c_path, c_out, force, options, chunk_progress_wrapper, log_callback)
-            processed_chunks.append(c_out)
-            
-        # 3. Merge Results
-        logging.info("Merging processed chunks...")
-        _merge_pdfs(processed_chunks, output_path)
-        
-        # 4. Generate Sidecar Text (merged from chunks)
-        sidecar_file = output_path.replace(".pdf", ".txt")
-        full_text = ""
-        for p_chunk in processed_chunks:
-            txt_chunk = p_chunk.replace(".pdf", ".txt")
-            if os.path.exists(txt_chunk):
-                with open(txt_chunk, "r", encoding="utf-8", errors="ignore") as f:
-                    full_text += f.read() + "\n"
-        
-        with open(sidecar_file, "w", encoding="utf-8") as f:
-            f.write(full_text)
-            
+                # 1. Extract this chunk only (without its blank pages)
+                c_path = os.path.join(chunks_dir, f"chunk_{i}.pdf")
+                c_out = c_path.replace(".pdf", "_ocr.pdf")
+                txt_chunk = c_out.replace(".pdf", ".txt")
+                with fitz.open() as dst:
+                    dst.insert_pdf(src, from_page=start_page, to_page=end_page - 1)
+                    if blanks:
+                        dst.delete_pages([p - start_page for p in sorted(blanks)])
+                    if len(dst):
+                        dst.save(c_path)
+                
+                # Wrapper for progress callback to map chunk page -> global page
+                def chunk_progress_wrapper(p, offset=start_page):
+                    if progress_callback:
+                        progress_callback(offset + p)
+                
+                logging.info(f"Processing chunk {i+1}/{num_chunks}...")
+                
+                # 2. OCR it
+                if len(blanks) < len(chunk_pages):
+                    try:
+                        if inject:
+                            _run_ocr_layer_injection(c_path, c_out, options, chunk_progress_wrapper, log_callback,
+                                                     check_blanks=False)
+                        else:
+                            _run_ocr_single(c_path, c_out, force, options, chunk_progress_wrapper, log_callback)
+                    finally:
+                        try: os.remove(c_path)
+                        except: pass
+                
+                # 2b. Blank pages go back to their place, untouched
+                if blanks and not remove_blanks:
+                    c_out = _restore_blank_pages(src, c_out, chunk_pages, blanks)
+                
+                # 3. Append to the output and drop the chunk
+                if os.path.exists(c_out):
+                    merged = _append_chunk(merged, merged_path, c_out)
+                    try: os.remove(c_out)
+                    except: pass
+                
+                # 4. Stream the chunk's sidecar text, page by page
+                texts = iter(list(sidecar_index.iter_text_pages(txt_chunk)) if os.path.exists(txt_chunk) else [])
+                for p in chunk_pages:
+                    if p not in blanks:
+                        sidecar.write_page(next(texts, ""))
+                    elif not remove_blanks:
+                        sidecar.write_page("")
+                try: os.remove(txt_chunk)
+                except: pass
+                if progress_callback: progress_callback(end_page)
+
+        if merged is None:
+            # Every page was blank and removal was requested: an empty PDF cannot be written
+            logging.warning("All pages are blank; keeping them in the output.")
+            src.save(output_path, garbage=4, deflate=True)
+            return sidecar_file
+
+        # 5. Final write: garbage=4 de-duplicates objects shared between chunks (fonts, ICC profiles)
+        logging.info("Writing merged document...")
+        merged.save(output_path, garbage=4, deflate=True)
         return sidecar_file
         
+    except OCRError:
+        raise
     except Exception as e:
         raise OCRError(f"Chunking processing failed: {e}")
     finally:
+        if merged: merged.close()
+        if src: src.close()
         # Cleanup chunks directory
         try: shutil.rmtree(chunks_dir)
         except: pass
 
-def _run_ocr_layer_injection(input_path, output_path, options, progress_callback, log_callback):
+def _restore_blank_pages(src, ocr_pdf, pages, blanks):
+    """
+    Rebuilds a chunk in original page order: OCRed pages from ocr_pdf (which lacks the
+    blank ones), blank pages copied unchanged from src. Returns the new chunk path.
+    """
+    out_path = ocr_pdf.replace(".pdf", "_full.pdf")
+    ocr_doc = fitz.open(ocr_pdf) if os.path.exists(ocr_pdf) else None
+    try:
+        with fitz.open() as out:
+            k = 0
+            for p in pages:
+                if p in blanks:
+                    out.insert_pdf(src, from_page=p, to_page=p)
+                elif ocr_doc is not None and k < len(ocr_doc):
+                    out.insert_pdf(ocr_doc, from_page=k, to_page=k)
+                    k += 1
+            out.save(out_path)
+    finally:
+        if ocr_doc is not None:
+            ocr_doc.close()
+    try: os.remove(ocr_pdf)
+    except OSError: pass
+    return out_path
+
+def _append_chunk(merged, merged_path, chunk_pdf):
+    """
+    Appends chunk_pdf to the on-disk merge file and returns the re-opened document.
+    Saving incrementally and re-opening keeps only the newest chunk's objects in memory.
+    """
+    if merged is None:
+        shutil.copyfile(chunk_pdf, merged_path)
+        return fitz.open(merged_path)
+
+    with fitz.open(chunk_pdf) as chunk:
+        merged.insert_pdf(chunk)
+    try:
+        merged.saveIncr()
+    except Exception as e:
+        # Incremental save not possible (e.g. repaired file): fall back to a full rewrite
+        logging.warning(f"Incremental merge failed ({e}). Rewriting merge file.")
+        tmp_path = merged_path + ".tmp"
+        merged.save(tmp_path)
+        merged.close()
+        os.replace(tmp_path, merged_path)
+        return fitz.open(merged_path)
+    merged.close()
+    return fitz.open(merged_path)
+
+def _render_page_images(doc, pages, temp_dir, prefix, dpi_for, clean=False, progress_callback=None, log_callback=None,
+                        prep=None, transforms=None):
+    """
+    Renders `pages` of doc to PNGs for Tesseract and writes their list file.
+    dpi_for(page) gives the wanted DPI; the governor may lower it under memory pressure.
+    clean=True renders grayscale with auto-contrast (for the re-OCR pass).
+    prep ({"deskew", "clean", "rotations": {position: ccw quarter turn}}) runs preprocess.apply
+    on each render; transforms[position] then receives (angle, width, height, new width,
+    new height) for pages that were turned, for mapping the text layer back (_show_layer).
+    Returns (list_path, images, max_page_bytes).
+    """
+    list_path = os.path.join(temp_dir, f"{prefix}_images.txt")
+    images = []
+    max_page_bytes = 0
+    with open(list_path, "w", encoding="utf-8") as f_list:
+        for n, i in enumerate(pages):
+            if CANCEL_FLAG: raise OCRError("Process Cancelled")
+
+            page = doc[i]
+            page_dpi = dpi_for(page)
+            planned_dpi = governor.plan_dpi(page.rect.width, page.rect.height, page_dpi)
+            if planned_dpi < page_dpi:
+                if log_callback: log_callback(f"Page {i+1}: memory pressure, rendering at {planned_dpi} instead of {page_dpi} DPI.")
+                page_dpi = planned_dpi
+            max_page_bytes = max(max_page_bytes, governor.estimate_page_bytes(page.rect.width, page.rect.height, page_dpi))
+
+            img_path = os.path.join(temp_dir, f"{prefix}_{i}.png")
+            rotate = prep["rotations"].get(n, 0) if prep else 0
+            if clean or (prep and (rotate or prep.get("deskew") or prep.get("clean"))):
+                from PIL import Image, ImageOps
+                pix = page.get_pixmap(dpi=page_dpi, colorspace=fitz.csGRAY)
+                img = Image.frombytes("L", (pix.width, pix.height), pix.samples)
+                if prep:
+                    img, angle = preprocess.apply(img, rotate=rotate, deskew=prep.get("deskew"), clean=prep.get("clean"))
+                    if angle and transforms is not None:
+                        transforms[n] = (angle, pix.width, pix.height, img.width, img.height)
+                if clean:
+                    img = ImageOps.autocontrast(img, cutoff=1)
+                img.save(img_path, dpi=(page_dpi, page_dpi))
+            else:
+                pix = page.get_pixmap(dpi=page_dpi)
+                pix.save(img_path)
+            f_list.write(img_path + "\n")
+            images.append(img_path)
+
+            if progress_callback: progress_callback(n + 1)
+    return list_path, images, max_page_bytes
+
+def _tesseract_exe():
+    base_dir = platform_utils.get_base_dir()
+    return os.path.join(base_dir, "tesseract", platform_utils.get_tesseract_dir_name(), platform_utils.get_tesseract_executable_name())
+
+def _run_tesseract_layer(list_path, out_base, lang, max_page_bytes, hocr=False, progress_callback=None, log_callback=None,
+                         images=None, jobs=1, tessdata_prefix=None):
+    """
+    Runs Tesseract over an image list, producing a text-only PDF layer (and hOCR). Returns (pdf, hocr).
+    With jobs > 1 the pages are spread over several workers (see _run_tesseract_parallel).
+    tessdata_prefix selects the model tier (see _tessdata_prefix); None means the standard packs.
+    """
+    if images and len(images) > 1 and jobs > 1:
+        # Every worker holds one page in memory at a time
+        jobs = max(1, min(jobs, len(images), int(governor.budget() // max(1, max_page_bytes))))
+    if images and len(images) > 1 and jobs > 1:
+        return _run_tesseract_parallel(images, out_base, lang, max_page_bytes, jobs, hocr, progress_callback, log_callback,
+                                       tessdata_prefix=tessdata_prefix)
+
+    cmd = [
+        _tesseract_exe(),
+        list_path,
+        out_base,
+        "-l", lang,
+        "-c", "textonly_pdf=1",
+        "pdf"
+    ]
+    # Same pass also emits hOCR: per-word boxes and confidences
+    if hocr:
+        cmd.append("hocr")
+
+    env = os.environ.copy()
+    env["TESSDATA_PREFIX"] = tessdata_prefix or platform_utils.get_app_data_dir()
+
+    # Using a special helper to track progress of a raw tesseract call is hard,
+    # so we just show it's active.
+    # (a single Tesseract process works through the list one page at a time)
+    with governor.reserve(max_page_bytes):
+        _run_cmd(cmd, env, progress_callback=progress_callback, log_callback=log_callback)
+
+    layer_pdf = out_base + ".pdf"
+    if not os.path.exists(layer_pdf):
+        raise OCRError("Tesseract failed to generate OCR layer.")
+    hocr_path = out_base + ".hocr"
+    return layer_pdf, (hocr_path if hocr and os.path.exists(hocr_path) else None)
+
+def _run_tesseract_parallel(images, out_base, lang, max_page_bytes, jobs, hocr, progress_callback=None, log_callback=None,
+                            tessdata_prefix=None):
+    """
+    Spreads pages over `jobs` workers and merges their layers in page order.
+    Preferred: the persistent page pool (tess_pool.py: models loaded once, shared between
+    forked workers). Without a shared libtesseract: one Tesseract CLI per contiguous shard,
+    so models are loaded `jobs` times per document rather than once per page.
+    """
+    parts_dir = tempfile.mkdtemp(prefix="parts_", dir=os.path.dirname(out_base))
+    with governor.reserve(max_page_bytes * jobs):
+        pool = tess_pool.get_pool(lang, jobs, tessdata_prefix)
+        if pool is not None:
+            if log_callback: log_callback(f"Tesseract page pool: {len(images)} pages on {jobs} workers...")
+            with _ACTIVE_LOCK:
+                ACTIVE_PROCESSES.add(pool.proc)
+            try:
+                parts = pool.ocr_pages(images, parts_dir, hocr=hocr, on_page=progress_callback)
+            except RuntimeError as e:
+                if CANCEL_FLAG: raise OCRError("Process Cancelled")
+                raise OCRError(f"Tesseract failed: {e}")
+            finally:
+                with _ACTIVE_LOCK:
+                    ACTIVE_PROCESSES.discard(pool.proc)
+        else:
+            if log_callback: log_callback(f"Tesseract: {len(images)} pages in {jobs} parallel runs...")
+            shard_size = math.ceil(len(images) / jobs)
+            shards = [images[i:i + shard_size] for i in range(0, len(images), shard_size)]
+            parts = [os.path.join(parts_dir, f"part_{n:05d}") for n in range(len(shards))]
+            done = [0] * len(shards)
+            done_lock = threading.Lock()
+
+            def run_shard(n):
+                shard_list = parts[n] + "_images.txt"
+                with open(shard_list, "w", encoding="utf-8") as f:
+                    f.write("\n".join(shards[n]) + "\n")
+
+                def shard_progress(page):
+                    with done_lock:
+                        done[n] = min(page, len(shards[n]))
+                        total = sum(done)
+                    if progress_callback: progress_callback(total)
+
+                _run_tesseract_layer(shard_list, parts[n], lang, 0, hocr=hocr,
+                                     progress_callback=shard_progress, log_callback=log_callback,
+                                     tessdata_prefix=tessdata_prefix)
+
+            from concurrent.futures import ThreadPoolExecutor
+            with ThreadPoolExecutor(max_workers=len(shards)) as executor:
+                for future in [executor.submit(run_shard, n) for n in range(len(shards))]:
+                    future.result()
+
+    return _merge_layer_parts(parts, out_base, hocr)
+
+def _merge_layer_parts(parts, out_base, hocr):
+    """Concatenates per-page/per-shard text layers (and hOCR files) into `<out_base>.pdf/.hocr`."""
+    layer_pdf = out_base + ".pdf"
+    with fitz.open() as merged:
+        for part in parts:
+            with fitz.open(part + ".pdf") as part_doc:
+                merged.insert_pdf(part_doc)
+        merged.save(layer_pdf, garbage=1, deflate=True)
+
+    hocr_path = None
+    if hocr:
+        hocr_path = out_base + ".hocr"
+        with open(hocr_path, "wb") as out:
+            for part in parts:
+                # Multi-document hOCR is fine: iter_hocr_pages counts ocr_page elements
+                if os.path.exists(part + ".hocr"):
+                    with open(part + ".hocr", "rb") as f:
+                        shutil.copyfileobj(f, out)
+    return layer_pdf, hocr_path
+
+def _run_tesseract_grouped(list_path, images, page_langs, out_base, max_page_bytes, hocr=False,
+                           progress_callback=None, log_callback=None, jobs=1, tessdata_prefix=None):
+    """
+    Like _run_tesseract_layer, but each page uses its own `-l` string (see script_detect.py).
+    Pages sharing a language string run together; the layers are put back into page order.
+    """
+    groups = {}  # lang -> positions in `images`
+    for n, page_lang in enumerate(page_langs):
+        groups.setdefault(page_lang, []).append(n)
+    if len(groups) == 1:
+        return _run_tesseract_layer(list_path, out_base, page_langs[0], max_page_bytes, hocr=hocr,
+                                    progress_callback=progress_callback, log_callback=log_callback,
+                                    images=images, jobs=jobs, tessdata_prefix=tessdata_prefix)
+
+    results = []
+    sources = [None] * len(images)  # position -> (group, page in group layer)
+    done = 0
+    for g, (group_lang, positions) in enumerate(groups.items()):
+        if CANCEL_FLAG: raise OCRError("Process Cancelled")
+        if log_callback: log_callback(f"Tesseract [{group_lang}]: {len(positions)} page(s)...")
+        group_base = f"{out_base}_g{g}"
+        group_images = [images[n] for n in positions]
+        with open(group_base + "_images.txt", "w", encoding="utf-8") as f:
+            f.write("\n".join(group_images) + "\n")
+
+        group_progress = None
+        if progress_callback:
+            group_progress = lambda page, offset=done: progress_callback(offset + page)
+        results.append(_run_tesseract_layer(group_base + "_images.txt", group_base, group_lang, max_page_bytes,
+                                            hocr=hocr, progress_callback=group_progress, log_callback=log_callback,
+                                            images=group_images, jobs=jobs, tessdata_prefix=tessdata_prefix))
+        for j, n in enumerate(positions):
+            sources[n] = (g, j)
+        done += len(positions)
+
+    return _interleave_layers(results, sources, out_base, hocr)
+
+_HOCR_PAGE_RE = re.compile(rb"<div class=['\"]ocr_page['\"]")
+
+def _split_hocr_pages(hocr_path):
+    """Raw ocr_page elements of an hOCR file, in order."""
+    with open(hocr_path, "rb") as f:
+        data = f.read()
+    starts = [m.start() for m in _HOCR_PAGE_RE.finditer(data)]
+    end = data.rfind(b"</body>")
+    if end < 0: end = len(data)
+    return [data[a:b] for a, b in zip(starts, starts[1:] + [end])]
+
+def _interleave_layers(results, sources, out_base, hocr):
+    """Builds `<out_base>.pdf/.hocr` from per-group layers; sources[i] = (group, page) of output page i."""
+    layer_pdf = out_base + ".pdf"
+    group_docs = [fitz.open(pdf) for pdf, _ in results]
+    try:
+        with fitz.open() as merged:
+            for g, j in sources:
+                merged.insert_pdf(group_docs[g], from_page=j, to_page=j)
+            merged.save(layer_pdf, garbage=1, deflate=True)
+    finally:
+        for group_doc in group_docs:
+            group_doc.close()
+
+    hocr_path = None
+    if hocr:
+        hocr_path = out_base + ".hocr"
+        group_pages = [_split_hocr_pages(h) if h else [] for _, h in results]
+        with open(hocr_path, "wb") as out:
+            out.write(b"<html><body>\n")
+            for g, j in sources:
+                if j < len(group_pages[g]):
+                    out.write(group_pages[g][j])
+                else:
+                    # Keep page numbering aligned for iter_hocr_pages
+                    out.write(b"<div class='ocr_page' title='bbox 0 0 0 0'></div>\n")
+            out.write(b"</body></html>\n")
+    return layer_pdf, hocr_path
+
+def _osd_available():
+    if not os.path.exists(os.path.join(get_tessdata_dir(), "osd.traineddata")):
+        logging.info("OSD skipped: osd.traineddata not installed.")
+        return False
+    return True
+
+def _run_osd(doc, pages, temp_dir, jobs=1):
+    """
+    Low-resolution Tesseract OSD pass (--psm 0) over `pages` of doc.
+    Returns {position in pages: OSD block} (see script_detect.split_osd); {} without the osd model.
+    """
+    if not _osd_available():
+        return {}
+    pages = list(pages)
+    if not pages:
+        return {}
+    _, images, _ = _render_page_images(doc, pages, temp_dir, "osd",
+                                       lambda page: script_detect.OSD_DPI, clean=True)
+    try:
+        return _osd_images(images, temp_dir, jobs)
+    finally:
+        for path in images:
+            try: os.remove(path)
+            except OSError: pass
+
+def _osd_images(images, temp_dir, jobs=1):
+    """Tesseract OSD over image files: {position in images: OSD block}."""
+    env = os.environ.copy()
+    env["TESSDATA_PREFIX"] = platform_utils.get_app_data_dir()
+    env["OMP_THREAD_LIMIT"] = "1"
+
+    shard_size = math.ceil(len(images) / max(1, min(jobs, len(images))))
+    offsets = list(range(0, len(images), shard_size))
+    blocks = {}
+
+    def run_shard(offset):
+        shard_base = os.path.join(temp_dir, f"osd_{offset:05d}")
+        with open(shard_base + "_images.txt", "w", encoding="utf-8") as f:
+            f.write("\n".join(images[offset:offset + shard_size]) + "\n")
+        try:
+            _run_cmd([_tesseract_exe(), shard_base + "_images.txt", shard_base, "--psm", "0", "-l", "osd"], env)
+        except Exception as e:
+            # Pages without enough text make OSD complain; whatever was detected still counts
+            logging.debug(f"OSD shard at page {offset + 1}: {e}")
+        if not os.path.exists(shard_base + ".osd"):
+            return {}
+        with open(shard_base + ".osd", encoding="utf-8", errors="replace") as f:
+            return {offset + i: block for i, block in script_detect.split_osd(f.read()).items()}
+
+    from concurrent.futures import ThreadPoolExecutor
+    with ThreadPoolExecutor(max_workers=len(offsets)) as executor:
+        for found in executor.map(run_shard, offsets):
+            blocks.update(found)
+    if CANCEL_FLAG: raise OCRError("Process Cancelled")
+    return blocks
+
+def _wants_script_detection(lang):
+    from .config_manager import state as app_state
+    return app_state.get("script_detection", True) and script_detect.is_worthwhile(lang)
+
+def _plan_page_languages(lang, osd_blocks, count, log_callback=None):
+    """The `-l` string for each of `count` OCRed pages from the OSD pass (see script_detect.py)."""
+    detections = {}
+    for n, block in osd_blocks.items():
+        found = script_detect.osd_script(block)
+        if found:
+            detections[n] = found
+    plan = script_detect.plan_page_languages(lang, detections, count)
+    narrowed = sum(1 for page_lang in plan if page_lang != lang)
+    logging.info(f"Script detection: {len(detections)}/{count} page(s) detected, {narrowed} OCRed with fewer languages.")
+    if log_callback and narrowed:
+        log_callback(f"{narrowed} of {count} page(s) need only some of the selected languages.")
+    return plan
+
+def _full_selection_pages(lang, page_langs, hocr_path, layer_doc):
+    """Layer pages OCRed with fewer languages that must be read again with all of `lang` (see script_detect.py)."""
+    from .config_manager import state as app_state
+    if not hocr_path or all(page_lang == lang for page_lang in page_langs):
+        return []
+    threshold = app_state.get("two_pass_threshold", 70)
+    confidences = _page_confidences(hocr_path)
+    return [n for n, page_lang in enumerate(page_langs[:len(layer_doc)])
+            if script_detect.needs_full_selection(lang, page_lang, confidences[n] if n < len(confidences) else None,
+                                                  layer_doc[n].get_text(), threshold)]
+
+def _rerun_full_selection(widen, images, lang, temp_dir, max_page_bytes, transforms, jobs=1, tessdata_prefix=None,
+                          log_callback=None):
+    """
+    OCRs the already prepared images of layer pages `widen` again with all of `lang`.
+    Returns (retry_doc, retry_hocr, retried, retry_transforms) as used by the two-pass retry.
+    """
+    retry_images = [images[n] for n in widen]
+    retry_list = os.path.join(temp_dir, "full_images.txt")
+    with open(retry_list, "w", encoding="utf-8") as f:
+        f.write("\n".join(retry_images) + "\n")
+    retry_pdf, retry_hocr = _run_tesseract_grouped(
+        retry_list, retry_images, [lang] * len(widen), os.path.join(temp_dir, "full_layer"), max_page_bytes,
+        hocr=True, log_callback=log_callback, jobs=jobs, tessdata_prefix=tessdata_prefix)
+    retry_doc = fitz.open(retry_pdf)
+    retried = {n: r for r, n in enumerate(widen) if r < len(retry_doc)}
+    retry_transforms = {r: transforms[n] for r, n in enumerate(widen) if n in transforms}
+    return retry_doc, retry_hocr, retried, retry_transforms
+
+def _plan_rotations(osd_blocks, log_callback=None):
+    """{position: counter-clockwise quarter turn} for pages OSD found sideways or upside down."""
+    rotations = {}
+    for n, block in osd_blocks.items():
+        found = script_detect.osd_orientation(block)
+        if found and found[0] and found[1] >= preprocess.MIN_ORIENTATION_CONFIDENCE:
+            rotations[n] = found[0]
+    if rotations and log_callback:
+        log_callback(f"{len(rotations)} page(s) will be turned upright for OCR.")
+    return rotations
+
+def _find_blank_pages(doc, pages=None, log_callback=None):
+    """
+    Indices of blank/near-blank pages (see page_analysis.py), judged on a grayscale
+    render at page_analysis.ANALYSIS_DPI. Pages that already carry text are never blank. Empty when disabled or without NumPy.
+    """
+    from .config_manager import state as app_state
+    if not app_state.get("blank_detection", True):
+        return set()
+    if page_analysis._load_numpy() is None:
+        logging.info("Blank page detection skipped: NumPy is not installed.")
+        return set()
+
+    blanks = set()
+    for i in (range(len(doc)) if pages is None else pages):
+        if CANCEL_FLAG: raise OCRError("Process Cancelled")
+        page = doc[i]
+        try:
+            if page.get_text("text").strip():
+                continue
+            pix = page.get_pixmap(dpi=page_analysis.ANALYSIS_DPI, colorspace=fitz.csGRAY, alpha=False)
+            stats = page_analysis.analyze(pix.samples, pix.width, pix.height, pix.stride)
+        except Exception as e:
+            logging.debug(f"Blank check failed on page {i + 1}: {e}")
+            continue
+        if page_analysis.is_blank(stats):
+            blanks.add(i)
+    if blanks:
+        logging.info(f"Blank pages: {sorted(p + 1 for p in blanks)}")
+        if log_callback: log_callback(f"{len(blanks)} blank page(s) will not be OCRed.")
+    return blanks
+
+def _is_blank_frame(img, dpi):
+    """_find_blank_pages for one image frame (see image_input.py), judged on a copy no finer than ANALYSIS_DPI."""
+    gray = image_input.ocr_ready(img).convert("L")
+    if dpi > page_analysis.ANALYSIS_DPI:
+        scale = page_analysis.ANALYSIS_DPI / float(dpi)
+        gray = gray.resize((max(1, int(gray.width * scale)), max(1, int(gray.height * scale))))
+        dpi = page_analysis.ANALYSIS_DPI
+    return page_analysis.is_blank(page_analysis.analyze(gray.tobytes(), gray.width, gray.height, dpi=dpi))
+
+def _tessdata_prefix(options, lang, log_callback=None):
+    """TESSDATA_PREFIX for the job's model tier (options["model_tier"]: standard/fast/best)."""
+    tier = options.get("model_tier", "standard") if options else "standard"
+    prefix, used = tessdata_manager.resolve_tier(tier, lang)
+    if used != tier and log_callback:
+        log_callback(f"'{tier}' models are not installed for {lang}; using the standard models.")
+    return prefix
+
+def _show_layer(page, layer_doc, n, transform=None):
+    """
+    Overlays text layer page n onto page. For a render that was turned `angle` degrees
+    (transform from _render_page_images) the layer is rotated back about the page centre;
+    the target rect is the rotated layer's bounding box at the page's scale, so
+    show_pdf_page's fit-to-rect leaves the scale exact.
+    """
+    if not transform:
+        page.show_pdf_page(page.rect, layer_doc, n, overlay=True)
+        return
+    angle, orig_w, orig_h, turned_w, turned_h = transform
+    src = layer_doc[n].rect
+    rad = math.radians(angle)
+    cos, sin = abs(math.cos(rad)), abs(math.sin(rad))
+    box_w = src.width * cos + src.height * sin
+    box_h = src.width * sin + src.height * cos
+    scale = page.rect.width / (orig_w * src.width / turned_w)  # page points per layer unit
+    c = (page.rect.tl + page.rect.br) / 2
+    target = fitz.Rect(c.x - box_w * scale / 2, c.y - box_h * scale / 2,
+                       c.x + box_w * scale / 2, c.y + box_h * scale / 2)
+    page.show_pdf_page(target, layer_doc, n, overlay=True, rotate=-angle)
+
+def _page_confidences(hocr_path):
+    """Mean word confidence (0-100) of every hOCR page; None for pages without words."""
+    means = []
+    for _, _, _, words in word_boxes.iter_hocr_pages(hocr_path):
+        confs = [w[5] for w in words if w[5] is not None]
+        means.append(sum(confs) / len(confs) if confs else None)
+    return means
+
+def _run_ocr_layer_injection(input_path, output_path, options, progress_callback, log_callback, on_page=None,
+                             check_blanks=True):
     """
     Non-destructive OCR: Performs OCR on page images and injects the text layer 
     back into the original PDF pages, preserving all original vectors and annotations.
+
+    Two-pass mode (options["two_pass"]): pages are first read at FAST_PASS_DPI without
+    preprocessing; pages whose mean word confidence falls below the threshold are
+    rendered again at RETRY_DPI, cleaned, re-OCRed, and use that text layer instead.
+
+    Pages OCRed with only some of the languages (script detection) are read again with
+    all of them when script_detect.needs_full_selection() says so: in the two-pass retry,
+    or from the same images otherwise.
+
+    Blank pages (see _find_blank_pages) are not OCRed and pass through untouched, or are
+    dropped from the output with options["remove_blank_pages"].
+
+    The deskew/clean/rotate options condition only the rendered images (preprocess.py);
+    turned pages get their text layer rotated back onto the original page (_show_layer).
     """
+    from .config_manager import state as app_state
     temp_dir = tempfile.mkdtemp(prefix="biplob_injection_")
     doc = None
     layer_doc = None
+    retry_doc = None
     try:
         if log_callback: log_callback("Strategizing: Using Non-Destructive Layer Injection...")
         
         doc = fitz.open(input_path)
         total_pages = len(doc)
+        lang = options.get("language", "eng")
+        custom_dpi = options.get("dpi", 0) if options else 0
+        two_pass = bool(options.get("two_pass")) if options else False
+        with_words = _word_boxes_enabled()
+
+        # 0. Blank pages skip OCR; the layer only holds the other pages (in order)
+        blanks = _find_blank_pages(doc, log_callback=log_callback) if check_blanks else set()
+        ocr_pages = [i for i in range(total_pages) if i not in blanks]
+        remove_blanks = bool(options.get("remove_blank_pages")) if options else False
 
-        
         # 1. Prepare Images for Tesseract
-        custom_dpi = options.get("dpi", 0) if options else 0
-        img_list_path = os.path.join(temp_dir, "images.txt")
-        with open(img_list_path, "w", encoding="utf-8") as f_list:
-            for i in range(total_pages):
-                if CANCEL_FLAG: raise OCRError("Process Cancelled")
-                
-                page = doc[i]
-                page_dpi = custom_dpi if custom_dpi > 0 else _get_page_max_dpi(page)
-                
-                img_path = os.path.join(temp_dir, f"page_{i}.png")
-                pix = page.get_pixmap(dpi=page_dpi)
-                pix.save(img_path)
-                f_list.write(img_path + "\n")
-                
-                if progress_callback: progress_callback(i + 1)
+        if two_pass:
+            if log_callback: log_callback(f"Two-pass mode: fast pass at {FAST_PASS_DPI} DPI...")
+            dpi_for = lambda page: min(FAST_PASS_DPI, _get_page_max_dpi(page))
+        else:
+            dpi_for = lambda page: custom_dpi if custom_dpi > 0 else _get_page_max_dpi(page)
+        hocr_path = None
+        transforms = {}     # layer page -> geometry of a turned render (see _render_page_images)
+        if ocr_pages:
+            # 1a. One OSD pass serves both script detection and page orientation
+            jobs = max(1, int(options.get("max_cpu_threads", 1))) if options else 1
+            detect_scripts = _wants_script_detection(lang)
+            rotate = bool(options.get("rotate")) if options else False
+            osd_blocks = {}
+            if detect_scripts or rotate:
+                if log_callback: log_callback("Detecting page orientation and script...")
+                osd_blocks = _run_osd(doc, ocr_pages, temp_dir, jobs)
+            page_langs = (_plan_page_languages(lang, osd_blocks, len(ocr_pages), log_callback)
+                          if detect_scripts and osd_blocks else [lang] * len(ocr_pages))
+            prep = None
+            if options and (rotate or options.get("deskew") or options.get("clean")):
+                prep = {"deskew": bool(options.get("deskew")), "clean": bool(options.get("clean")),
+                        "rotations": _plan_rotations(osd_blocks, log_callback) if rotate else {}}
+
+            img_list_path, images, max_page_bytes = _render_page_images(
+                doc, ocr_pages, temp_dir, "page", dpi_for,
+                progress_callback=progress_callback, log_callback=log_callback,
+                prep=prep, transforms=transforms)
+
+            # 2. Run Tesseract to get transparent PDF text layer
+            prefix = _tessdata_prefix(options, lang, log_callback)
+            if log_callback: log_callback("Tesseract is analyzing pages...")
+            narrowed = any(page_lang != lang for page_lang in page_langs)
+            ocr_layer_pdf, hocr_path = _run_tesseract_grouped(
+                img_list_path, images, page_langs, os.path.join(temp_dir, "ocr_layer"), max_page_bytes,
+                hocr=with_words or two_pass or narrowed, progress_callback=progress_callback,
+                log_callback=log_callback, jobs=jobs, tessdata_prefix=prefix)
+            layer_doc = fitz.open(ocr_layer_pdf)
+
+        # 2b. Pages read with fewer languages that need all of them
+        widen = _full_selection_pages(lang, page_langs, hocr_path, layer_doc) if layer_doc else []
+        if widen:
+            if log_callback: log_callback(f"Re-reading {len(widen)} page(s) with all selected languages...")
+            for n in widen:
+                page_langs[n] = lang
+
+        # 2c. Second pass for low-confidence pages only
+        retried = {}        # layer page -> page in retry_doc
+        retry_hocr = None
+        retry_transforms = {}
+        if two_pass and hocr_path:
+            threshold = app_state.get("two_pass_threshold", 70)
+            confidences = _page_confidences(hocr_path)
+            retry_pages = sorted(set(widen) | {n for n, c in enumerate(confidences)
+                                               if c is not None and c < threshold and n < len(ocr_pages)})
+            if retry_pages:
+                if log_callback: log_callback(f"Re-reading {len(retry_pages)} low-confidence page(s) at higher quality...")
+                retry_dpi = max(RETRY_DPI, custom_dpi)
+                retry_prep = None
+                if prep:
+                    retry_prep = dict(prep, rotations={r: prep["rotations"][n] for r, n in enumerate(retry_pages)
+                                                       if n in prep["rotations"]})
+                retry_list, retry_images, retry_bytes = _render_page_images(
+                    doc, [ocr_pages[n] for n in retry_pages], temp_dir, "retry", lambda page: retry_dpi,
+                    clean=True, log_callback=log_callback, prep=retry_prep, transforms=retry_transforms)
+                retry_pdf, retry_hocr = _run_tesseract_grouped(
+                    retry_list, retry_images, [page_langs[n] for n in retry_pages],
+                    os.path.join(temp_dir, "retry_layer"), retry_bytes,
+                    hocr=True, log_callback=log_callback, jobs=jobs, tessdata_prefix=prefix)
+                retry_doc = fitz.open(retry_pdf)
+                second = _page_confidences(retry_hocr) if retry_hocr else []
+                for r, n in enumerate(retry_pages):
+                    # Keep whichever pass read the page better (a page read with too few languages is replaced)
+                    if r < len(retry_doc) and (n in widen or r >= len(second) or second[r] is None
+                                               or second[r] >= confidences[n]):
+                        retried[n] = r
+                logging.info(f"Two-pass: {len(retried)}/{len(retry_pages)} re-OCRed page(s) improved.")
+        elif widen:
+            retry_doc, retry_hocr, retried, retry_transforms = _rerun_full_selection(
+                widen, images, lang, temp_dir, max_page_bytes, transforms, jobs=jobs, tessdata_prefix=prefix,
+                log_callback=log_callback)
 
-        # 2. Run Tesseract to get transparent PDF text layer
-        if log_callback: log_callback("Tesseract is analyzing pages...")
-        tess_out_base = os.path.join(temp_dir, "ocr_layer")
-        
-        # Find Tesseract
-        base_dir = platform_utils.get_base_dir()
-        tess_exe = os.path.join(base_dir, "tesseract", platform_utils.get_tesseract_dir_name(), platform_utils.get_tesseract_executable_name())
-        
-        lang = options.get("language", "eng")
-        cmd = [
-            tess_exe,
-            img_list_path,
-            tess_out_base,
-            "-l", lang,
-            "-c", "textonly_pdf=1",
-            "pdf"
-        ]
-        
-        env = os.environ.copy()
-        env["TESSDATA_PREFIX"] = platform_utils.get_app_data_dir()
-        
-        # Using a special helper to track progress of a raw tesseract call is hard, 
-        # so we just show it's active.
-        _run_cmd(cmd, env, progress_callback=progress_callback, log_callback=log_callback)
-        
-        ocr_layer_pdf = tess_out_base + ".pdf"
-        if not os.path.exists(ocr_layer_pdf):
-            raise OCRError("Tesseract failed to generate OCR layer.")
-            
         # 3. Inject Layer into Original PDF
         if log_callback: log_callback("Grafting OCR layer onto original PDF...")
-        layer_doc = fitz.open(ocr_layer_pdf)
         
         # Check if page counts match
-        if len(layer_doc) != total_pages:
-            logging.warning(f"Page count mismatch: Original {total_pages}, OCR {len(layer_doc)}")
+        layer_count = len(layer_doc) if layer_doc else 0
+        if layer_count != len(ocr_pages):
+            logging.warning(f"Page count mismatch: Original {len(ocr_pages)}, OCR {layer_count}")
             
-        for i in range(min(total_pages, len(layer_doc))):
+        for n, i in enumerate(ocr_pages[:layer_count]):
             if CANCEL_FLAG: raise OCRError("Process Cancelled")
             
             orig_page = doc[i]
-            layer_page = layer_doc[i]
             
             # Use show_pdf_page to overlay the transparent text layer
             # Overlay=True puts it on top (standard for searching)
-            orig_page.show_pdf_page(orig_page.rect, layer_doc, i, overlay=True)
+            if n in retried:
+                _show_layer(orig_page, retry_doc, retried[n], retry_transforms.get(retried[n]))
+            else:
+                _show_layer(orig_page, layer_doc, n, transforms.get(n))
             
             if progress_callback: progress_callback(i + 1)
 
+        # Layer page of every output page (None: blank page kept without OCR)
+        layer_of = {i: n for n, i in enumerate(ocr_pages[:layer_count])}
+        if remove_blanks and blanks and ocr_pages:
+            if log_callback: log_callback(f"Removing {len(blanks)} blank page(s)...")
+            doc.delete_pages(sorted(blanks))
+            page_map = [layer_of.get(i) for i in ocr_pages]
+        else:
+            page_map = [layer_of.get(i) for i in range(total_pages)]
+
         # 4. Save Final PDF
         if log_callback: log_callback("Finalizing document...")
         try:
@@ -398,15 +1351,22 @@ def _run_ocr_layer_injection(input_path, output_path, options, progress_callback
             else:
                 raise e
         
-        # 5. Generate Sidecar
+        # 5. Generate Sidecar (streamed page by page, with offset index)
         sidecar_file = output_path.replace(".pdf", ".txt")
-        full_text = ""
-        for i in range(len(layer_doc)):
-            full_text += layer_doc[i].get_text() + "\n"
-        with open(sidecar_file, "w", encoding="utf-8") as f:
-            f.write(full_text)
-            
+        with sidecar_index.SidecarWriter(sidecar_file, on_page=on_page) as writer:
+            for n in page_map:
+                if n is None:
+                    writer.write_page("")
+                elif n in retried:
+                    writer.write_page(retry_doc[retried[n]].get_text())
+                else:
+                    writer.write_page(layer_doc[n].get_text())
 
+        # 6. Word boxes (from hOCR, mapped onto the original page geometry)
+        if with_words and hocr_path:
+            _write_word_boxes_from_hocr(hocr_path, doc, word_boxes.words_path_for_pdf(output_path),
+                                        retry_hocr=retry_hocr, retried=retried, page_map=page_map,
+                                        transforms=transforms, retry_transforms=retry_transforms)
         
         if progress_callback: progress_callback(total_pages)
         return sidecar_file
@@ -418,17 +1378,172 @@ def _run_ocr_layer_injection(input_path, output_path, options, progress_callback
     finally:
         if doc: doc.close()
         if layer_doc: layer_doc.close()
+        if retry_doc: retry_doc.close()
         try: shutil.rmtree(temp_dir)
         except: pass
 
+def _run_ocr_images(input_path, output_path, options, progress_callback, log_callback, on_page=None):
+    """
+    OCR of an image file (multi-page TIFF, JPEG, PNG, BMP; see image_input.py) without
+    converting it to PDF first. Each frame goes to Tesseract at its own resolution (a
+    single frame Tesseract can read is passed as the file itself); the searchable PDF is
+    assembled once at the end from the original image data plus the text layers.
+
+    Blank frames, script detection (with its full-selection re-read), model tiers and the
+    deskew/clean/rotate options work as in _run_ocr_layer_injection; two-pass re-reading
+    does not apply to image input.
+    """
+    from .config_manager import state as app_state
+    from . import sanitize
+    temp_dir = tempfile.mkdtemp(prefix="biplob_images_")
+    layer_doc = None
+    retry_doc = None
+    try:
+        options = options or {}
+        lang = options.get("language", "eng")
+        jobs = max(1, int(options.get("max_cpu_threads", 1)))
+        with_words = _word_boxes_enabled()
+        rotate = bool(options.get("rotate"))
+        deskew, clean = bool(options.get("deskew")), bool(options.get("clean"))
+        check_blanks = app_state.get("blank_detection", True) and page_analysis._load_numpy() is not None
+        remove_blanks = bool(options.get("remove_blank_pages"))
+
+        frame_count = image_input.count_frames(input_path)
+        if log_callback: log_callback(f"Image input: {frame_count} frame(s), OCRed at their native resolution...")
+
+        # 1. Frames for Tesseract, one in memory at a time
+        blanks = set()
+        ocr_frames = []     # frame index of each layer page
+        images = []
+        max_page_bytes = 0
+        for index, img in image_input.iter_frames(input_path):
+            if CANCEL_FLAG: raise OCRError("Process Cancelled")
+            dpi = image_input.frame_dpi(img)
+            if check_blanks and _is_blank_frame(img, dpi):
+                blanks.add(index)
+                continue
+            width_pt, height_pt = image_input.page_size(img, dpi)
+            max_page_bytes = max(max_page_bytes, governor.estimate_page_bytes(width_pt, height_pt, dpi))
+            if frame_count == 1 and img.format in image_input.TESSERACT_FORMATS and image_input.has_dpi(img):
+                img_path = input_path
+            else:
+                img_path = os.path.join(temp_dir, f"page_{index}.png")
+                image_input.ocr_ready(img).save(img_path, dpi=(dpi, dpi))
+            ocr_frames.append(index)
+            images.append(img_path)
+        if blanks:
+            logging.info(f"Blank frames: {sorted(i + 1 for i in blanks)}")
+            if log_callback: log_callback(f"{len(blanks)} blank page(s) will not be OCRed.")
+
+        hocr_path = None
+        transforms = {}     # layer page -> geometry of a turned image (see _render_page_images)
+        retried = {}        # layer page -> page in retry_doc (read again with all languages)
+        retry_hocr = None
+        retry_transforms = {}
+        if images:
+            # 2. One OSD pass serves both script detection and page orientation
+            detect_scripts = _wants_script_detection(lang)
+            osd_blocks = {}
+            if (detect_scripts or rotate) and _osd_available():
+                if log_callback: log_callback("Detecting page orientation and script...")
+                osd_blocks = _osd_images(images, temp_dir, jobs)
+            page_langs = (_plan_page_languages(lang, osd_blocks, len(images), log_callback)
+                          if detect_scripts and osd_blocks else [lang] * len(images))
+
+            rotations = _plan_rotations(osd_blocks, log_callback) if rotate else {}
+            if deskew or clean or rotations:
+                from PIL import Image
+                for n, img_path in enumerate(images):
+                    if CANCEL_FLAG: raise OCRError("Process Cancelled")
+                    if not (deskew or clean or rotations.get(n)):
+                        continue
+                    with Image.open(img_path) as src:
+                        dpi = image_input.frame_dpi(src)
+                        gray = image_input.ocr_ready(src).convert("L")
+                    img, angle = preprocess.apply(gray, rotate=rotations.get(n, 0), deskew=deskew, clean=clean)
+                    if angle:
+                        transforms[n] = (angle, gray.width, gray.height, img.width, img.height)
+                    images[n] = os.path.join(temp_dir, f"prep_{n}.png")
+                    img.save(images[n], dpi=(dpi, dpi))
+
+            # 3. Text layers
+            list_path = os.path.join(temp_dir, "page_images.txt")
+            with open(list_path, "w", encoding="utf-8") as f:
+                f.write("\n".join(images) + "\n")
+            prefix = _tessdata_prefix(options, lang, log_callback)
+            if log_callback: log_callback("Tesseract is analyzing pages...")
+            narrowed = any(page_lang != lang for page_lang in page_langs)
+            layer_pdf, hocr_path = _run_tesseract_grouped(
+                list_path, images, page_langs, os.path.join(temp_dir, "ocr_layer"), max_page_bytes,
+                hocr=with_words or narrowed, progress_callback=progress_callback, log_callback=log_callback,
+                jobs=jobs, tessdata_prefix=prefix)
+            layer_doc = fitz.open(layer_pdf)
+
+            widen = _full_selection_pages(lang, page_langs, hocr_path, layer_doc)
+            if widen:
+                if log_callback: log_callback(f"Re-reading {len(widen)} page(s) with all selected languages...")
+                retry_doc, retry_hocr, retried, retry_transforms = _rerun_full_selection(
+                    widen, images, lang, temp_dir, max_page_bytes, transforms, jobs=jobs, tessdata_prefix=prefix,
+                    log_callback=log_callback)
+
+        # 4. Assemble the searchable PDF, streamed to disk frame by frame
+        if log_callback: log_callback("Assembling searchable PDF...")
+        layer_of = {index: n for n, index in enumerate(ocr_frames) if layer_doc and n < len(layer_doc)}
+        page_map = []       # layer page of every output page (None: not OCRed)
+        writer = sanitize.StreamingWriter(output_path)
+        try:
+            for index, img in image_input.iter_frames(input_path):
+                if CANCEL_FLAG: raise OCRError("Process Cancelled")
+                if remove_blanks and index in blanks and ocr_frames:
+                    continue
+                n = layer_of.get(index)
+                overlay = None
+                if n in retried:
+                    overlay = lambda page, r=retried[n]: _show_layer(page, retry_doc, r, retry_transforms.get(r))
+                elif n is not None:
+                    overlay = lambda page, n=n: _show_layer(page, layer_doc, n, transforms.get(n))
+                width_pt, height_pt = image_input.page_size(img, image_input.frame_dpi(img))
+                writer.add(width_pt, height_pt, *image_input.page_stream(img, input_path, frame_count),
+                           overlay=overlay)
+                page_map.append(n)
+                if progress_callback: progress_callback(index + 1)
+        finally:
+            writer.close()
+        if remove_blanks and blanks and ocr_frames and log_callback:
+            log_callback(f"Removed {len(blanks)} blank page(s).")
+
+        # 5. Sidecar (streamed page by page, with offset index) and word boxes
+        sidecar_file = output_path.replace(".pdf", ".txt")
+        with sidecar_index.SidecarWriter(sidecar_file, on_page=on_page) as writer:
+            for n in page_map:
+                if n is None:
+                    writer.write_page("")
+                elif n in retried:
+                    writer.write_page(retry_doc[retried[n]].get_text())
+                else:
+                    writer.write_page(layer_doc[n].get_text())
+        if with_words and hocr_path:
+            with fitz.open(output_path) as out_doc:
+                _write_word_boxes_from_hocr(hocr_path, out_doc, word_boxes.words_path_for_pdf(output_path),
+                                            retry_hocr=retry_hocr, retried=retried, page_map=page_map,
+                                            transforms=transforms, retry_transforms=retry_transforms)
+        return sidecar_file
+
+    except Exception as e:
+        if "Process Cancelled" in str(e): raise OCRError("Process Cancelled")
+        logging.error(f"Image OCR Error: {e}")
+        raise OCRError(f"Image OCR Failed: {str(e)}")
+    finally:
+        if layer_doc: layer_doc.close()
+        if retry_doc: retry_doc.close()
+        try: shutil.rmtree(temp_dir)
+        except: pass
 
 def _run_cmd(cmd, env, progress_callback=None, log_callback=None):
     """
     Executes a subprocess command and handles output/progress parsing.
     Captures stderr for progress updates from OCRmyPDF/Tesseract.
     """
-    global ACTIVE_PROCESS
-    
     startupinfo = platform_utils.get_subprocess_startup_info()
     
     # Process creation: Use new session/process group to allow cleanup
@@ -453,7 +1568,8 @@ def _run_cmd(cmd, env, progress_callback=None, log_callback=None):
         
     proc = subprocess.Popen(cmd, **kwargs)
 
-    ACTIVE_PROCESS = proc
+    with _ACTIVE_LOCK:
+        ACTIVE_PROCESSES.add(proc)
 
     stderr_output = []
     
@@ -483,7 +1599,8 @@ def _run_cmd(cmd, env, progress_callback=None, log_callback=None):
     rc = proc.poll()
     out = proc.stdout.read()
     err = "".join(stderr_output)
-    ACTIVE_PROCESS = None
+    with _ACTIVE_LOCK:
+        ACTIVE_PROCESSES.discard(proc)
 
     if rc != 0:
         if log_callback: log_callback(f"Command failed with RC {rc}")
@@ -493,6 +1610,49 @@ def _run_cmd(cmd, env, progress_callback=None, log_callback=None):
     
     return out, err
 
+def _run_ocrmypdf(cmd, api_kwargs, input_path, output_path, env, progress_callback=None, log_callback=None):
+    """
+    Runs one ocrmypdf job: through the persistent API worker (exact per-page progress,
+    no interpreter start-up), or as a `python -m ocrmypdf` subprocess if the worker is
+    disabled ("ocr_backend": "cli") or cannot start.
+    Failures raise subprocess.CalledProcessError either way.
+    """
+    from .config_manager import state as app_state
+    worker = None
+    if app_state.get("ocr_backend", "api") == "api" and not ocr_worker.pool.unavailable:
+        try:
+            worker = ocr_worker.pool.acquire()
+        except ocr_worker.WorkerUnavailable:
+            worker = None
+
+    if worker is None:
+        return _run_cmd(list(cmd) + [input_path, output_path], env, progress_callback, log_callback)
+
+    def on_event(event):
+        kind = event.get("event")
+        if kind == "progress":
+            if event.get("unit") == "page":
+                if progress_callback:
+                    progress_callback(int(event["completed"] * event.get("scale", 1)))
+            elif event.get("completed") == 0 and log_callback:
+                log_callback(f"{event.get('stage')}...")
+        elif kind == "log" and log_callback:
+            log_callback(event.get("message", ""))
+
+    with _ACTIVE_LOCK:
+        ACTIVE_PROCESSES.add(worker.proc)
+    try:
+        worker.run(input_path, output_path, api_kwargs, on_event,
+                   env={"TESSDATA_PREFIX": env.get("TESSDATA_PREFIX", "")})
+    except ocr_worker.WorkerJobError as e:
+        if log_callback: log_callback(f"Command failed with RC {e.returncode}")
+        logging.error(f"ocrmypdf API job failed ({e.returncode}): {e.stderr}")
+        raise
+    finally:
+        with _ACTIVE_LOCK:
+            ACTIVE_PROCESSES.discard(worker.proc)
+        ocr_worker.pool.release(worker)
+
 def _run_ocr_single(input_path, output_path, force, options, progress_callback, log_callback=None):
     """
     Internal function to run OCR on a single file (not password protected).
@@ -507,22 +1667,30 @@ def _run_ocr_single(input_path, output_path, force, options, progress_callback,
     # This ensures ocrmypdf works even if Scripts folder isn't in PATH
     from .platform_utils import get_python_executable
     base_cmd = [get_python_executable(), "-m", "ocrmypdf"]
+    # The same settings as keyword arguments for the API worker (ocr_worker.py)
+    api_kwargs = {}
     if force: base_cmd.append("--force-ocr")
     else: base_cmd.append("--skip-text")
+    api_kwargs["force_ocr" if force else "skip_text"] = True
 
     # Important: Optimize for size and compatibility
     base_cmd.extend(["--output-type", "pdf"])
+    api_kwargs["output_type"] = "pdf"
 
     if options:
         if options.get("deskew"): base_cmd.append("--deskew")
         if options.get("clean"): base_cmd.append("--clean")
         if options.get("rotate"): base_cmd.append("--rotate-pages")
+        api_kwargs.update(deskew=bool(options.get("deskew")), clean=bool(options.get("clean")),
+                          rotate_pages=bool(options.get("rotate")))
         
         lang = options.get("language", "eng")
         base_cmd.extend(["-l", lang])
+        api_kwargs["language"] = lang.split("+")
             
     sidecar_file = output_path.replace(".pdf", ".txt")
     base_cmd.extend(["--sidecar", sidecar_file])
+    api_kwargs["sidecar"] = sidecar_file
     base_cmd.append("-v") # Verbose for progress tracking
 
     # Thread/Job Control
@@ -531,10 +1699,21 @@ def _run_ocr_single(input_path, output_path, force, options, progress_callback,
     safe_jobs = 1
     if options:
         safe_jobs = max(1, int(options.get("max_cpu_threads", 2)))
+
+    # Memory admission: fewer workers rather than an OOM on large/high-DPI pages
+    page_w, page_h, page_dpi = _page_profile(input_path, options.get("dpi", 0) if options else 0)
+    planned_jobs = governor.plan_jobs(page_w, page_h, page_dpi, safe_jobs)
+    if planned_jobs < safe_jobs:
+        msg = f"Memory budget allows {planned_jobs} of {safe_jobs} OCR workers for this document."
+        logging.info(msg)
+        if log_callback: log_callback(msg)
+        safe_jobs = planned_jobs
+    reserved_bytes = governor.estimate_page_bytes(page_w, page_h, page_dpi) * safe_jobs
     
     env["OMP_THREAD_LIMIT"] = "1"
-    env["TESSDATA_PREFIX"] = platform_utils.get_app_data_dir()
+    env["TESSDATA_PREFIX"] = _tessdata_prefix(options, options.get("language", "eng") if options else "eng", log_callback)
     base_cmd.extend(["--jobs", str(safe_jobs)])
+    api_kwargs["jobs"] = safe_jobs
 
     # GPU Setup
     tess_cfg_path = None
@@ -548,13 +1727,16 @@ def _run_ocr_single(input_path, output_path, force, options, progress_callback,
     # 1. Optimization Control
     opt_val = options.get("optimize", "0") if options else "0"
     base_cmd.extend(["--optimize", opt_val])
+    api_kwargs["optimize"] = int(opt_val)
 
     # 2. Use 'auto' renderer (safer choice)
     base_cmd.extend(["--pdf-renderer", "auto"])
+    api_kwargs["pdf_renderer"] = "auto"
 
     # 3. Handle DPI (only if explicitly set)
     if custom_dpi > 0:
         base_cmd.extend(["--image-dpi", str(custom_dpi)])
+        api_kwargs["image_dpi"] = custom_dpi
 
     current_working_path = input_path
 
@@ -562,7 +1744,7 @@ def _run_ocr_single(input_path, output_path, force, options, progress_callback,
         dpi_str = f"at {custom_dpi} DPI" if custom_dpi > 0 else "using Source DPI"
         if log_callback: log_callback(f"Manually rasterizing PDF {dpi_str} to flatten annotations/fix errors...")
         temp_raster = input_path.replace(".pdf", "_pre_raster.pdf")
-        if _sanitize_pdf(input_path, temp_raster, dpi=custom_dpi):
+        if _sanitize_pdf(input_path, temp_raster, dpi=custom_dpi, jobs=safe_jobs):
             current_working_path = temp_raster
         else:
             if log_callback: log_callback("Pre-rasterization failed. Proceeding with original.")
@@ -575,23 +1757,24 @@ def _run_ocr_single(input_path, output_path, force, options, progress_callback,
     def attempt_execution(is_gpu):
         nonlocal tess_cfg_path
         cmd = list(base_cmd)
+        job_kwargs = dict(api_kwargs)
         
         if is_gpu:
             try:
                 # Create config file for Tesseract
                 temp_dir = os.path.dirname(output_path) if os.path.dirname(output_path) else tempfile.gettempdir()
-                tess_cfg_path = os.path.join(temp_dir, f"tess_gpu_config_{os.getpid()}.cfg")
+                tess_cfg_path = os.path.join(temp_dir, f"tess_gpu_config_{os.getpid()}_{threading.get_ident()}.cfg")
                 with open(tess_cfg_path, "w") as f:
                     # Enable OpenCL for Tesseract
                     f.write("tessedit_enable_opencl 1\n")
                 cmd.extend(["--tesseract-config", tess_cfg_path])
+                job_kwargs["tesseract_config"] = [tess_cfg_path]
             except: 
                 pass # Proceed without config if write fails
         
-        cmd.extend([current_working_path, output_path])
-        
         try:
-            _run_cmd(cmd, env, progress_callback, log_callback) # Pass log_callback here
+            with governor.reserve(reserved_bytes):
+                _run_ocrmypdf(cmd, job_kwargs, current_working_path, output_path, env, progress_callback, log_callback)
         except subprocess.CalledProcessError as e:
             raise e
         finally:
@@ -618,34 +1801,23 @@ def _run_ocr_single(input_path, output_path, force, options, progress_callback,
         else:
             last_error = e
             
-        # 2. CPU Failed? -> Try Sanitizing (only if allowed)
-        if not do_rasterize:
-            err_text = last_error.stderr if last_error.stderr else str(last_error)
-            raise OCRError(f"OCR Failed: {err_text[-500:]}\n\nTip: Try enabling 'Rasterize Images' to fix PDF structure errors.")
-
-        if log_callback: 
-            dpi_msg = f"{custom_dpi} DPI" if custom_dpi > 0 else "Source DPI"
-            log_callback(f"Standard OCR failed. Attempting sanitize ({dpi_msg})...")
-        
-        logging.warning("Standard OCR failed. Attempting to sanitize PDF (Rasterize & Rebuild)...")
-        sanitized_path = input_path.replace(".pdf", "_clean.pdf")
-        
-        if _sanitize_pdf(input_path, sanitized_path, dpi=custom_dpi):
-            try:
-                cmd = list(base_cmd)
-                cmd.extend([sanitized_path, output_path])
-                _run_cmd(cmd, env, progress_callback, log_callback)
-                return sidecar_file
-            except subprocess.CalledProcessError as e3:
-                err_text = e3.stderr if e3.stderr else str(e3)
-                raise OCRError(f"OCR Critical Fail (Sanitized): {err_text[-500:]}")
-            finally:
-                if os.path.exists(sanitized_path):
-                    try: os.remove(sanitized_path)
-                    except: pass
-        else:
-            err_text = last_error.stderr if last_error.stderr else str(last_error)
+        # 2. CPU Failed? -> Find the failing page(s); only those get sanitized
+        err_text = last_error.stderr if last_error.stderr else str(last_error)
+        if last_error.returncode in NON_PAGE_EXIT_CODES:
             raise OCRError(f"OCR Failed: {err_text[-500:]}")
+
+        logging.warning("Standard OCR failed. Isolating the failing page(s)...")
+        if log_callback: log_callback("OCR failed. Looking for the page(s) causing it...")
+
+        def run_part(part_in, part_out, part_sidecar, offset):
+            cmd, job_kwargs = _with_sidecar(base_cmd, api_kwargs, part_sidecar)
+            part_progress = (lambda p: progress_callback(offset + p)) if progress_callback else None
+            with governor.reserve(reserved_bytes):
+                _run_ocrmypdf(cmd, job_kwargs, part_in, part_out, env, part_progress, log_callback)
+
+        if not _ocr_bisect(run_part, current_working_path, output_path, sidecar_file,
+                           custom_dpi, log_callback, jobs=safe_jobs):
+            raise OCRError(f"OCR Failed: {err_text[-500:]}\n\nTip: Try enabling 'Rasterize Images' to fix PDF structure errors.")
     finally:
         # Cleanup proactive rasterization temp file if it was created
         if do_rasterize and current_working_path != input_path and os.path.exists(current_working_path):
@@ -654,12 +1826,109 @@ def _run_ocr_single(input_path, output_path, force, options, progress_callback,
 
     return sidecar_file
 
-def _get_page_max_dpi(page):
-    """Detect the maximum DPI of images on a page. Fallback to 300 if no images."""
+def _with_sidecar(cmd, kwargs, sidecar_path):
+    """Copies of an ocrmypdf command line and API kwargs writing their sidecar to sidecar_path."""
+    cmd = list(cmd)
+    if "--sidecar" in cmd:
+        cmd[cmd.index("--sidecar") + 1] = sidecar_path
+    return cmd, dict(kwargs, sidecar=sidecar_path)
+
+def _ocr_bisect(run_part, input_path, output_path, sidecar_file, dpi=0, log_callback=None, jobs=1):
+    """
+    Recovers from an ocrmypdf failure without re-rendering the whole document: the
+    page range is halved until the failing pages are isolated; good ranges keep their
+    normal OCR output, only failing single pages are sanitized (_sanitize_pdf) and
+    re-OCRed, and everything is spliced back in page order (PDF and sidecar).
+    A page that fails even sanitized is kept as it was, without text.
+
+    run_part(in_pdf, out_pdf, sidecar, first_page) runs ocrmypdf on one range; jobs caps
+    the sanitizer's workers (the job's max_cpu_threads).
+    Returns False (nothing written) when too many pages fail for this to be a page
+    problem; the caller reports the original error then.
+    """
+    _load_pdf_libs()
+    parts_dir = tempfile.mkdtemp(prefix="bisect_", dir=os.path.dirname(output_path) or None)
+    src = fitz.open(input_path)
+    total = len(src)
+    max_failures = max(MIN_BISECT_FAILURES, total // 4)
+    results = []    # (start, end, ocr pdf or None, sidecar or None), in page order
+    failed = []
+
+    def run(start, end, path):
+        out, txt = path.replace(".pdf", "_ocr.pdf"), path.replace(".pdf", "_ocr.txt")
+        try:
+            run_part(path, out, txt, start)
+        except subprocess.CalledProcessError:
+            if CANCEL_FLAG: raise OCRError("Process Cancelled")
+            return False
+        results.append((start, end, out, txt))
+        return True
+
+    def solve(start, end, known_bad=False):
+        if CANCEL_FLAG: raise OCRError("Process Cancelled")
+        if len(failed) > max_failures:
+            return
+        part = os.path.join(parts_dir, f"part_{start:05d}_{end:05d}.pdf")
+        with fitz.open() as d:
+            d.insert_pdf(src, from_page=start, to_page=end - 1)
+            d.save(part)
+        try:
+            if not known_bad and run(start, end, part):
+                return
+            if end - start > 1:
+                mid = (start + end) // 2
+                solve(start, mid)
+                solve(mid, end)
+                return
+            # One failing page: rasterize just this page and try again
+            failed.append(start)
+            if log_callback: log_callback(f"Page {start + 1} fails OCR. Sanitizing this page only...")
+            clean = part.replace(".pdf", "_clean.pdf")
+            if _sanitize_pdf(part, clean, dpi=dpi, jobs=jobs) and run(start, end, clean):
+                return
+            logging.error(f"Page {start + 1} could not be OCRed even after sanitizing; kept without text.")
+            results.append((start, end, None, None))
+        finally:
+            try: os.remove(part)
+            except OSError: pass
+
+    try:
+        solve(0, total, known_bad=True)
+        if len(failed) > max_failures:
+            logging.error(f"OCR failed on more than {max_failures} pages; not a page-level problem.")
+            return False
+
+        with fitz.open() as merged, sidecar_index.SidecarWriter(sidecar_file) as sidecar:
+            for start, end, pdf, txt in results:
+                if pdf:
+                    with fitz.open(pdf) as part_doc:
+                        merged.insert_pdf(part_doc)
+                else:
+                    merged.insert_pdf(src, from_page=start, to_page=end - 1)
+                texts = iter(list(sidecar_index.iter_text_pages(txt)) if txt and os.path.exists(txt) else [])
+                for _ in range(start, end):
+                    sidecar.write_page(next(texts, ""))
+            merged.save(output_path, garbage=3, deflate=True)
+
+        logging.info(f"Recovered by isolating failing page(s): {[p + 1 for p in failed]}")
+        if log_callback: log_callback(f"Done. {len(failed)} page(s) needed sanitizing: {', '.join(str(p + 1) for p in failed)}")
+        return True
+    finally:
+        src.close()
+        shutil.rmtree(parts_dir, ignore_errors=True)
+
+def _get_page_max_dpi(page, cap=None):
+    """
+    Detect the maximum DPI of images on a page. Fallback to 300 if no images.
+    The upper clamp defaults to the calibrated render DPI cap (600 if uncalibrated).
+    """
+    if cap is None:
+        from . import calibration
+        cap = calibration.get_tuning()["max_dpi"]
     try:
         images = page.get_images()
         if not images:
-            return 300
+            return min(300, cap)
         
         max_seen_dpi = 72 # Default PDF resolution
         for img in images:
@@ -674,38 +1943,45 @@ def _get_page_max_dpi(page):
         
         # Clamp to reasonable OCR limits
         if max_seen_dpi < 200: return 200
-        if max_seen_dpi > 600: return 600
+        if max_seen_dpi > cap: return cap
         return int(max_seen_dpi)
     except:
-        return 300
+        return min(300, cap)
 
-def _sanitize_pdf(input_path, output_path, dpi=0):
+def _sanitize_pdf(input_path, output_path, dpi=0, jobs=1):
     """
     Rebuilds a PDF by converting pages to images and back.
-    Fixes corrupt streams/JPEGs that crash OCRmyPDF.
+    Fixes corrupt streams/JPEGs that crash OCRmyPDF. Pages are rendered in a process
+    pool of at most `jobs` workers (the job's max_cpu_threads, within the usable cores)
+    and written as they finish (see sanitize.py).
     """
+    _load_pdf_libs()
     if not fitz: return False
-    
+    from . import sanitize
+    from . import gpu_manager
+
     try:
-        doc = fitz.open(input_path)
-        new_doc = fitz.open()
-        
-        for i, page in enumerate(doc):
-            # Deterministic/Source DPI if 0
-            page_dpi = dpi if dpi > 0 else _get_page_max_dpi(page)
-            
-            # Render page to image
-            pix = page.get_pixmap(dpi=page_dpi)
-            img_bytes = pix.tobytes("jpg", jpg_quality=95)
-            
-            # Create new page in new doc
-            new_page = new_doc.new_page(width=page.rect.width, height=page.rect.height)
-            new_page.insert_image(page.rect, stream=img_bytes)
-            
-        new_doc.save(output_path)
-        new_doc.close()
-        doc.close()
+        with fitz.open(input_path) as doc:
+            sizes = [(page.rect.width, page.rect.height, dpi if dpi > 0 else _get_page_max_dpi(page))
+                     for page in doc]
+        if not sizes:
+            return False
+        widest = max(sizes, key=lambda s: s[0] * s[1] * s[2] * s[2])
+        workers = governor.plan_jobs(*widest, max(1, min(len(sizes), jobs, gpu_manager.get_usable_cpu_count())))
+        # Deterministic/Source DPI if 0, lowered where the per-worker memory share needs it
+        page_dpis = [governor.plan_dpi(w, h, page_dpi, workers=workers) for w, h, page_dpi in sizes]
+
+        with governor.reserve(workers * governor.estimate_page_bytes(*widest)):
+            done = sanitize.sanitize(input_path, output_path, page_dpis, workers=workers,
+                                     cancelled=lambda: CANCEL_FLAG)
+        if not done:
+            raise OCRError("Process Cancelled")
         return True
+    except OCRError:
+        if os.path.exists(output_path):
+            try: os.remove(output_path)
+            except OSError: pass
+        raise
     except Exception as e:
         logging.error(f"PDF Sanitization failed: {e}")
         return False
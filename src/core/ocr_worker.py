@@ -0,0 +1,286 @@
+"""
+OCR Worker - Long-lived ocrmypdf process driven through its Python API over a pipe.
+
+Instead of starting `python -m ocrmypdf -v` per job and scraping its stderr, the
+engine keeps a worker process (bundled interpreter, see get_python_executable) that
+has ocrmypdf imported once. Jobs are sent as JSON lines on stdin; the worker answers
+with JSON events on its original stdout:
+
+    {"event": "ready", "version": "14.4.0"}
+    {"event": "progress", "stage": "OCR", "unit": "page", "completed": 6, "total": 20, "scale": 0.5}
+    {"event": "log", "level": "INFO", "message": "..."}
+    {"event": "done", "ok": false, "exit_code": 6, "error": "..."}
+
+Progress comes from an ocrmypdf progress-bar plugin, so page counts are exact.
+The worker side only uses the standard library and ocrmypdf (it runs under the
+bundled Python, which may be older than the GUI's interpreter).
+"""
+import os
+import sys
+import json
+import logging
+import threading
+import subprocess
+
+PROTOCOL_VERSION = 1
+MAX_IDLE_WORKERS = 4
+
+
+# ==================== WORKER SIDE ====================
+
+_out = None
+_out_lock = threading.Lock()
+
+
+def _emit(event, **data):
+    data["event"] = event
+    line = json.dumps(data) + "\n"
+    with _out_lock:
+        _out.write(line)
+        _out.flush()
+
+
+class _ProgressBar:
+    """tqdm-like progress bar that forwards every update as a progress event."""
+
+    def __init__(self, *args, total=None, desc="", unit="it", unit_scale=1, **kwargs):
+        self.total = total or 0
+        self.desc = desc
+        self.unit = unit
+        self.scale = unit_scale if isinstance(unit_scale, (int, float)) and not isinstance(unit_scale, bool) else 1
+        self.completed = 0
+
+    def __enter__(self):
+        self._send()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    def update(self, n=1, completed=None):
+        if completed is not None:
+            self.completed = completed
+        else:
+            self.completed += 1 if n is None else n
+        self._send()
+
+    def _send(self):
+        _emit("progress", stage=self.desc, unit=self.unit, completed=self.completed,
+              total=self.total, scale=self.scale)
+
+
+class _EventLogHandler(logging.Handler):
+    def emit(self, record):
+        try:
+            _emit("log", level=record.levelname, message=record.getMessage())
+        except Exception:
+            pass
+
+
+def _serve():
+    global _out
+    # Keep the real stdout for events; anything else printing goes to stderr
+    _out = os.fdopen(os.dup(1), "w", encoding="utf-8")
+    os.dup2(2, 1)
+    sys.stdout = sys.stderr
+
+    try:
+        import ocrmypdf
+        from ocrmypdf._plugin_manager import get_plugin_manager
+    except Exception as e:
+        _emit("unavailable", error=str(e))
+        return
+
+    class _ProgressPlugin:
+        @ocrmypdf.hookimpl
+        def get_progressbar_class(self):
+            return _ProgressBar
+
+    plugin_manager = get_plugin_manager([])
+    plugin_manager.register(_ProgressPlugin())
+
+    log = logging.getLogger("ocrmypdf")
+    log.setLevel(logging.INFO)
+    log.addHandler(_EventLogHandler())
+
+    _emit("ready", version=getattr(ocrmypdf, "__version__", ""), protocol=PROTOCOL_VERSION)
+
+    while True:
+        line = sys.stdin.readline()
+        if not line:
+            break
+        try:
+            job = json.loads(line)
+        except ValueError:
+            continue
+        if job.get("cmd") == "quit":
+            break
+
+        # Per-job environment for the Tesseract processes ocrmypdf starts (e.g. model tier)
+        os.environ.update(job.get("env") or {})
+        try:
+            rc = ocrmypdf.ocr(job["input"], job["output"], plugin_manager=plugin_manager,
+                              progress_bar=True, **job.get("kwargs", {}))
+            rc = int(rc or 0)
+            if rc == 0:
+                _emit("done", ok=True, exit_code=0)
+            else:
+                _emit("done", ok=False, exit_code=rc, error=f"ocrmypdf exited with code {rc}")
+        except Exception as e:
+            import traceback
+            code = getattr(e, "exit_code", 15)
+            _emit("done", ok=False, exit_code=int(code),
+                  error=f"{type(e).__name__}: {e}\n{traceback.format_exc()[-2000:]}")
+
+
+# ==================== CLIENT SIDE ====================
+
+class WorkerUnavailable(Exception):
+    """The bundled interpreter cannot run the API worker (e.g. ocrmypdf import fails)."""
+    pass
+
+
+class WorkerJobError(subprocess.CalledProcessError):
+    """A job failed inside the worker. Behaves like a failed ocrmypdf subprocess for retry logic."""
+
+    def __init__(self, returncode, message):
+        super().__init__(returncode, ["ocrmypdf-api"], output="", stderr=message)
+
+
+class OcrWorker:
+    """Client handle of one worker process."""
+
+    def __init__(self, python, env):
+        kwargs = {
+            "stdin": subprocess.PIPE,
+            "stdout": subprocess.PIPE,
+            "stderr": subprocess.DEVNULL,
+            "env": env,
+            "text": True,
+            "encoding": "utf-8",
+            "bufsize": 1,
+        }
+        if os.name == 'posix':
+            kwargs["start_new_session"] = True
+        else:
+            from . import platform_utils
+            kwargs["creationflags"] = platform_utils.get_subprocess_creation_flags()
+            kwargs["startupinfo"] = platform_utils.get_subprocess_startup_info()
+        script = os.path.abspath(__file__)
+        if not script.endswith(".py") or not os.path.exists(script):
+            raise WorkerUnavailable("Worker script not available as a file (frozen build)")
+        self.proc = subprocess.Popen([python, script], **kwargs)
+
+        hello = self._read_event()
+        if not hello or hello.get("event") != "ready":
+            self.close()
+            raise WorkerUnavailable((hello or {}).get("error") or "OCR worker did not start")
+        self.version = hello.get("version")
+
+    def _read_event(self):
+        while True:
+            line = self.proc.stdout.readline()
+            if not line:
+                return None
+            try:
+                return json.loads(line)
+            except ValueError:
+                continue # Stray output; events are always complete JSON lines
+
+    def is_alive(self):
+        return self.proc.poll() is None
+
+    def run(self, input_path, output_path, kwargs, on_event=None, env=None):
+        """
+        Runs one job. on_event(event_dict) receives progress/log events; env overrides
+        environment variables for the job. Raises WorkerJobError.
+        """
+        job = {"input": input_path, "output": output_path, "kwargs": kwargs, "env": env or {}}
+        try:
+            self.proc.stdin.write(json.dumps(job) + "\n")
+            self.proc.stdin.flush()
+        except (OSError, ValueError) as e:
+            raise WorkerJobError(-1, f"OCR worker is gone: {e}")
+
+        while True:
+            event = self._read_event()
+            if event is None:
+                rc = self.proc.poll()
+                raise WorkerJobError(rc if rc is not None else -1, "OCR worker exited during the job")
+            if event.get("event") == "done":
+                if not event.get("ok"):
+                    raise WorkerJobError(event.get("exit_code", 15), event.get("error", ""))
+                return
+            if on_event:
+                try: on_event(event)
+                except Exception: pass
+
+    def close(self):
+        try:
+            if self.is_alive():
+                self.proc.stdin.write(json.dumps({"cmd": "quit"}) + "\n")
+                self.proc.stdin.flush()
+                self.proc.wait(timeout=5)
+        except Exception:
+            try: self.proc.kill()
+            except Exception: pass
+
+
+class WorkerPool:
+    """
+    Idle workers are reused across jobs; concurrent jobs (batch) get their own worker.
+    If the worker cannot start once, the pool reports unavailable and callers use the CLI.
+    """
+
+    def __init__(self):
+        self._idle = []
+        self._lock = threading.Lock()
+        self.unavailable = False
+
+    def _env(self):
+        from . import platform_utils
+        env = os.environ.copy()
+        env["PYTHONIOENCODING"] = "utf-8"
+        env["OMP_THREAD_LIMIT"] = "1"
+        env["TESSDATA_PREFIX"] = platform_utils.get_app_data_dir()
+        return env
+
+    def acquire(self):
+        if self.unavailable:
+            raise WorkerUnavailable("OCR worker unavailable")
+        with self._lock:
+            while self._idle:
+                worker = self._idle.pop()
+                if worker.is_alive():
+                    return worker
+        from . import platform_utils
+        try:
+            return OcrWorker(platform_utils.get_python_executable(), self._env())
+        except WorkerUnavailable as e:
+            logging.warning(f"ocrmypdf API worker unavailable, using the command line: {e}")
+            self.unavailable = True
+            raise
+        except OSError as e:
+            raise WorkerUnavailable(str(e))
+
+    def release(self, worker):
+        if not worker.is_alive():
+            return # Killed (cancel) or crashed: start a fresh one next time
+        with self._lock:
+            if len(self._idle) < MAX_IDLE_WORKERS:
+                self._idle.append(worker)
+                return
+        worker.close()
+
+    def shutdown(self):
+        with self._lock:
+            workers, self._idle = self._idle, []
+        for worker in workers:
+            worker.close()
+
+
+pool = WorkerPool()
+
+
+if __name__ == "__main__":
+    _serve()
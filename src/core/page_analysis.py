@@ -0,0 +1,100 @@
+"""
+Page Analysis - Cheap pixel statistics of rendered pages (NumPy).
+
+Duplex scans carry many blank backsides. Each page is rendered once in grayscale
+at ANALYSIS_DPI and measured over `pix.samples` without a Python loop per pixel:
+
+  - ink_ratio:  share of pixels clearly darker than the paper (bleed-through is
+                lighter than INK_CONTRAST below the background and does not count)
+  - components: connected ink blobs on a coarse cell grid; dust and scanner specks
+                are a few isolated cells, text and drawings are many
+  - largest:    longest side (points) of the biggest blob, measured on the pixels
+
+A page is blank only if it has little ink, few blobs and no blob of text size: a lone
+"Chapter 2" or a signature line is a handful of blobs and almost no ink, but every
+word, digit or rule in it is at least MIN_CONTENT_PT long, while specks are not.
+A border of MARGIN is ignored (scanner edges, punch holes, shadows, page numbers).
+NumPy is optional: without it analyze() returns None and no page is treated as blank.
+"""
+from collections import namedtuple
+
+ANALYSIS_DPI = 150          # small type (and a speck from a digit) stays distinguishable
+MARGIN = 0.05               # fraction of each side ignored
+INK_CONTRAST = 80           # grey levels below the paper that count as ink
+CELL = 8                    # px per grid cell for the component count
+MAX_INK_RATIO = 0.003
+MAX_COMPONENTS = 3
+MIN_CONTENT_PT = 4.0        # a blob this long is a glyph, word or line, not dust (~1.4 mm)
+MAX_COUNTED_CELLS = 5000    # beyond this many ink cells a page is not blank: skip counting
+
+PageStats = namedtuple("PageStats", "ink_ratio components largest")
+
+
+def _load_numpy():
+    try:
+        import numpy
+        return numpy
+    except ImportError:
+        return None
+
+
+def analyze(samples, width, height, stride=None, dpi=ANALYSIS_DPI):
+    """PageStats of an 8-bit grayscale pixmap (`pix.samples`) rendered at dpi, or None without NumPy."""
+    np = _load_numpy()
+    if np is None or width <= 0 or height <= 0:
+        return None
+    a = np.frombuffer(samples, dtype=np.uint8).reshape(height, stride or width)[:, :width]
+    mh, mw = int(height * MARGIN), int(width * MARGIN)
+    a = a[mh:height - mh, mw:width - mw]
+    if a.size == 0:
+        return None
+
+    background = float(np.median(a))
+    ink = a < (background - INK_CONTRAST)
+    ink_ratio = float(ink.mean())
+    if ink_ratio > MAX_INK_RATIO:
+        return PageStats(ink_ratio, None, None)
+
+    h, w = -(-ink.shape[0] // CELL) * CELL, -(-ink.shape[1] // CELL) * CELL
+    padded = np.zeros((h, w), dtype=bool)
+    padded[:ink.shape[0], :ink.shape[1]] = ink
+    cells = padded.reshape(h // CELL, CELL, w // CELL, CELL).any(axis=(1, 3))
+    extents = _component_extents(np, padded, cells)
+    if extents is None:
+        return PageStats(ink_ratio, None, None)
+    return PageStats(ink_ratio, len(extents), max(extents, default=0) * 72.0 / dpi)
+
+
+def _component_extents(np, ink, cells):
+    """
+    Longest side in px of every 8-connected component of the cell grid, measured on the
+    ink pixels inside its cells (None if there are too many ink cells to bother).
+    """
+    ys, xs = np.nonzero(cells)
+    if len(ys) > MAX_COUNTED_CELLS:
+        return None
+    todo = set(zip(ys.tolist(), xs.tolist()))
+    extents = []
+    while todo:
+        y0, x0 = y1, x1 = start = todo.pop()
+        stack = [start]
+        while stack:
+            y, x = stack.pop()
+            y0, y1, x0, x1 = min(y0, y), max(y1, y), min(x0, x), max(x1, x)
+            for dy in (-1, 0, 1):
+                for dx in (-1, 0, 1):
+                    n = (y + dy, x + dx)
+                    if n in todo:
+                        todo.remove(n)
+                        stack.append(n)
+        py, px = np.nonzero(ink[y0 * CELL:(y1 + 1) * CELL, x0 * CELL:(x1 + 1) * CELL])
+        extents.append(max(int(py.max() - py.min()), int(px.max() - px.min())) + 1)
+    return extents
+
+
+def is_blank(stats):
+    """Blank or near-blank (a few specks) according to analyze(); unknown stats are never blank."""
+    if stats is None or stats.components is None:
+        return False
+    return (stats.ink_ratio <= MAX_INK_RATIO and stats.components <= MAX_COMPONENTS
+            and stats.largest < MIN_CONTENT_PT)
@@ -4,11 +4,15 @@ import sys
 import logging
 import subprocess
 import signal
+import threading
 
 IS_WINDOWS = os.name == 'nt'
 IS_LINUX = sys.platform.startswith('linux')
 IS_MAC = sys.platform == 'darwin'
 
+# Environment setup steps already applied in this process (setup_* are idempotent)
+_ENV_READY = set()
+
 def to_linux_path(path):
     """Translates a Windows path to a Linux path if running on Linux (WSL)."""
     if not IS_LINUX or not path:
@@ -100,14 +104,39 @@ def setup_python_environment():
             logging.info(f"Added bundled Linux site-packages to path: {site_packages}")
 
 
-def get_app_data_dir():
+# Resolved once per process (see get_app_data_dir)
+APP_DATA_ENV_VAR = "BIPLOB_OCR_DATA_DIR"
+_APP_DATA_DIR = None
+_APP_DATA_LOCK = threading.Lock()
+
+def _is_writable_dir(path):
+    """Checks if a directory is truly writable (creates it if needed). Performs a write probe."""
+    if not path: return False
+    try:
+        if not os.path.exists(path):
+            os.makedirs(path, exist_ok=True)
+        test_f = os.path.join(path, ".write_test")
+        with open(test_f, "w") as f: f.write("ok")
+        os.remove(test_f)
+        return True
+    except:
+        return False
+
+def _resolve_app_data_dir():
     """
-    Returns the application data directory.
-    Simplified: 
-    1. Check for 'BiplobOCR_Data' next to the app. Use if it exists.
-    2. Try ~/.local/share/BiplobOCR.
+    Resolution order:
+    0. $BIPLOB_OCR_DATA_DIR if set (server deployments / shared installs).
+    1. 'BiplobOCR_Data' next to the app, if it exists and is writable.
+    2. ~/.local/share/BiplobOCR (or %LOCALAPPDATA%\\BiplobOCR).
     3. If Step 2 fails (Read-only), use 'BiplobOCR_Data' next to the app.
     """
+    override = os.environ.get(APP_DATA_ENV_VAR)
+    if override:
+        override = os.path.abspath(os.path.expanduser(override))
+        if _is_writable_dir(override):
+            return override
+        logging.warning(f"{APP_DATA_ENV_VAR}={override} is not writable. Falling back to defaults.")
+
     appimage_path = os.environ.get('APPIMAGE')
     if appimage_path:
         local_dir = os.path.join(os.path.dirname(appimage_path), "BiplobOCR_Data")
@@ -118,40 +147,57 @@ def get_app_data_dir():
              local_dir = os.path.join(base, "BiplobOCR_Data")
         except:
              local_dir = None
-    # Function to check if a directory is truly writable
-    def is_writable(path):
-        if not path: return False
-        try:
-            if not os.path.exists(path):
-                os.makedirs(path, exist_ok=True)
-            test_f = os.path.join(path, ".write_test")
-            with open(test_f, "w") as f: f.write("ok")
-            os.remove(test_f)
-            return True
-        except:
-            return False
 
-    # Priority 0: If local dir exists AND is writable, use it.
-    if local_dir and os.path.exists(local_dir) and is_writable(local_dir):
+    # Priority 1: If local dir exists AND is writable, use it.
+    if local_dir and os.path.exists(local_dir) and _is_writable_dir(local_dir):
         return local_dir
 
-    # Priority 1: Home dir
+    # Priority 2: Home dir
     if IS_WINDOWS:
         home_path = os.path.join(os.environ.get('LOCALAPPDATA', os.path.expanduser("~")), "BiplobOCR")
     else:
         home_path = os.path.join(os.path.expanduser("~"), ".local", "share", "BiplobOCR")
 
-    if is_writable(home_path):
+    if _is_writable_dir(home_path):
         return home_path
 
-    # Priority 2: Try creating local folder as last resort
-    if is_writable(local_dir):
+    # Priority 3: Try creating local folder as last resort
+    if _is_writable_dir(local_dir):
         return local_dir
 
     return home_path # Final fallback
 
+def get_app_data_dir(refresh=False):
+    """
+    Returns the application data directory.
+    The (write-probing) resolution runs once per process; later calls return the cached path.
+    Pass refresh=True to force a full re-resolution.
+    """
+    global _APP_DATA_DIR
+    if _APP_DATA_DIR is not None and not refresh:
+        return _APP_DATA_DIR
+
+    with _APP_DATA_LOCK:
+        if _APP_DATA_DIR is None or refresh:
+            _APP_DATA_DIR = _resolve_app_data_dir()
+            logging.info(f"App data directory: {_APP_DATA_DIR}")
+        return _APP_DATA_DIR
+
+def revalidate_app_data_dir():
+    """
+    Cheap check that the cached data directory is still usable (exists + writable per os.access).
+    Re-resolves only if it is not. Returns the (possibly new) directory.
+    """
+    current = _APP_DATA_DIR
+    if current is not None and os.path.isdir(current) and os.access(current, os.W_OK):
+        return current
+    return get_app_data_dir(refresh=True)
+
 def setup_tesseract_environment():
     """Configure environment to use bundled Tesseract if available."""
+    if "tesseract" in _ENV_READY:
+        return
+    _ENV_READY.add("tesseract")
     try:
         base_dir = get_base_dir()
         platform_dir = get_tesseract_dir_name()
@@ -170,8 +216,6 @@ def setup_tesseract_environment():
             logging.warning(f"Bundled Tesseract NOT found at: {tess_exe}. Utilizing system PATH.")
 
         # TESSDATA Logic: Use writable user directory
-        import shutil
-        
         # 1. Define User Writable Tessdata Dir
         user_data_dir = get_app_data_dir()
         writable_tessdata = os.path.join(user_data_dir, "tessdata")
@@ -181,32 +225,14 @@ def setup_tesseract_environment():
         bundled_tessdata = os.path.join(tess_bin, "tessdata")
         
         if os.path.exists(bundled_tessdata):
-             # 3. Smart Sync: Copy essential files if missing or if forced update
-             # For now, let's ensure 'eng.traineddata', 'ben.traineddata', 'osd.traineddata' exist in writable
-             essentials = ["eng.traineddata", "ben.traineddata", "osd.traineddata"]
-             
-             # Also copy if we are running frozen (AppImage) likely meaning bundled is fresh
-             is_frozen = getattr(sys, 'frozen', False)
-             
-             for item in os.listdir(bundled_tessdata):
-                 src = os.path.join(bundled_tessdata, item)
-                 dst = os.path.join(writable_tessdata, item)
-                 
-                 # Copy if missing OR (if essential and we are immutable/frozen, maybe update?)
-                 # Simple logic: Copy if missing. User can manually update if needed.
-                 if not os.path.exists(dst):
-                     try:
-                         if os.path.isdir(src):
-                             shutil.copytree(src, dst)
-                         else:
-                             shutil.copy2(src, dst)
-                         logging.info(f"Initialized tessdata: {item}")
-                     except Exception as e:
-                         logging.error(f"Failed to copy {item}: {e}")
+             # 3. Manifest-based sync in the background (see tessdata_manager).
+             # OCR entry points call tessdata_manager.wait_for_sync() before using the data.
+             from . import tessdata_manager
+             tessdata_manager.start_background_sync(bundled_tessdata, writable_tessdata)
         
         # 4. Set TESSDATA_PREFIX to the PARENT of tessdata folder
         # Tesseract expects the prefix to be the directory CONTAINING the 'tessdata' folder.
-        app_data_dir = get_app_data_dir()
+        app_data_dir = user_data_dir
         os.environ["TESSDATA_PREFIX"] = app_data_dir
         logging.info(f"Tessdata Prefix set to: {app_data_dir}")
         
@@ -215,6 +241,9 @@ def setup_tesseract_environment():
 
 def setup_ghostscript_environment():
     """Configure environment to use bundled Ghostscript if available."""
+    if "ghostscript" in _ENV_READY:
+        return
+    _ENV_READY.add("ghostscript")
     try:
         base_dir = get_base_dir()
         
@@ -249,6 +278,36 @@ def get_tessdata_dir():
     """Returns the path to the writable tessdata directory."""
     return os.path.join(get_app_data_dir(), "tessdata")
 
+def _font_is_current(src, dst):
+    """True if dst is an up-to-date copy of src (size/mtime first, content only on doubt)."""
+    try:
+        s_st = os.stat(src)
+        d_st = os.stat(dst)
+    except OSError:
+        return False
+    if s_st.st_size != d_st.st_size:
+        return False
+    # copy2 preserves mtime, so equal timestamps mean we installed this exact file
+    if int(s_st.st_mtime) == int(d_st.st_mtime):
+        return True
+    import filecmp
+    try:
+        return filecmp.cmp(src, dst, shallow=False)
+    except OSError:
+        return False
+
+def _refresh_font_cache_async(fonts_dir):
+    """Runs fc-cache for fonts_dir in a daemon thread so startup never blocks on it."""
+    def _worker():
+        try:
+            subprocess.run(["fc-cache", "-f", fonts_dir], check=False,
+                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            logging.info("Font cache refreshed.")
+        except Exception as e:
+            logging.warning(f"fc-cache failed: {e}")
+
+    threading.Thread(target=_worker, name="fc-cache", daemon=True).start()
+
 def setup_fonts():
     """Register custom fonts from assets folder. Returns font family name on success, None on failure."""
     try:
@@ -273,17 +332,20 @@ def setup_fonts():
             os.makedirs(local_fonts_dir, exist_ok=True)
             
             target_font_path = os.path.join(local_fonts_dir, "AdorNoirrit.ttf")
+            if _font_is_current(font_path, target_font_path):
+                # Already installed and unchanged: fontconfig has it, nothing to rebuild
+                return "Li Ador Noirrit"
+
             import shutil
-            shutil.copy2(font_path, target_font_path)
+            tmp_path = target_font_path + ".tmp"
+            shutil.copy2(font_path, tmp_path)
+            os.replace(tmp_path, target_font_path)
             
-            # Refresh font cache
-            try:
-                subprocess.run(["fc-cache", "-f", local_fonts_dir], check=False, 
-                                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-                logging.info(f"Registered custom font for Linux: {target_font_path}")
-                return "Li Ador Noirrit"
-            except:
-                pass
+            # Refresh font cache in the background; UI text is rendered from the file
+            # path directly (see emoji_label), so nothing needs to wait for it.
+            _refresh_font_cache_async(local_fonts_dir)
+            logging.info(f"Registered custom font for Linux: {target_font_path}")
+            return "Li Ador Noirrit"
                 
         return None
     except Exception as e:
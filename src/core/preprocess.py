@@ -0,0 +1,124 @@
+"""
+Preprocess - In-process image conditioning of rendered pages before OCR (NumPy + PIL).
+
+Replaces ocrmypdf's --deskew / --clean (unpaper) / --rotate-pages for the layer
+injection strategy, which OCRs its own renders:
+
+  - rotation:   quarter turns from the Tesseract OSD pass (see script_detect.osd_orientation)
+  - deskew:     projection profile. Ink pixels are projected onto the y axis for a
+                range of candidate angles at once; the angle whose row histogram is
+                the most "peaky" (text lines aligned) wins
+  - clean:      background normalisation. The paper's brightness is estimated on a
+                coarse grid (block maxima) and divided out, flattening shadows,
+                yellowed paper and uneven scanner lighting
+
+Only the image Tesseract sees is changed. apply() reports the total counter-clockwise
+rotation so the engine can map the resulting text layer back onto the original page.
+Without NumPy, quarter turns still work; deskew and clean are skipped.
+"""
+import math
+import logging
+
+MIN_ORIENTATION_CONFIDENCE = 14.0  # Same default as ocrmypdf's --rotate-pages-threshold
+MAX_SKEW = 5.0          # degrees searched either way
+COARSE_STEP = 0.5
+FINE_STEP = 0.1
+MIN_SKEW = 0.2          # smaller corrections are not worth the resampling
+SKEW_WIDTH = 1200       # px; skew is measured on a downscaled copy
+MAX_SKEW_POINTS = 60000
+BACKGROUND_BLOCK = 32   # px per background cell
+
+_warned = False
+
+
+def _load_numpy():
+    global _warned
+    try:
+        import numpy
+        return numpy
+    except ImportError:
+        if not _warned:
+            logging.warning("NumPy is not installed: in-process deskew and background cleaning are unavailable.")
+            _warned = True
+        return None
+
+
+def _profile_scores(np, ys, xs, angles):
+    """Sum of squared row counts of the ink points rotated by each angle (degrees, ccw)."""
+    rad = np.radians(angles)[:, None]
+    rows = np.floor(ys[None, :] * np.cos(rad) - xs[None, :] * np.sin(rad)).astype(np.int64)
+    rows -= rows.min(axis=1, keepdims=True)
+    scores = []
+    for row in rows:
+        counts = np.bincount(row).astype(np.float64)
+        scores.append(float((counts * counts).sum()))
+    return np.array(scores)
+
+
+def estimate_skew(gray):
+    """Counter-clockwise angle (degrees) that levels the text lines of a 2-D uint8 array."""
+    np = _load_numpy()
+    if np is None:
+        return 0.0
+    step = max(1, int(math.ceil(gray.shape[1] / SKEW_WIDTH)))
+    small = gray[::step, ::step]
+    background = float(np.median(small))
+    ys, xs = np.nonzero(small < background - 80)
+    if len(ys) < 100:
+        return 0.0
+    if len(ys) > MAX_SKEW_POINTS:
+        pick = np.linspace(0, len(ys) - 1, MAX_SKEW_POINTS).astype(np.int64)
+        ys, xs = ys[pick], xs[pick]
+    ys = ys.astype(np.float64) - small.shape[0] / 2
+    xs = xs.astype(np.float64) - small.shape[1] / 2
+
+    coarse = np.arange(-MAX_SKEW, MAX_SKEW + 1e-9, COARSE_STEP)
+    best = float(coarse[int(np.argmax(_profile_scores(np, ys, xs, coarse)))])
+    fine = np.arange(best - COARSE_STEP, best + COARSE_STEP + 1e-9, FINE_STEP)
+    best = float(fine[int(np.argmax(_profile_scores(np, ys, xs, fine)))])
+    return best if abs(best) >= MIN_SKEW else 0.0
+
+
+def normalize_background(gray):
+    """Divides out the estimated paper brightness of a 2-D uint8 array (returns uint8)."""
+    np = _load_numpy()
+    if np is None:
+        return gray
+    from PIL import Image
+    h, w = gray.shape
+    b = BACKGROUND_BLOCK
+    hb, wb = max(1, h // b), max(1, w // b)
+    cells = gray[:hb * b, :wb * b].reshape(hb, b, wb, b).max(axis=(1, 3))
+    # Widen each cell's view to its neighbours so text-only cells still see paper
+    padded = np.pad(cells, 1, mode="edge")
+    cells = np.max([padded[dy:dy + hb, dx:dx + wb] for dy in range(3) for dx in range(3)], axis=0)
+    background = np.asarray(Image.fromarray(cells).resize((w, h), Image.BILINEAR), dtype=np.float32)
+    out = gray.astype(np.float32) * 255.0 / np.maximum(background, 1.0)
+    return np.clip(out, 0, 255).astype(np.uint8)
+
+
+def apply(img, rotate=0, deskew=False, clean=False):
+    """
+    Conditions a grayscale PIL image for OCR. `rotate` is a counter-clockwise quarter
+    turn (0/90/180/270). Returns (image, total ccw angle in degrees).
+    """
+    from PIL import Image
+    angle = 0.0
+    if rotate % 360:
+        img = img.transpose({90: Image.ROTATE_90, 180: Image.ROTATE_180, 270: Image.ROTATE_270}[rotate % 360])
+        angle += rotate % 360
+
+    np = _load_numpy() if (deskew or clean) else None
+    if np is None:
+        return img, angle
+
+    gray = np.asarray(img.convert("L"))
+    if clean:
+        gray = normalize_background(gray)
+    img = Image.fromarray(gray)
+    if deskew:
+        skew = estimate_skew(gray)
+        if skew:
+            img = img.rotate(skew, resample=Image.BICUBIC, expand=True, fillcolor=255)
+            angle += skew
+    return img, angle
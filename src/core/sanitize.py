@@ -0,0 +1,216 @@
+"""
+Sanitize - Rebuilds a damaged PDF from page renders, in parallel and streamed to disk.
+
+Corrupt streams or JPEGs that crash ocrmypdf are avoided by rendering every page and
+building a new PDF from the images. Pages are rendered and encoded in a process pool
+(rendering and encoding hold the GIL); the parent only places the encoded streams:
+
+  - bilevel:  black-and-white scans (almost no mid-tones) are stored as CCITT G4,
+              written as a raw /CCITTFaxDecode stream (Flate-compressed 1-bit PNG
+              when Pillow has no libtiff)
+  - gray:     JPEG, one channel
+  - color:    JPEG
+
+At most `workers * IN_FLIGHT_PER_WORKER` pages are rendered ahead of the writer, and
+the output is saved incrementally every FLUSH_PAGES pages and reopened, so finished
+pages leave memory. Memory is bounded by the pages in flight, not the document.
+"""
+import io
+import logging
+
+JPEG_QUALITY = 95
+COLOR_TOLERANCE = 24        # channel spread (grey levels) that counts as colour
+MAX_COLOR_RATIO = 0.005     # share of coloured pixels a "gray" page may have (JPEG noise)
+MIDTONE_RANGE = (48, 208)
+MAX_MIDTONE_RATIO = 0.01    # share of mid-tones a "bilevel" page may have (edge antialiasing)
+MAX_RESAMPLED_MIDTONE_RATIO = 0.1   # same, for pages whose images are all 1-bit (rendered at another DPI)
+IN_FLIGHT_PER_WORKER = 2
+FLUSH_PAGES = 16
+
+_doc = None
+
+
+def _init_worker(input_path):
+    global _doc
+    import fitz
+    _doc = fitz.open(input_path)
+
+
+def _histogram_ratio(hist, lo, hi):
+    total = sum(hist)
+    return sum(hist[lo:hi]) / total if total else 0.0
+
+
+def classify(img, bilevel_source=False):
+    """
+    'bilevel', 'gray' or 'color' for an RGB PIL image. bilevel_source: the page only
+    shows 1-bit images, so mid-tones are resampling edges and more of them are allowed.
+    """
+    from PIL import ImageChops
+    r, g, b = img.split()
+    spread = ImageChops.lighter(ImageChops.difference(r, g), ImageChops.difference(g, b))
+    if _histogram_ratio(spread.histogram(), COLOR_TOLERANCE, 256) > MAX_COLOR_RATIO:
+        return "color"
+    gray = img.convert("L")
+    limit = MAX_RESAMPLED_MIDTONE_RATIO if bilevel_source else MAX_MIDTONE_RATIO
+    if _histogram_ratio(gray.histogram(), *MIDTONE_RANGE) <= limit:
+        return "bilevel"
+    return "gray"
+
+
+def encode_g4(bw):
+    """(raw CCITT G4 data, BlackIs1) of a mode "1" image, or None without libtiff."""
+    from PIL import Image
+    buf = io.BytesIO()
+    try:
+        bw.save(buf, "TIFF", compression="group4", strip_size=1 << 30)
+        tif = Image.open(io.BytesIO(buf.getvalue()))
+        offsets, counts = tif.tag_v2[273], tif.tag_v2[279]
+    except Exception:
+        return None
+    if len(offsets) != 1:
+        return None # Several strips cannot be joined into one G4 stream
+    data = buf.getvalue()[offsets[0]:offsets[0] + counts[0]]
+    return data, tif.tag_v2.get(262, 0) == 1
+
+
+def encode(img, bilevel_source=False):
+    """
+    Encodes an RGB PIL image with the encoder suited to its content.
+    Returns (kind, data, extra): extra is (width, height, black_is_1) for "ccitt".
+    """
+    kind = classify(img, bilevel_source)
+    buf = io.BytesIO()
+    if kind == "bilevel":
+        bw = img.convert("L").point(lambda v: 255 if v >= 128 else 0, "1")
+        g4 = encode_g4(bw)
+        if g4:
+            return "ccitt", g4[0], (bw.width, bw.height, g4[1])
+        bw.save(buf, "PNG", optimize=True)
+        return "image", buf.getvalue(), None
+    if kind == "gray":
+        img = img.convert("L")
+    img.save(buf, "JPEG", quality=JPEG_QUALITY)
+    return "image", buf.getvalue(), None
+
+
+def render_page(n, dpi):
+    """Renders and encodes page n of the worker's document: (n, width_pt, height_pt, kind, data, extra)."""
+    from PIL import Image
+    page = _doc[n]
+    images = page.get_images(full=True)
+    bilevel_source = bool(images) and all(info[4] == 1 for info in images)
+    pix = page.get_pixmap(dpi=dpi, alpha=False)
+    img = Image.frombytes("RGB", (pix.width, pix.height), pix.samples)
+    del pix
+    kind, data, extra = encode(img, bilevel_source)
+    return n, page.rect.width, page.rect.height, kind, data, extra
+
+
+class StreamingWriter:
+    """Appends encoded pages to a PDF on disk; every FLUSH_PAGES pages the file is saved and reopened."""
+
+    def __init__(self, path):
+        import fitz
+        self._fitz = fitz
+        self.path = path
+        self.doc = fitz.open()
+        self.on_disk = False
+        self.pending = 0
+
+    def add(self, width, height, kind, data, extra, overlay=None):
+        """Appends a page showing the encoded image; overlay(page) may draw on top before it is flushed."""
+        page = self.doc.new_page(width=width, height=height)
+        if kind == "ccitt":
+            w, h, black_is_1 = extra
+            xref = self.doc.get_new_xref()
+            self.doc.update_object(xref, f"<</Type/XObject/Subtype/Image/Width {w}/Height {h}"
+                                         "/BitsPerComponent 1/ColorSpace/DeviceGray>>")
+            # update_stream() resets /Filter, so the filter keys are set afterwards
+            self.doc.update_stream(xref, data, compress=False)
+            self.doc.xref_set_key(xref, "Filter", "/CCITTFaxDecode")
+            self.doc.xref_set_key(xref, "DecodeParms", f"<</K -1/Columns {w}/Rows {h}"
+                                                       f"/BlackIs1 {'true' if black_is_1 else 'false'}>>")
+            page.insert_image(page.rect, xref=xref)
+        else:
+            page.insert_image(page.rect, stream=data)
+        if overlay:
+            overlay(page)
+        self.pending += 1
+        if self.pending >= FLUSH_PAGES:
+            self.flush()
+
+    def flush(self):
+        if not self.pending:
+            return
+        # deflate: images MuPDF decoded (PNG) are stored uncompressed until saved
+        if self.on_disk:
+            self.doc.save(self.path, incremental=True, encryption=self._fitz.PDF_ENCRYPT_KEEP, deflate=True)
+        else:
+            self.doc.save(self.path, deflate=True)
+            self.on_disk = True
+        # Reopening drops the pages just written from MuPDF's object cache
+        self.doc.close()
+        self.doc = self._fitz.open(self.path)
+        self.pending = 0
+
+    def close(self):
+        try:
+            self.flush()
+        finally:
+            self.doc.close()
+
+
+def _run_serial(input_path, page_dpis, writer, cancelled):
+    _init_worker(input_path)
+    try:
+        for n, dpi in enumerate(page_dpis):
+            if cancelled and cancelled():
+                return False
+            writer.add(*render_page(n, dpi)[1:])
+        return True
+    finally:
+        _doc.close()
+
+
+def _run_pool(input_path, page_dpis, writer, workers, cancelled):
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+    # spawn: forking a process that runs Tk and worker threads is not safe
+    executor = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"),
+                                   initializer=_init_worker, initargs=(input_path,))
+    futures = {}
+    try:
+        submitted = 0
+        for n in range(len(page_dpis)):
+            while submitted < len(page_dpis) and submitted < n + workers * IN_FLIGHT_PER_WORKER:
+                futures[submitted] = executor.submit(render_page, submitted, page_dpis[submitted])
+                submitted += 1
+            if cancelled and cancelled():
+                return False
+            writer.add(*futures.pop(n).result()[1:])
+        return True
+    finally:
+        for future in futures.values():
+            future.cancel()
+        executor.shutdown(wait=True)
+
+
+def sanitize(input_path, output_path, page_dpis, workers=1, cancelled=None):
+    """
+    Writes output_path with page n of input_path rendered at page_dpis[n].
+    Returns False if cancelled() turned true (the partial output is removed by the caller).
+    """
+    writer = StreamingWriter(output_path)
+    try:
+        if workers > 1 and len(page_dpis) > 1:
+            try:
+                return _run_pool(input_path, page_dpis, writer, workers, cancelled)
+            except (OSError, RuntimeError) as e:
+                # BrokenProcessPool is a RuntimeError; no usable process pool (e.g. frozen build)
+                if writer.on_disk or writer.pending:
+                    raise
+                logging.warning(f"Sanitize process pool unavailable, rendering in-process: {e}")
+        return _run_serial(input_path, page_dpis, writer, cancelled)
+    finally:
+        writer.close()
@@ -0,0 +1,146 @@
+"""
+Script Detect - Chooses the Tesseract languages per page from the scripts on it.
+
+Tesseract's cost grows with every language in `-l`, yet the user's selection
+(e.g. `eng+ben`) is applied to every page. A low-resolution OSD pass
+(`--psm 0 -l osd`) reports each page's dominant script; a page is then OCRed only
+with the selected languages written in that script. The selection always stays the
+allowed superset, and pages with an uncertain or unknown script keep all of it.
+
+Pages in a non-Latin script keep the selected Latin languages as well: Bengali (and
+most other) documents routinely carry English words, names and numbers.
+
+OSD only reports the dominant script, so a narrowed page may still hold a passage in
+another selected script. The engine reads such a page again with the full selection
+when needs_full_selection() says so: its mean word confidence is below the two-pass
+threshold, or its text has letters of a script the narrowed languages do not cover.
+"""
+import re
+import unicodedata
+
+OSD_DPI = 150
+MIN_SCRIPT_CONFIDENCE = 1.5  # Tesseract's script confidence; below this the page keeps every language
+
+# Script as reported by Tesseract OSD for each language pack (packs not listed keep every page)
+LANG_SCRIPT = {
+    "eng": "Latin", "fra": "Latin", "deu": "Latin", "spa": "Latin", "ita": "Latin",
+    "por": "Latin", "nld": "Latin", "pol": "Latin", "tur": "Latin", "vie": "Latin",
+    "ind": "Latin", "msa": "Latin", "swe": "Latin", "nor": "Latin", "dan": "Latin",
+    "fin": "Latin", "ces": "Latin", "ron": "Latin", "hun": "Latin", "lat": "Latin",
+    "ben": "Bengali", "asm": "Bengali",
+    "hin": "Devanagari", "mar": "Devanagari", "nep": "Devanagari", "san": "Devanagari",
+    "ara": "Arabic", "urd": "Arabic", "fas": "Arabic", "pus": "Arabic",
+    "rus": "Cyrillic", "ukr": "Cyrillic", "bul": "Cyrillic", "srp": "Cyrillic",
+    "ell": "Greek", "heb": "Hebrew", "tha": "Thai",
+    "tam": "Tamil", "tel": "Telugu", "kan": "Kannada", "mal": "Malayalam",
+    "guj": "Gujarati", "pan": "Gurmukhi", "ori": "Oriya", "sin": "Sinhala",
+    "chi_sim": "Han", "chi_tra": "Han", "jpn": "Japanese", "kor": "Hangul",
+}
+
+# Unicode character name prefixes of each script, where they differ from its upper-cased name
+SCRIPT_LETTER_NAMES = {
+    "Han": ("CJK",),
+    "Japanese": ("CJK", "HIRAGANA", "KATAKANA"),
+}
+
+_PAGE_RE = re.compile(r"Page number:\s*(\d+)")
+_SCRIPT_RE = re.compile(r"Script:\s*(\S+)")
+_CONF_RE = re.compile(r"Script confidence:\s*([\d.]+)")
+_ORIENT_RE = re.compile(r"Orientation in degrees:\s*(\d+)")
+_ORIENT_CONF_RE = re.compile(r"Orientation confidence:\s*([\d.]+)")
+
+
+def split_osd(text):
+    """Splits Tesseract OSD output into {page_index: block of that page}."""
+    blocks = _PAGE_RE.split(text)
+    # split() yields [prefix, page, block, page, block, ...]
+    return {int(blocks[i]): blocks[i + 1] for i in range(1, len(blocks) - 1, 2)}
+
+
+def osd_script(block):
+    """(script, confidence) of one page's OSD block, or None."""
+    script = _SCRIPT_RE.search(block)
+    if not script:
+        return None
+    conf = _CONF_RE.search(block)
+    return script.group(1), float(conf.group(1)) if conf else 0.0
+
+
+def osd_orientation(block):
+    """
+    (degrees, confidence) of one page's OSD block, or None. Like ocrmypdf, the degrees
+    are the counter-clockwise turn that makes the page upright.
+    """
+    orient = _ORIENT_RE.search(block)
+    if not orient:
+        return None
+    conf = _ORIENT_CONF_RE.search(block)
+    return int(orient.group(1)) % 360, float(conf.group(1)) if conf else 0.0
+
+
+def parse_osd(text):
+    """Parses Tesseract OSD output (one block per page) into {page_index: (script, confidence)}."""
+    result = {}
+    for page, block in split_osd(text).items():
+        found = osd_script(block)
+        if found:
+            result[page] = found
+    return result
+
+
+def is_worthwhile(lang):
+    """Detection only pays off when the selection spans more than one script."""
+    scripts = {LANG_SCRIPT.get(code) for code in lang.split("+") if code}
+    return len(scripts) > 1
+
+
+def languages_for_page(lang, script, confidence):
+    """The `-l` string for a page with the given dominant script (a subset of `lang`)."""
+    selected = [code for code in lang.split("+") if code]
+    if not script or confidence < MIN_SCRIPT_CONFIDENCE:
+        return lang
+    if not any(LANG_SCRIPT.get(code) == script for code in selected):
+        return lang # Script not covered by the selection: let Tesseract try everything
+    keep = [code for code in selected if LANG_SCRIPT.get(code) in (script, "Latin", None)]
+    return "+".join(keep)
+
+
+def _letter_prefixes(page_lang):
+    """Character name prefixes of the scripts page_lang covers, or None if it covers an unknown one."""
+    prefixes = set()
+    for code in page_lang.split("+"):
+        script = LANG_SCRIPT.get(code)
+        if script is None:
+            return None
+        prefixes.update(SCRIPT_LETTER_NAMES.get(script, (script.upper(),)))
+    return prefixes
+
+
+def has_other_script(text, page_lang):
+    """True if text has letters of a script none of page_lang's languages is written in."""
+    prefixes = _letter_prefixes(page_lang)
+    if prefixes is None:
+        return False
+    for ch in set(text):
+        if ch.isalpha() and unicodedata.name(ch, "").split(" ", 1)[0] not in prefixes:
+            return True
+    return False
+
+
+def needs_full_selection(lang, page_lang, confidence, text, threshold):
+    """
+    Whether a page OCRed with the narrowed page_lang must be read again with all of lang:
+    a low (or unknown) mean word confidence, or letters from outside page_lang's scripts.
+    """
+    if page_lang == lang:
+        return False
+    return confidence is None or confidence < threshold or has_other_script(text, page_lang)
+
+
+def plan_page_languages(lang, detections, page_count):
+    """Per-page `-l` strings from parse_osd() results; undetected pages keep the full selection."""
+    plan = []
+    for i in range(page_count):
+        script, conf = detections.get(i, (None, 0.0))
+        plan.append(languages_for_page(lang, script, conf))
+    return plan
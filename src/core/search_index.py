@@ -0,0 +1,226 @@
+"""
+Search Index - Embedded full-text index over OCR output (SQLite FTS5).
+
+run_ocr feeds every page's text here as the sidecar is written (see sidecar.py), so
+`search_index.search("...")` returns page-level hits across all processed documents,
+linked back to their history entries.
+
+Tokenisation: unicode61 treats Bengali vowel signs/virama as separators (and its
+diacritic folding would strip them), so the whole Bengali block plus ZWJ/ZWNJ is
+declared as token characters; Latin text keeps case and diacritic folding.
+"""
+import os
+import time
+import sqlite3
+import logging
+import threading
+
+SCHEMA_VERSION = 1
+DB_NAME = "search.db"
+COMMIT_EVERY = 50  # pages
+
+_BENGALI_TOKENCHARS = "".join(chr(c) for c in range(0x0980, 0x0A00)) + "‌‍"
+TOKENIZER = f"unicode61 remove_diacritics 2 tokenchars '{_BENGALI_TOKENCHARS}'"
+
+
+def build_match_query(text):
+    """Turns free user input into an FTS5 query: all terms required, last one as prefix."""
+    terms = [t for t in text.replace('"', " ").split() if t]
+    if not terms:
+        return None
+    parts = [f'"{t}"' for t in terms]
+    parts[-1] += "*"
+    return " ".join(parts)
+
+
+class DocumentIndexer:
+    """Receives one document's pages (0-based) while OCR runs. Use finish() or abort()."""
+
+    def __init__(self, index, doc_id):
+        self.index = index
+        self.doc_id = doc_id
+        self._pending = 0
+
+    def add_page(self, page, text):
+        self.index._add_page(self.doc_id, page, text)
+        self._pending += 1
+        if self._pending >= COMMIT_EVERY:
+            self.index._commit()
+            self._pending = 0
+
+    __call__ = add_page  # Usable directly as a SidecarWriter on_page hook
+
+    def finish(self):
+        self.index._commit()
+
+    def abort(self):
+        self.index.remove_document_id(self.doc_id)
+
+
+class SearchIndex:
+    """Process-wide FTS index. All access is serialised through one connection."""
+
+    def __init__(self, db_path=None):
+        self._db_path = db_path
+        self._conn = None
+        self._lock = threading.RLock()
+        self.fts = True
+
+    # ==================== CONNECTION ====================
+
+    def _connect(self):
+        if self._conn is not None:
+            return self._conn
+        if not self._db_path:
+            from . import platform_utils
+            self._db_path = os.path.join(platform_utils.get_app_data_dir(), DB_NAME)
+        conn = sqlite3.connect(self._db_path, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("""CREATE TABLE IF NOT EXISTS documents (
+            id INTEGER PRIMARY KEY, path TEXT UNIQUE, source_path TEXT,
+            filename TEXT, indexed_at REAL)""")
+        try:
+            conn.execute(f"""CREATE VIRTUAL TABLE IF NOT EXISTS pages USING fts5(
+                text, doc_id UNINDEXED, page UNINDEXED, tokenize="{TOKENIZER}")""")
+        except sqlite3.OperationalError as e:
+            # SQLite built without FTS5: plain table + LIKE (slower, still page-level)
+            logging.warning(f"FTS5 unavailable ({e}). Falling back to LIKE search.")
+            self.fts = False
+            conn.execute("CREATE TABLE IF NOT EXISTS pages_plain (doc_id INTEGER, page INTEGER, text TEXT)")
+            conn.execute("CREATE INDEX IF NOT EXISTS pages_plain_doc ON pages_plain(doc_id)")
+        conn.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+        conn.commit()
+        self._conn = conn
+        return conn
+
+    def _commit(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.commit()
+
+    # ==================== WRITING ====================
+
+    def begin_document(self, path, source_path=None, filename=None):
+        """Registers `path` (replacing any previous index of it) and returns its DocumentIndexer."""
+        path = os.path.abspath(path)
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute("SELECT id FROM documents WHERE path=?", (path,)).fetchone()
+            if row:
+                self._delete_pages(conn, row[0])
+                conn.execute("UPDATE documents SET source_path=?, filename=?, indexed_at=? WHERE id=?",
+                             (source_path, filename, time.time(), row[0]))
+                doc_id = row[0]
+            else:
+                cur = conn.execute("INSERT INTO documents (path, source_path, filename, indexed_at) VALUES (?, ?, ?, ?)",
+                                   (path, source_path, filename, time.time()))
+                doc_id = cur.lastrowid
+            conn.commit()
+        return DocumentIndexer(self, doc_id)
+
+    def _add_page(self, doc_id, page, text):
+        if not text or not text.strip():
+            return
+        with self._lock:
+            conn = self._connect()
+            table = "pages" if self.fts else "pages_plain"
+            conn.execute(f"INSERT INTO {table} (text, doc_id, page) VALUES (?, ?, ?)", (text, doc_id, page))
+
+    def _delete_pages(self, conn, doc_id):
+        table = "pages" if self.fts else "pages_plain"
+        conn.execute(f"DELETE FROM {table} WHERE doc_id=?", (doc_id,))
+
+    def remove_document_id(self, doc_id):
+        with self._lock:
+            conn = self._connect()
+            self._delete_pages(conn, doc_id)
+            conn.execute("DELETE FROM documents WHERE id=?", (doc_id,))
+            conn.commit()
+
+    def remove_document(self, path):
+        with self._lock:
+            row = self._connect().execute("SELECT id FROM documents WHERE path=?", (os.path.abspath(path),)).fetchone()
+        if row:
+            self.remove_document_id(row[0])
+
+    def rename_document(self, old_path, new_path):
+        """Points an indexed document at its new location (e.g. after 'Save PDF')."""
+        old_path, new_path = os.path.abspath(old_path), os.path.abspath(new_path)
+        if old_path == new_path:
+            return
+        try:
+            with self._lock:
+                conn = self._connect()
+                row = conn.execute("SELECT id FROM documents WHERE path=?", (old_path,)).fetchone()
+                if not row:
+                    return
+                # A previous index of the target path is superseded
+                self.remove_document(new_path)
+                conn.execute("UPDATE documents SET path=? WHERE id=?", (new_path, row[0]))
+                conn.commit()
+        except Exception as e:
+            logging.warning(f"Search index rename failed: {e}")
+
+    def clear(self):
+        with self._lock:
+            conn = self._connect()
+            conn.execute("DELETE FROM documents")
+            conn.execute("DELETE FROM pages" if self.fts else "DELETE FROM pages_plain")
+            conn.commit()
+
+    # ==================== SEARCH ====================
+
+    def search(self, text, limit=100):
+        """
+        Returns page-level hits, best first:
+        [{"path", "source_path", "filename", "page" (1-based), "snippet", "history_index"}]
+        """
+        with self._lock:
+            conn = self._connect()
+            if self.fts:
+                query = build_match_query(text)
+                if not query:
+                    return []
+                try:
+                    rows = conn.execute("""
+                        SELECT d.path, d.source_path, d.filename, p.page,
+                               snippet(pages, 0, '[', ']', '...', 12)
+                        FROM pages p JOIN documents d ON d.id = p.doc_id
+                        WHERE pages MATCH ? ORDER BY rank LIMIT ?""", (query, limit)).fetchall()
+                except sqlite3.OperationalError as e:
+                    logging.debug(f"Search query failed: {e}")
+                    return []
+            else:
+                needle = text.strip()
+                if not needle:
+                    return []
+                rows = conn.execute("""
+                    SELECT d.path, d.source_path, d.filename, p.page, substr(p.text, 1, 120)
+                    FROM pages_plain p JOIN documents d ON d.id = p.doc_id
+                    WHERE p.text LIKE ? LIMIT ?""", (f"%{needle}%", limit)).fetchall()
+
+        results = [{"path": r[0], "source_path": r[1], "filename": r[2], "page": int(r[3]) + 1,
+                    "snippet": " ".join((r[4] or "").split())} for r in rows]
+        self._link_history(results)
+        return results
+
+    def _link_history(self, results):
+        """Adds the index of the matching history entry (by output path, else source path)."""
+        from .history_manager import history
+        by_output, by_source = {}, {}
+        for i, entry in enumerate(history.get_all()):
+            out = entry.get("output_path")
+            src = entry.get("source_path")
+            if out:
+                by_output.setdefault(os.path.abspath(out), i)
+            if src:
+                by_source.setdefault(os.path.abspath(src), i)
+        for r in results:
+            idx = by_output.get(r["path"])
+            if idx is None and r["source_path"]:
+                idx = by_source.get(os.path.abspath(r["source_path"]))
+            r["history_index"] = idx
+
+
+search_index = SearchIndex()
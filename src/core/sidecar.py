@@ -0,0 +1,191 @@
+"""
+Sidecar - Streams OCR sidecar text to disk page by page with a per-page offset index.
+
+Next to every sidecar `<name>.txt` an index `<name>.txt.idx` is written:
+
+    magic  b"BOCRIDX1"
+    uint32 page count (little-endian)
+    page count x (uint64 start, uint64 end)   byte range of each page's UTF-8 text
+
+so any page's text can be read with one seek, without loading the whole file.
+"""
+import os
+import sys
+import struct
+import logging
+from array import array
+
+INDEX_MAGIC = b"BOCRIDX1"
+INDEX_SUFFIX = ".idx"
+PAGE_SEPARATOR = "\f"   # Same page separator ocrmypdf uses in its sidecar
+
+
+def index_path(txt_path):
+    return txt_path + INDEX_SUFFIX
+
+
+def _write_index(txt_path, ranges):
+    """ranges: array('Q') of start/end pairs."""
+    path = index_path(txt_path)
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(INDEX_MAGIC)
+        f.write(struct.pack("<I", len(ranges) // 2))
+        if sys.byteorder != "little":
+            ranges = array("Q", ranges)
+            ranges.byteswap()
+        ranges.tofile(f)
+    os.replace(tmp, path)
+
+
+class SidecarWriter:
+    """
+    Writes sidecar text one page at a time and records each page's byte range.
+    `on_page(page_index, text)` is called after every page (e.g. to feed a search index).
+    """
+
+    def __init__(self, txt_path, separator=PAGE_SEPARATOR, on_page=None):
+        self.txt_path = txt_path
+        self.separator = separator.encode("utf-8")
+        self.on_page = on_page
+        self._ranges = array("Q")
+        self._pos = 0
+        self._f = open(txt_path, "wb")
+
+    def write_page(self, text):
+        data = (text or "").encode("utf-8", errors="replace")
+        start = self._pos
+        self._f.write(data)
+        self._f.write(self.separator)
+        self._pos += len(data) + len(self.separator)
+        self._ranges.append(start)
+        self._ranges.append(start + len(data))
+        if self.on_page:
+            try:
+                self.on_page(len(self._ranges) // 2 - 1, text or "")
+            except Exception as e:
+                logging.debug(f"Sidecar page hook failed: {e}")
+
+    @property
+    def page_count(self):
+        return len(self._ranges) // 2
+
+    def close(self):
+        if self._f is None:
+            return
+        self._f.close()
+        self._f = None
+        try:
+            _write_index(self.txt_path, self._ranges)
+        except Exception as e:
+            logging.warning(f"Failed to write sidecar index: {e}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+
+def iter_text_pages(txt_path, separator=PAGE_SEPARATOR, block=1024 * 1024):
+    """Yields the pages of an existing separator-delimited sidecar, reading it in blocks."""
+    sep = separator.encode("utf-8")
+    buf = b""
+    with open(txt_path, "rb") as f:
+        while True:
+            chunk = f.read(block)
+            if not chunk:
+                break
+            buf += chunk
+            parts = buf.split(sep)
+            buf = parts.pop()
+            for part in parts:
+                yield part.decode("utf-8", errors="replace")
+    if buf.strip():
+        yield buf.decode("utf-8", errors="replace")
+
+
+def build_index(txt_path, separator=PAGE_SEPARATOR, on_page=None):
+    """
+    Creates the index for a sidecar written by another tool (ocrmypdf --sidecar),
+    where pages are separated by form feeds. Returns the page count.
+    """
+    sep = separator.encode("utf-8")
+    ranges = array("Q")
+    pos = 0
+    page = 0
+    buf = b""
+    buf_start = 0
+    with open(txt_path, "rb") as f:
+        while True:
+            chunk = f.read(1024 * 1024)
+            if not chunk:
+                break
+            buf += chunk
+            while True:
+                cut = buf.find(sep)
+                if cut < 0:
+                    break
+                ranges.append(buf_start)
+                ranges.append(buf_start + cut)
+                if on_page:
+                    on_page(page, buf[:cut].decode("utf-8", errors="replace"))
+                page += 1
+                buf = buf[cut + len(sep):]
+                buf_start += cut + len(sep)
+            pos = buf_start + len(buf)
+    if buf.strip():
+        ranges.append(buf_start)
+        ranges.append(pos)
+        if on_page:
+            on_page(page, buf.decode("utf-8", errors="replace"))
+    _write_index(txt_path, ranges)
+    return len(ranges) // 2
+
+
+class SidecarReader:
+    """Random access to the pages of an indexed sidecar."""
+
+    def __init__(self, txt_path):
+        self.txt_path = txt_path
+        with open(index_path(txt_path), "rb") as f:
+            if f.read(len(INDEX_MAGIC)) != INDEX_MAGIC:
+                raise ValueError("Not a sidecar index")
+            (count,) = struct.unpack("<I", f.read(4))
+            data = f.read(count * 16)
+        if len(data) != count * 16:
+            raise ValueError("Truncated sidecar index")
+        self._ranges = struct.unpack(f"<{count * 2}Q", data)
+        self.page_count = count
+
+    def get_page(self, index):
+        if not 0 <= index < self.page_count:
+            return ""
+        start, end = self._ranges[index * 2], self._ranges[index * 2 + 1]
+        with open(self.txt_path, "rb") as f:
+            f.seek(start)
+            return f.read(end - start).decode("utf-8", errors="replace")
+
+
+def open_reader(txt_path, expected_pages=None):
+    """Returns a SidecarReader if an up-to-date index exists for txt_path, else None."""
+    try:
+        idx = index_path(txt_path)
+        if not os.path.exists(txt_path) or not os.path.exists(idx):
+            return None
+        if os.path.getmtime(idx) < os.path.getmtime(txt_path):
+            return None # Text rewritten after the index
+        reader = SidecarReader(txt_path)
+        if expected_pages is not None and reader.page_count != expected_pages:
+            return None
+        return reader
+    except Exception:
+        return None
+
+
+def open_reader_for_pdf(pdf_path, expected_pages=None):
+    """Looks for `<pdf>.txt` (as written by run_ocr) next to a PDF."""
+    if not pdf_path or not pdf_path.endswith(".pdf"):
+        return None
+    return open_reader(pdf_path.replace(".pdf", ".txt"), expected_pages)
@@ -0,0 +1,62 @@
+"""
+Startup Profile - Lightweight timing marks for the launch sequence.
+
+run.py and the main window record phases here; the breakdown is logged once the
+first window is shown and printed to stdout when BIPLOB_OCR_STARTUP_PROFILE=1.
+"""
+import os
+import time
+import logging
+from contextlib import contextmanager
+
+_T0 = time.perf_counter()
+_phases = []        # [(label, seconds)]
+_last = _T0
+_reported = False
+
+
+def mark(label):
+    """Records the time elapsed since the previous mark under `label`."""
+    global _last
+    now = time.perf_counter()
+    _phases.append((label, now - _last))
+    _last = now
+
+
+@contextmanager
+def timed(label):
+    """Records the duration of the wrapped block under `label` (independent of marks)."""
+    global _last
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        end = time.perf_counter()
+        _phases.append((label, end - start))
+        _last = end
+
+
+def elapsed():
+    return time.perf_counter() - _T0
+
+
+def get_breakdown():
+    return list(_phases)
+
+
+def report():
+    """Logs (and optionally prints) the startup breakdown. Only the first call reports."""
+    global _reported
+    if _reported:
+        return
+    _reported = True
+
+    total = elapsed()
+    lines = [f"Startup breakdown (time-to-first-window {total * 1000:.0f} ms):"]
+    for label, secs in _phases:
+        lines.append(f"  {secs * 1000:8.1f} ms  {label}")
+    text = "\n".join(lines)
+
+    logging.info(text)
+    if os.environ.get("BIPLOB_OCR_STARTUP_PROFILE"):
+        print(text)
@@ -0,0 +1,412 @@
+"""
+Tess Pool - Long-lived Tesseract page workers with the language models loaded once.
+
+A pool is one server process (started like ocr_worker.py, talking JSON lines over
+stdin/stdout) that loads libtesseract through ctypes and initialises the requested
+languages. On POSIX the server then forks its workers, so every worker shares the
+loaded model memory copy-on-write; on Windows (no fork) each worker thread owns its
+own API instance, still loaded once per pool instead of once per page/job.
+
+    -> {"id": 7, "image": "/tmp/.../page_3.png", "out": "/tmp/.../part_3", "hocr": true}
+    <- {"event": "result", "id": 7, "ok": true}
+
+Each page produces `<out>.pdf` (text-only layer) and optionally `<out>.hocr`, exactly
+what the tesseract CLI writes for a single image. Pools are kept per language set and
+shut down after IDLE_TIMEOUT seconds without work.
+
+Needs a shared libtesseract (bundled DLL on Windows, system library elsewhere); the
+static Linux CLI bundle has none, in which case get_pool() returns None and callers
+fall back to the CLI.
+"""
+import os
+import sys
+import json
+import queue
+import ctypes
+import ctypes.util
+import logging
+import threading
+import subprocess
+
+IDLE_TIMEOUT = 300
+MAX_POOLS = 2
+
+
+# ==================== libtesseract (ctypes) ====================
+
+def find_library():
+    """Path/name of a usable shared libtesseract, or None."""
+    try:
+        from . import platform_utils
+        base_dir = platform_utils.get_base_dir()
+        bundled_dir = os.path.join(base_dir, "tesseract", platform_utils.get_tesseract_dir_name())
+        if os.path.isdir(bundled_dir):
+            for name in sorted(os.listdir(bundled_dir)):
+                if name.startswith("libtesseract") and (name.endswith(".dll") or ".so" in name or name.endswith(".dylib")):
+                    return os.path.join(bundled_dir, name)
+    except Exception:
+        pass
+    return ctypes.util.find_library("tesseract")
+
+
+class _CApi:
+    """The few libtesseract C API calls needed to OCR one image into PDF/hOCR renderers."""
+
+    def __init__(self, lib_path):
+        if os.name == 'nt' and os.path.isabs(lib_path):
+            os.add_dll_directory(os.path.dirname(lib_path))
+        lib = ctypes.CDLL(lib_path)
+        p, c, i = ctypes.c_void_p, ctypes.c_char_p, ctypes.c_int
+        for name, restype, argtypes in (
+            ("TessBaseAPICreate", p, []),
+            ("TessBaseAPIInit3", i, [p, c, c]),
+            ("TessBaseAPIGetDatapath", c, [p]),
+            ("TessBaseAPIProcessPages", i, [p, c, c, i, p]),
+            ("TessBaseAPIDelete", None, [p]),
+            ("TessPDFRendererCreate", p, [c, c, i]),
+            ("TessHOcrRendererCreate", p, [c]),
+            ("TessResultRendererInsert", None, [p, p]),
+            ("TessDeleteResultRenderer", None, [p]),
+        ):
+            fn = getattr(lib, name)
+            fn.restype = restype
+            fn.argtypes = argtypes
+        self.lib = lib
+
+    def create(self, lang):
+        """Creates an API instance and loads the models for `lang` (TESSDATA_PREFIX decides where from)."""
+        api = self.lib.TessBaseAPICreate()
+        if self.lib.TessBaseAPIInit3(api, None, lang.encode("utf-8")) != 0:
+            self.lib.TessBaseAPIDelete(api)
+            raise RuntimeError(f"Could not load Tesseract models for '{lang}'")
+        return api
+
+    def ocr_image(self, api, image, out_base, hocr):
+        datapath = self.lib.TessBaseAPIGetDatapath(api)
+        renderer = self.lib.TessPDFRendererCreate(out_base.encode("utf-8"), datapath, 1)
+        if not renderer:
+            raise RuntimeError("Could not create PDF renderer")
+        try:
+            if hocr:
+                self.lib.TessResultRendererInsert(renderer, self.lib.TessHOcrRendererCreate(out_base.encode("utf-8")))
+            # ctypes releases the GIL for the duration of the call
+            if not self.lib.TessBaseAPIProcessPages(api, image.encode("utf-8"), None, 0, renderer):
+                raise RuntimeError(f"Tesseract failed on {os.path.basename(image)}")
+        finally:
+            self.lib.TessDeleteResultRenderer(renderer) # Deletes the whole renderer chain
+
+
+# ==================== SERVER SIDE ====================
+
+def _run_task(capi, api, task):
+    try:
+        capi.ocr_image(api, task["image"], task["out"], task.get("hocr", False))
+        return {"event": "result", "id": task["id"], "ok": True}
+    except Exception as e:
+        return {"event": "result", "id": task["id"], "ok": False, "error": str(e)}
+
+
+def _forked_worker(capi, api, task_fd, result_fd):
+    """Child process: models already in (shared) memory; serve tasks from the pipe."""
+    with os.fdopen(task_fd, "r", encoding="utf-8") as tasks, os.fdopen(result_fd, "w", encoding="utf-8") as results:
+        for line in tasks:
+            results.write(json.dumps(_run_task(capi, api, json.loads(line))) + "\n")
+            results.flush()
+
+
+def _serve(lib_path, lang, workers):
+    out = os.fdopen(os.dup(1), "w", encoding="utf-8")
+    os.dup2(2, 1)
+    sys.stdout = sys.stderr
+    out_lock = threading.Lock()
+
+    def emit(msg):
+        with out_lock:
+            out.write(json.dumps(msg) + "\n")
+            out.flush()
+
+    try:
+        capi = _CApi(lib_path)
+        api = capi.create(lang)
+    except Exception as e:
+        emit({"event": "unavailable", "error": str(e)})
+        return
+
+    # Each slot forwards tasks to one worker: a forked child sharing `api`'s models,
+    # or (no fork) the slot thread itself with its own API instance.
+    tasks = queue.Queue()
+    slots = []
+    children = []
+    if hasattr(os, "fork"):
+        parent_fds = []
+        for _ in range(workers):
+            task_r, task_w = os.pipe()
+            result_r, result_w = os.pipe()
+            pid = os.fork()
+            if pid == 0:
+                # Drop every parent-side pipe end, or siblings would never see EOF
+                for fd in parent_fds + [task_w, result_r]:
+                    os.close(fd)
+                try:
+                    _forked_worker(capi, api, task_r, result_w)
+                finally:
+                    os._exit(0)
+            children.append(pid)
+            os.close(task_r)
+            os.close(result_w)
+            parent_fds += [task_w, result_r]
+            slots.append((os.fdopen(task_w, "w", encoding="utf-8"), os.fdopen(result_r, "r", encoding="utf-8")))
+    else:
+        slots = [None] * workers
+
+    def slot_loop(index, slot):
+        own_api = api if index == 0 or slot is not None else capi.create(lang)
+        while True:
+            task = tasks.get()
+            if task is None:
+                break
+            if slot is None:
+                emit(_run_task(capi, own_api, task))
+                continue
+            send, receive = slot
+            send.write(json.dumps(task) + "\n")
+            send.flush()
+            line = receive.readline()
+            emit(json.loads(line) if line else {"event": "result", "id": task["id"], "ok": False, "error": "worker died"})
+
+    threads = [threading.Thread(target=slot_loop, args=(n, slot), daemon=True) for n, slot in enumerate(slots)]
+    for t in threads:
+        t.start()
+    emit({"event": "ready", "workers": workers})
+
+    while True:
+        line = sys.stdin.readline()
+        if not line:
+            break
+        try:
+            msg = json.loads(line)
+        except ValueError:
+            continue
+        if msg.get("cmd") == "quit":
+            break
+        tasks.put(msg)
+
+    for _ in threads:
+        tasks.put(None)
+    for t in threads:
+        t.join(timeout=5)
+    for slot in slots:
+        if slot is not None:
+            slot[0].close() # EOF ends the forked worker
+    for pid in children:
+        try: os.waitpid(pid, 0)
+        except OSError: pass
+
+
+# ==================== CLIENT SIDE ====================
+
+class TessPool:
+    """Client of one pool server. Thread-safe: concurrent documents can share it."""
+
+    def __init__(self, python, lib_path, lang, workers, env):
+        self.lang = lang
+        self.workers = workers
+        self._lock = threading.Lock()
+        self._next_id = 0
+        self._pending = {}      # id -> callback(ok, error)
+        self._busy = 0
+        self._idle_timer = None
+
+        script = os.path.abspath(__file__)
+        if not script.endswith(".py") or not os.path.exists(script):
+            raise RuntimeError("Pool script not available as a file (frozen build)")
+        kwargs = {"stdin": subprocess.PIPE, "stdout": subprocess.PIPE, "stderr": subprocess.DEVNULL,
+                  "env": env, "text": True, "encoding": "utf-8", "bufsize": 1}
+        if os.name == 'posix':
+            kwargs["start_new_session"] = True
+        else:
+            from . import platform_utils
+            kwargs["creationflags"] = platform_utils.get_subprocess_creation_flags()
+            kwargs["startupinfo"] = platform_utils.get_subprocess_startup_info()
+        self.proc = subprocess.Popen([python, script, lib_path, lang, str(workers)], **kwargs)
+
+        hello = self._read()
+        if not hello or hello.get("event") != "ready":
+            self.close()
+            raise RuntimeError((hello or {}).get("error") or "Tesseract pool did not start")
+        self._reader = threading.Thread(target=self._read_loop, name="tess-pool-reader", daemon=True)
+        self._reader.start()
+
+    def _read(self):
+        while True:
+            line = self.proc.stdout.readline()
+            if not line:
+                return None
+            try:
+                return json.loads(line)
+            except ValueError:
+                continue
+
+    def _read_loop(self):
+        while True:
+            msg = self._read()
+            if msg is None:
+                break
+            with self._lock:
+                callback = self._pending.pop(msg.get("id"), None)
+            if callback:
+                callback(msg.get("ok", False), msg.get("error"))
+        # Server gone (cancelled/crashed): fail everything still waiting
+        with self._lock:
+            waiting, self._pending = list(self._pending.values()), {}
+        for callback in waiting:
+            callback(False, "Tesseract pool exited")
+
+    def is_alive(self):
+        return self.proc.poll() is None
+
+    def ocr_pages(self, images, out_dir, hocr=False, on_page=None):
+        """
+        OCRs image files on the pool. Returns the output bases (`<base>.pdf`, `<base>.hocr`)
+        in input order. on_page(done_count) is called as pages finish (from the reader thread).
+        Raises RuntimeError if any page failed.
+        """
+        done = threading.Event()
+        state = {"left": len(images), "finished": 0, "errors": []}
+        bases = [os.path.join(out_dir, f"part_{n:05d}") for n in range(len(images))]
+
+        def finished(ok, error):
+            with self._lock:
+                state["left"] -= 1
+                state["finished"] += 1
+                count = state["finished"]
+                if not ok:
+                    state["errors"].append(error)
+                last = state["left"] == 0
+            if on_page:
+                try: on_page(count)
+                except Exception: pass
+            if last:
+                done.set()
+
+        self._set_busy(1)
+        try:
+            if not images:
+                return []
+            for image, base in zip(images, bases):
+                with self._lock:
+                    task_id = self._next_id
+                    self._next_id += 1
+                    self._pending[task_id] = finished
+                msg = json.dumps({"id": task_id, "image": image, "out": base, "hocr": hocr})
+                try:
+                    with self._lock:
+                        self.proc.stdin.write(msg + "\n")
+                        self.proc.stdin.flush()
+                except (OSError, ValueError):
+                    with self._lock:
+                        self._pending.pop(task_id, None)
+                    finished(False, "Tesseract pool exited")
+            done.wait()
+        finally:
+            self._set_busy(-1)
+
+        if state["errors"]:
+            raise RuntimeError(state["errors"][0])
+        return bases
+
+    def _set_busy(self, delta):
+        with self._lock:
+            self._busy += delta
+            if self._idle_timer:
+                self._idle_timer.cancel()
+                self._idle_timer = None
+            if self._busy == 0:
+                self._idle_timer = threading.Timer(IDLE_TIMEOUT, self._idle_shutdown)
+                self._idle_timer.daemon = True
+                self._idle_timer.start()
+
+    def _idle_shutdown(self):
+        with self._lock:
+            if self._busy:
+                return
+        _forget(self)
+        self.close()
+
+    def close(self):
+        try:
+            if self.is_alive():
+                self.proc.stdin.write(json.dumps({"cmd": "quit"}) + "\n")
+                self.proc.stdin.flush()
+                self.proc.wait(timeout=5)
+        except Exception:
+            try: self.proc.kill()
+            except Exception: pass
+
+
+_pools = {}
+_pools_lock = threading.Lock()
+_unavailable = False
+
+
+def _forget(pool):
+    with _pools_lock:
+        for key, p in list(_pools.items()):
+            if p is pool:
+                del _pools[key]
+
+
+def get_pool(lang, workers, tessdata_prefix=None):
+    """
+    Returns a running TessPool for `lang` with `workers` workers, or None if libtesseract is unusable.
+    tessdata_prefix selects the model tier; pools of different tiers are kept apart.
+    """
+    global _unavailable
+    if _unavailable:
+        return None
+    from . import platform_utils
+    tessdata_prefix = tessdata_prefix or platform_utils.get_app_data_dir()
+    key = (lang, workers, tessdata_prefix)
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is not None and pool.is_alive():
+            return pool
+        _pools.pop(key, None)
+
+    lib_path = find_library()
+    if not lib_path:
+        _unavailable = True
+        logging.info("No shared libtesseract found; page pool disabled (using the Tesseract CLI).")
+        return None
+
+    env = os.environ.copy()
+    env["OMP_THREAD_LIMIT"] = "1"
+    env["TESSDATA_PREFIX"] = tessdata_prefix
+    try:
+        pool = TessPool(platform_utils.get_python_executable(), lib_path, lang, workers, env)
+    except Exception as e:
+        _unavailable = True
+        logging.warning(f"Tesseract page pool unavailable: {e}")
+        return None
+
+    with _pools_lock:
+        _pools[key] = pool
+        # Keep memory bounded: drop the oldest idle pools beyond MAX_POOLS
+        for old_key in list(_pools)[:-MAX_POOLS]:
+            old = _pools[old_key]
+            if old._busy == 0:
+                del _pools[old_key]
+                old.close()
+    return pool
+
+
+def shutdown():
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close()
+
+
+if __name__ == "__main__":
+    _serve(sys.argv[1], sys.argv[2], max(1, int(sys.argv[3])))
@@ -0,0 +1,325 @@
+"""
+Tessdata Manager - Keeps the writable tessdata directory in sync with the bundled one.
+
+The bundled tessdata (inside the app/AppImage) is read-only, so language packs are
+installed into <app data>/tessdata. Instead of listing and copying the bundle on every
+launch, a manifest records what was installed (size/mtime, hashes on demand). A launch
+where the bundle is unchanged costs one scan of the bundle (a stat per pack) and one
+directory listing; changed or new
+packs are installed in a background thread via hard-link, symlink or copy.
+"""
+import os
+import sys
+import json
+import shutil
+import hashlib
+import logging
+import threading
+
+MANIFEST_NAME = ".bundle_manifest.json"
+MANIFEST_VERSION = 1
+
+# Installed first so an OCR job waiting on the sync can start as early as possible
+ESSENTIALS = ["eng.traineddata", "ben.traineddata", "osd.traineddata"]
+
+_sync_lock = threading.Lock()
+_sync_thread = None
+_sync_done = threading.Event()
+_sync_done.set()
+
+
+def _file_sha1(path, block=1024 * 1024):
+    h = hashlib.sha1()
+    with open(path, "rb") as f:
+        while True:
+            chunk = f.read(block)
+            if not chunk:
+                break
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _bundle_fingerprint(bundled_dir):
+    """
+    Identifies the bundle from the size and mtime of its entries, without hashing them:
+    a pack replaced in place leaves the directory's mtime unchanged. The mount path is
+    deliberately excluded: AppImages are mounted at a different /tmp path on every launch.
+    """
+    st = os.stat(bundled_dir)
+    h = hashlib.sha1()
+    for e in sorted(os.scandir(bundled_dir), key=lambda e: e.name):
+        est = e.stat()
+        h.update(f"{e.name}\0{est.st_size}\0{est.st_mtime_ns}\n".encode("utf-8", "surrogateescape"))
+    return {"mtime_ns": st.st_mtime_ns, "entries": h.hexdigest(), "version": MANIFEST_VERSION}
+
+
+def _load_manifest(path):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") == MANIFEST_VERSION:
+            return data
+    except Exception:
+        pass
+    return {"version": MANIFEST_VERSION, "bundle": None, "files": {}}
+
+
+def _save_manifest(path, manifest):
+    tmp = path + ".tmp"
+    try:
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=1)
+        os.replace(tmp, path)
+    except Exception as e:
+        logging.error(f"Failed to write tessdata manifest: {e}")
+
+
+def _symlinks_allowed():
+    """Symlinks into the bundle only make sense when the bundle path is stable across launches."""
+    if os.environ.get("APPIMAGE"):
+        return False # Mounted under a fresh /tmp/.mount_* each run
+    if getattr(sys, 'frozen', False):
+        return False # PyInstaller onefile extracts to a temporary _MEIPASS
+    return os.name != 'nt' # Windows needs extra privileges for symlinks
+
+
+def _install(src, dst):
+    """Installs src at dst atomically, preferring hard-link > symlink > copy. Returns the mode used."""
+    tmp = dst + ".partial"
+    if os.path.lexists(tmp):
+        os.remove(tmp)
+
+    mode = "copy"
+    try:
+        os.link(src, tmp)
+        mode = "hardlink"
+    except OSError:
+        linked = False
+        if _symlinks_allowed():
+            try:
+                os.symlink(os.path.abspath(src), tmp)
+                mode = "symlink"
+                linked = True
+            except OSError:
+                pass
+        if not linked:
+            shutil.copy2(src, tmp)
+
+    os.replace(tmp, dst)
+    return mode
+
+
+def install_user_pack(src, dst):
+    """
+    Installs a user-supplied pack at dst. Installed bundle packs may be hard links or
+    symlinks into the bundle, so the pack is copied beside dst and renamed over it:
+    writing through dst would change the bundled file itself.
+    """
+    tmp = dst + ".partial"
+    if os.path.lexists(tmp):
+        os.remove(tmp)
+    shutil.copyfile(src, tmp)
+    os.replace(tmp, dst)
+
+
+def _dst_state(dst):
+    st = os.stat(dst)
+    return st.st_size, st.st_mtime_ns
+
+
+def _needs_update(name, src_st, entry, dst, src):
+    """Decides whether the bundled file `name` should be (re)installed."""
+    if entry is None:
+        return True
+    if entry.get("size") == src_st.st_size and entry.get("mtime_ns") == src_st.st_mtime_ns:
+        return False
+    if entry.get("size") != src_st.st_size:
+        return True
+    # Same size but a new timestamp (e.g. re-installed bundle): compare content once
+    try:
+        src_hash = _file_sha1(src)
+    except OSError:
+        return True
+    old_hash = entry.get("sha1")
+    if old_hash is None and os.path.exists(dst):
+        try:
+            old_hash = _file_sha1(dst)
+        except OSError:
+            old_hash = None
+    entry["sha1"] = src_hash
+    if old_hash == src_hash:
+        # Content unchanged: just remember the new timestamp
+        entry["mtime_ns"] = src_st.st_mtime_ns
+        return False
+    return True
+
+
+def sync_tessdata(bundled_dir, writable_dir):
+    """
+    Synchronously brings writable_dir up to date with bundled_dir.
+    Files the user disabled (*.disabled) or replaced with their own copy are left alone.
+    A file that was already there before the manifest existed is adopted as installed
+    when it matches the bundled one (size, then SHA-1), and as the user's own otherwise.
+    """
+    os.makedirs(writable_dir, exist_ok=True)
+    manifest_path = os.path.join(writable_dir, MANIFEST_NAME)
+    manifest = _load_manifest(manifest_path)
+    files = manifest.setdefault("files", {})
+
+    fingerprint = _bundle_fingerprint(bundled_dir)
+    try:
+        present = set(os.listdir(writable_dir))
+    except OSError:
+        present = set()
+
+    # Fast path: bundle unchanged and every recorded pack is still installed (or disabled)
+    if manifest.get("bundle") == fingerprint and all(
+            name in present or name + ".disabled" in present for name in files):
+        return 0
+
+    entries = [e for e in os.scandir(bundled_dir) if not e.name.startswith(".")]
+    entries.sort(key=lambda e: (e.name not in ESSENTIALS, e.name))
+
+    installed = 0
+    for e in entries:
+        name = e.name
+        src = e.path
+        dst = os.path.join(writable_dir, name)
+        entry = files.get(name)
+
+        if name + ".disabled" in present and name not in present:
+            continue # User disabled this pack
+
+        try:
+            if e.is_dir():
+                if name not in present:
+                    shutil.copytree(src, dst)
+                    installed += 1
+                    logging.info(f"Initialized tessdata: {name}")
+                files[name] = {"dir": True}
+                continue
+
+            src_st = e.stat()
+
+            if name in present and entry is not None and entry.get("user"):
+                continue # Adopted as the user's own pack: never installed over
+            if name in present and entry is not None and "dst_size" in entry:
+                # A file we did not install (user-supplied pack) is never overwritten
+                if _dst_state(dst) != (entry["dst_size"], entry["dst_mtime_ns"]):
+                    continue
+            elif name in present and entry is None:
+                # Pre-manifest install (old copy-if-missing logic): an identical file is our
+                # copy and receives later bundle updates; anything else (e.g. tessdata_best)
+                # is the user's own pack and stays as it is, like copy-if-missing did
+                size, mtime = _dst_state(dst)
+                src_hash = _file_sha1(src) if size == src_st.st_size else None
+                if src_hash and _file_sha1(dst) == src_hash:
+                    files[name] = {"size": src_st.st_size, "mtime_ns": src_st.st_mtime_ns, "mode": "copy",
+                                   "dst_size": size, "dst_mtime_ns": mtime, "sha1": src_hash}
+                else:
+                    files[name] = {"user": True}
+                continue
+
+            if name in present and not _needs_update(name, src_st, entry, dst, src):
+                continue
+
+            mode = _install(src, dst)
+            size, mtime = _dst_state(dst)
+            new_entry = {"size": src_st.st_size, "mtime_ns": src_st.st_mtime_ns, "mode": mode,
+                         "dst_size": size, "dst_mtime_ns": mtime}
+            if entry and entry.get("sha1") and entry.get("size") == src_st.st_size:
+                new_entry["sha1"] = entry["sha1"]
+            files[name] = new_entry
+            installed += 1
+            logging.info(f"Installed tessdata ({mode}): {name}")
+        except Exception as ex:
+            logging.error(f"Failed to install tessdata {name}: {ex}")
+
+    manifest["bundle"] = fingerprint
+    _save_manifest(manifest_path, manifest)
+    return installed
+
+
+# ==================== MODEL TIERS ====================
+# Side-by-side variants of the same languages, e.g. tessdata_fast / tessdata_best:
+#   <app data>/tessdata/                  standard packs (bundled + user-added)
+#   <app data>/models/<tier>/tessdata/    packs of that tier
+# A job's TESSDATA_PREFIX points at the parent of the tessdata folder it should use.
+
+TIERS = ["standard", "fast", "best"]
+
+
+def tier_prefix_dir(tier):
+    """The TESSDATA_PREFIX for `tier` (the directory containing its `tessdata` folder)."""
+    from . import platform_utils
+    if tier in TIERS[1:]:
+        return os.path.join(platform_utils.get_app_data_dir(), "models", tier)
+    return platform_utils.get_app_data_dir()
+
+
+def tier_tessdata_dir(tier):
+    return os.path.join(tier_prefix_dir(tier), "tessdata")
+
+
+def tier_languages(tier):
+    d = tier_tessdata_dir(tier)
+    try:
+        return sorted(f[:-len(".traineddata")] for f in os.listdir(d) if f.endswith(".traineddata"))
+    except OSError:
+        return []
+
+
+def resolve_tier(tier, lang):
+    """
+    (TESSDATA_PREFIX, tier actually used) for a job in `lang` (e.g. 'eng+ben').
+    A tier missing any of the languages falls back to the standard packs as a whole,
+    so one job never mixes model variants. osd is shared from the standard packs.
+    """
+    if tier not in TIERS[1:]:
+        return tier_prefix_dir("standard"), "standard"
+    available = set(tier_languages(tier))
+    missing = [code for code in lang.split("+") if code and code not in available]
+    if missing:
+        logging.info(f"Model tier '{tier}' lacks {', '.join(missing)}; using the standard packs.")
+        return tier_prefix_dir("standard"), "standard"
+
+    osd = os.path.join(tier_tessdata_dir(tier), "osd.traineddata")
+    std_osd = os.path.join(tier_tessdata_dir("standard"), "osd.traineddata")
+    if not os.path.exists(osd) and os.path.exists(std_osd):
+        try:
+            _install(std_osd, osd)
+        except OSError as e:
+            logging.debug(f"Could not share osd with tier '{tier}': {e}")
+    return tier_prefix_dir(tier), tier
+
+
+def start_background_sync(bundled_dir, writable_dir):
+    """Starts sync_tessdata in a daemon thread (once). Use wait_for_sync() before running OCR."""
+    global _sync_thread
+    with _sync_lock:
+        if _sync_thread is not None and _sync_thread.is_alive():
+            return _sync_thread
+        _sync_done.clear()
+
+        def _worker():
+            try:
+                count = sync_tessdata(bundled_dir, writable_dir)
+                if count:
+                    logging.info(f"Tessdata sync installed/updated {count} item(s).")
+            except Exception as e:
+                logging.error(f"Tessdata sync failed: {e}")
+            finally:
+                _sync_done.set()
+
+        _sync_thread = threading.Thread(target=_worker, name="tessdata-sync", daemon=True)
+        _sync_thread.start()
+        return _sync_thread
+
+
+def is_sync_running():
+    return not _sync_done.is_set()
+
+
+def wait_for_sync(timeout=None):
+    """Blocks until any background sync finished. Returns False on timeout."""
+    return _sync_done.wait(timeout)
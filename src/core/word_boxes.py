@@ -0,0 +1,404 @@
+"""
+Word Boxes - Per-word bounding boxes and confidences for OCR output, with a spatial index.
+
+run_ocr writes `<name>.words` next to the output PDF. Boxes are in PDF points of the
+displayed (unrotated view) page, so the viewer can map canvas coordinates with a zoom
+factor only.
+
+File layout (little-endian):
+
+    magic b"BOCRWRD1"
+    per page block:
+        float32 page width, float32 page height, uint32 word count n
+        n x 4 float32   x0, y0, x1, y1
+        n x uint8       confidence 0-100 (255 = unknown, e.g. taken from an existing text layer)
+        n x uint16      line number within the page (reading order)
+        n x uint32      end offset of each word in the text blob
+        UTF-8 text blob (all words concatenated)
+    footer:
+        page count x uint64   offset of each page block
+        uint32 page count, magic b"BOCRWEND"
+
+A page is loaded with one seek; its grid index (GRID x GRID cells) is built on first
+use, so rectangle queries only test the words in overlapping cells.
+"""
+import os
+import math
+import sys
+import struct
+import logging
+from array import array
+from html.parser import HTMLParser
+
+WORDS_MAGIC = b"BOCRWRD1"
+FOOTER_MAGIC = b"BOCRWEND"
+WORDS_SUFFIX = ".words"
+CONF_UNKNOWN = 255
+GRID = 32
+
+_PAGE_HEADER = struct.Struct("<ffI")
+_LINE_CLASSES = ("ocr_line", "ocrx_line", "ocr_caption", "ocr_header", "ocr_textfloat")
+
+
+def words_path_for_pdf(pdf_path):
+    return pdf_path.replace(".pdf", WORDS_SUFFIX)
+
+
+def _to_le(arr):
+    if sys.byteorder != "little":
+        arr = array(arr.typecode, arr)
+        arr.byteswap()
+    return arr
+
+
+def _from_le(arr):
+    if sys.byteorder != "little":
+        arr.byteswap()
+    return arr
+
+
+class WordBoxWriter:
+    """Streams pages of words to a .words file. Use as a context manager."""
+
+    def __init__(self, path):
+        self.path = path
+        self._tmp = path + ".tmp"
+        self._offsets = array("Q")
+        self._f = open(self._tmp, "wb")
+        self._f.write(WORDS_MAGIC)
+
+    def write_page(self, width, height, words):
+        """words: iterable of (x0, y0, x1, y1, text, conf, line) in PDF points."""
+        boxes = array("f")
+        confs = array("B")
+        lines = array("H")
+        ends = array("I")
+        blob = bytearray()
+        for x0, y0, x1, y1, text, conf, line in words:
+            data = (text or "").encode("utf-8", errors="replace")
+            if not data.strip():
+                continue
+            boxes.extend((x0, y0, x1, y1))
+            confs.append(CONF_UNKNOWN if conf is None else max(0, min(100, int(conf))))
+            lines.append(min(int(line), 0xFFFF))
+            blob += data
+            ends.append(len(blob))
+
+        self._offsets.append(self._f.tell())
+        self._f.write(_PAGE_HEADER.pack(width, height, len(confs)))
+        _to_le(boxes).tofile(self._f)
+        confs.tofile(self._f)
+        _to_le(lines).tofile(self._f)
+        _to_le(ends).tofile(self._f)
+        self._f.write(blob)
+
+    @property
+    def page_count(self):
+        return len(self._offsets)
+
+    def close(self):
+        if self._f is None:
+            return
+        _to_le(self._offsets).tofile(self._f)
+        self._f.write(struct.pack("<I", len(self._offsets)))
+        self._f.write(FOOTER_MAGIC)
+        self._f.close()
+        self._f = None
+        os.replace(self._tmp, self.path)
+
+    def abort(self):
+        if self._f is not None:
+            self._f.close()
+            self._f = None
+        try: os.remove(self._tmp)
+        except OSError: pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+        return False
+
+
+class PageWords:
+    """The words of one page plus a lazily built uniform-grid index."""
+
+    def __init__(self, width, height, boxes, confs, lines, ends, blob):
+        self.width = width
+        self.height = height
+        self.boxes = boxes
+        self.confs = confs
+        self.lines = lines
+        self._ends = ends
+        self._blob = blob
+        self._words = None
+        self._grid = None
+
+    def __len__(self):
+        return len(self.confs)
+
+    @property
+    def words(self):
+        if self._words is None:
+            out, start = [], 0
+            for end in self._ends:
+                out.append(self._blob[start:end].decode("utf-8", errors="replace"))
+                start = end
+            self._words = out
+        return self._words
+
+    def box(self, i):
+        return tuple(self.boxes[i * 4:i * 4 + 4])
+
+    def _cell_range(self, x0, y0, x1, y1):
+        cw = (self.width or 1) / GRID
+        ch = (self.height or 1) / GRID
+        cx0 = min(GRID - 1, max(0, int(x0 / cw)))
+        cx1 = min(GRID - 1, max(0, int(x1 / cw)))
+        cy0 = min(GRID - 1, max(0, int(y0 / ch)))
+        cy1 = min(GRID - 1, max(0, int(y1 / ch)))
+        return cx0, cy0, cx1, cy1
+
+    def _build_grid(self):
+        grid = {}
+        b = self.boxes
+        for i in range(len(self)):
+            cx0, cy0, cx1, cy1 = self._cell_range(b[i * 4], b[i * 4 + 1], b[i * 4 + 2], b[i * 4 + 3])
+            for cy in range(cy0, cy1 + 1):
+                for cx in range(cx0, cx1 + 1):
+                    grid.setdefault(cy * GRID + cx, []).append(i)
+        self._grid = grid
+
+    def words_in_rect(self, x0, y0, x1, y1):
+        """Indices (reading order) of words whose centre lies inside the rectangle."""
+        if self._grid is None:
+            self._build_grid()
+        x0, x1 = min(x0, x1), max(x0, x1)
+        y0, y1 = min(y0, y1), max(y0, y1)
+        cx0, cy0, cx1, cy1 = self._cell_range(x0, y0, x1, y1)
+        b = self.boxes
+        hits = set()
+        for cy in range(cy0, cy1 + 1):
+            for cx in range(cx0, cx1 + 1):
+                for i in self._grid.get(cy * GRID + cx, ()):
+                    mx = (b[i * 4] + b[i * 4 + 2]) / 2
+                    my = (b[i * 4 + 1] + b[i * 4 + 3]) / 2
+                    if x0 <= mx <= x1 and y0 <= my <= y1:
+                        hits.add(i)
+        return sorted(hits)
+
+    def text_in_rect(self, x0, y0, x1, y1):
+        """Selected words joined with spaces, one output line per OCR line."""
+        words = self.words
+        out, current, line = [], [], None
+        for i in self.words_in_rect(x0, y0, x1, y1):
+            if line is not None and self.lines[i] != line:
+                out.append(" ".join(current))
+                current = []
+            current.append(words[i])
+            line = self.lines[i]
+        if current:
+            out.append(" ".join(current))
+        return "\n".join(out)
+
+    def find(self, terms):
+        """Boxes of words starting with any of the (case-insensitive) terms."""
+        terms = [t.casefold() for t in terms if t]
+        if not terms:
+            return []
+        return [self.box(i) for i, w in enumerate(self.words)
+                if any(w.casefold().startswith(t) for t in terms)]
+
+
+class WordBoxReader:
+    """Random access to the pages of a .words file."""
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            if f.read(len(WORDS_MAGIC)) != WORDS_MAGIC:
+                raise ValueError("Not a word box file")
+            f.seek(-(4 + len(FOOTER_MAGIC)), os.SEEK_END)
+            (count,) = struct.unpack("<I", f.read(4))
+            if f.read(len(FOOTER_MAGIC)) != FOOTER_MAGIC:
+                raise ValueError("Incomplete word box file")
+            f.seek(-(4 + len(FOOTER_MAGIC) + count * 8), os.SEEK_END)
+            self._table_start = f.tell()
+            offsets = array("Q")
+            offsets.fromfile(f, count)
+        self._offsets = _from_le(offsets)
+        self.page_count = count
+        self._cache = {}
+
+    def get_page(self, index):
+        """Returns the PageWords of a page (cached), or None if out of range."""
+        if not 0 <= index < self.page_count:
+            return None
+        page = self._cache.get(index)
+        if page is not None:
+            return page
+
+        start = self._offsets[index]
+        end = self._offsets[index + 1] if index + 1 < self.page_count else self._table_start
+        with open(self.path, "rb") as f:
+            f.seek(start)
+            data = f.read(end - start)
+        width, height, n = _PAGE_HEADER.unpack_from(data, 0)
+        pos = _PAGE_HEADER.size
+
+        def take(typecode, count):
+            nonlocal pos
+            arr = array(typecode)
+            size = arr.itemsize * count
+            arr.frombytes(data[pos:pos + size])
+            pos += size
+            return _from_le(arr)
+
+        boxes = take("f", n * 4)
+        confs = take("B", n)
+        lines = take("H", n)
+        ends = take("I", n)
+        page = PageWords(width, height, boxes, confs, lines, ends, data[pos:])
+        if len(self._cache) > 8:
+            self._cache.clear()
+        self._cache[index] = page
+        return page
+
+
+def open_reader(path, expected_pages=None):
+    """Returns a WordBoxReader for path if it is complete (and matches the page count), else None."""
+    try:
+        if not os.path.exists(path):
+            return None
+        reader = WordBoxReader(path)
+        if expected_pages is not None and reader.page_count != expected_pages:
+            return None
+        return reader
+    except Exception:
+        return None
+
+
+def open_reader_for_pdf(pdf_path, expected_pages=None):
+    """Looks for `<pdf>.words` (as written by run_ocr) next to a PDF."""
+    if not pdf_path or not pdf_path.endswith(".pdf"):
+        return None
+    reader = open_reader(words_path_for_pdf(pdf_path), expected_pages)
+    if reader and os.path.getmtime(reader.path) < os.path.getmtime(pdf_path) - 5:
+        return None # PDF replaced after the boxes were written
+    return reader
+
+
+# ==================== hOCR ====================
+
+def _parse_title(title):
+    """hOCR title properties ('bbox 1 2 3 4; x_wconf 95') -> {'bbox': [...], 'x_wconf': [...]}."""
+    props = {}
+    for part in (title or "").split(";"):
+        fields = part.strip().split()
+        if fields:
+            props[fields[0]] = fields[1:]
+    return props
+
+
+class _HocrParser(HTMLParser):
+    """Streaming hOCR reader. `on_page(index, img_w, img_h, words)` per ocr_page, words in pixels."""
+
+    def __init__(self, on_page):
+        super().__init__(convert_charrefs=True)
+        self.on_page = on_page
+        self._page = None       # [img_w, img_h, words]
+        self._index = 0
+        self._line = 0
+        self._spans = []        # class of every open span
+        self._word = None       # [x0, y0, x1, y1, conf, text parts]
+
+    def _flush_page(self):
+        if self._page is not None:
+            self.on_page(self._index, *self._page)
+            self._index += 1
+        self._page = None
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        cls = attrs.get("class") or ""
+        if cls == "ocr_page":
+            self._flush_page()
+            bbox = _parse_title(attrs.get("title")).get("bbox", ["0", "0", "0", "0"])
+            self._page = [float(bbox[2]), float(bbox[3]), []]
+            self._line = 0
+        elif cls in _LINE_CLASSES:
+            self._line += 1
+        if tag != "span":
+            return
+        self._spans.append(cls)
+        if cls == "ocrx_word":
+            props = _parse_title(attrs.get("title"))
+            bbox = [float(v) for v in props.get("bbox", ["0", "0", "0", "0"])[:4]]
+            conf = props.get("x_wconf")
+            self._word = bbox + [float(conf[0]) if conf else None, []]
+
+    def handle_endtag(self, tag):
+        if tag != "span" or not self._spans:
+            return
+        if self._spans.pop() == "ocrx_word" and self._word is not None:
+            x0, y0, x1, y1, conf, parts = self._word
+            if self._page is not None:
+                self._page[2].append((x0, y0, x1, y1, "".join(parts).strip(), conf, self._line))
+            self._word = None
+
+    def handle_data(self, data):
+        if self._word is not None:
+            self._word[5].append(data)
+
+    def close(self):
+        super().close()
+        self._flush_page()
+
+
+def iter_hocr_pages(hocr_path, block=1024 * 1024):
+    """Yields (page_index, image_width, image_height, words) from a (multi-page) hOCR file."""
+    pages = []
+    parser = _HocrParser(lambda *page: pages.append(page))
+    with open(hocr_path, "r", encoding="utf-8", errors="replace") as f:
+        while True:
+            chunk = f.read(block)
+            if not chunk:
+                break
+            parser.feed(chunk)
+            while pages:
+                yield pages.pop(0)
+    parser.close()
+    while pages:
+        yield pages.pop(0)
+
+
+def unrotate_words(words, angle, img_w, img_h, orig_w, orig_h):
+    """
+    Maps pixel boxes found on an image that was turned `angle` degrees counter-clockwise
+    (about its centre, canvas expanded) back onto the orig_w x orig_h image it came from.
+    Returns (words, orig_w, orig_h) ready for scale_words.
+    """
+    rad = math.radians(angle)
+    cos, sin = math.cos(rad), math.sin(rad)
+    cx, cy, ox, oy = img_w / 2, img_h / 2, orig_w / 2, orig_h / 2
+    out = []
+    for x0, y0, x1, y1, text, conf, line in words:
+        xs, ys = [], []
+        for x, y in ((x0, y0), (x1, y0), (x0, y1), (x1, y1)):
+            dx, dy = x - cx, y - cy
+            xs.append(ox + dx * cos - dy * sin)
+            ys.append(oy + dx * sin + dy * cos)
+        out.append((min(xs), min(ys), max(xs), max(ys), text, conf, line))
+    return out, orig_w, orig_h
+
+
+def scale_words(words, img_w, img_h, page_w, page_h):
+    """Maps pixel boxes of a rendered page image onto PDF points."""
+    sx = page_w / img_w if img_w else 1.0
+    sy = page_h / img_h if img_h else 1.0
+    for x0, y0, x1, y1, text, conf, line in words:
+        yield (x0 * sx, y0 * sy, x1 * sx, y1 * sy, text, conf, line)
@@ -9,7 +9,6 @@ import os
 import sys
 import subprocess
 import webbrowser
-import pikepdf
 try:
     from tkinterdnd2 import TkinterDnD
 except ImportError:
@@ -35,7 +34,9 @@ from ..core.constants import APP_NAME
 from ..core.config_manager import state as app_state
 from ..core.history_manager import history
 from ..core import platform_utils
+from ..core import image_input
 from ..core import gpu_manager
+from ..core import startup_profile
 from ..core.emoji_label import EmojiLabel, render_emoji_image
 from ..core.theme import THEME_COLOR, BG_COLOR, SURFACE_COLOR, MAIN_FONT, HEADER_FONT
 
@@ -48,12 +49,8 @@ from .controllers.processing_controller import ProcessingController
 # Widgets
 from .widgets.theme_manager import setup_custom_theme
 
-# Views
+# Views (only Home is imported eagerly; the rest are built on first navigation)
 from .views.home_view import HomeView
-from .views.batch_view import BatchView
-from .views.history_view import HistoryView
-from .views.scan_view import ScanView
-from .views.settings_view import SettingsView
 
 
 class BiplobOCR(TkinterDnD.Tk):
@@ -74,10 +71,13 @@ class BiplobOCR(TkinterDnD.Tk):
             from ..core.platform_utils import get_base_dir
             icon_path = os.path.join(get_base_dir(), "assets", "icon.png")
             if os.path.exists(icon_path):
-                 from PIL import Image, ImageTk
-                 # High res icon for taskbar
-                 img = Image.open(icon_path)
-                 photo = ImageTk.PhotoImage(img)
+                 # High res icon for taskbar (Tk 8.6 reads PNG natively, no PIL import needed)
+                 try:
+                     photo = tk.PhotoImage(file=icon_path, master=self)
+                 except tk.TclError:
+                     from PIL import Image, ImageTk
+                     photo = ImageTk.PhotoImage(Image.open(icon_path))
+                 self._icon_photo = photo
                  self.iconphoto(True, photo)
                  
                  # Set Windows specific icon if needed
@@ -98,9 +98,11 @@ class BiplobOCR(TkinterDnD.Tk):
         self.processing_active = False 
 
         # Hardware Info
+        # (cached device list; lspci/PowerShell discovery runs in the background)
         self.sys_info = gpu_manager.get_system_info()
         self.available_gpus = self.sys_info["gpus"]
         self.cpu_count = self.sys_info["cpu_count"]
+        gpu_manager.start_discovery(lambda gpus: self.after(0, lambda: self._on_devices_discovered(gpus)))
         
         # Apply theme
         setup_custom_theme(self)
@@ -121,6 +123,48 @@ class BiplobOCR(TkinterDnD.Tk):
         self.protocol("WM_DELETE_WINDOW", self.on_close_app)
         
         self.deiconify()
+        startup_profile.mark("build main window")
+        self.after_idle(self._on_first_window)
+
+    def _on_devices_discovered(self, gpus):
+        """Background device discovery finished: update the cached list and the settings combobox."""
+        if gpus == self.available_gpus:
+            return
+        self.available_gpus = gpus
+        self.sys_info["gpus"] = gpus
+        view = self._views.get("settings") if hasattr(self, "_views") else None
+        if view is not None and hasattr(view, "cb_gpu"):
+            try:
+                view.cb_gpu.configure(values=["Auto"] + gpus)
+            except tk.TclError:
+                pass
+
+    def _on_first_window(self):
+        """Runs once the first frame is drawn: report startup timings."""
+        startup_profile.mark("first frame")
+        startup_profile.report()
+
+        # First launch on this hardware: benchmark in the background and persist tuning
+        from ..core import calibration
+        if calibration.needs_calibration():
+            self.start_calibration()
+
+    def start_calibration(self, apply_threads=False):
+        """
+        Run the hardware calibration in the background (startup or Settings button).
+        apply_threads: the measured jobs replace the thread setting even if the user changed it.
+        """
+        from ..core import calibration
+        calibration.start_background_calibration(
+            lambda tuning: self.after(0, lambda: self._on_calibration_done(tuning)), apply_threads=apply_threads)
+
+    def _on_calibration_done(self, tuning):
+        # The thread setting follows only when calibration was allowed to replace it
+        if tuning and app_state.get_option("max_cpu_threads") == tuning["jobs"]:
+            self.var_cpu_threads.set(tuning["jobs"])
+        view = self._views.get("settings") if hasattr(self, "_views") else None
+        if view is not None and hasattr(view, "update_tuning_summary"):
+            view.update_tuning_summary()
 
     def _init_variables(self):
         """Initialize all tkinter variables."""
@@ -129,11 +173,15 @@ class BiplobOCR(TkinterDnD.Tk):
         self.var_rotate = tk.BooleanVar(value=app_state.get_option("rotate"))
         self.var_force = tk.BooleanVar(value=app_state.get_option("force"))
         self.var_rasterize = tk.BooleanVar(value=app_state.get_option("rasterize"))
+        self.var_two_pass = tk.BooleanVar(value=app_state.get("two_pass", False))
+        self.var_remove_blank = tk.BooleanVar(value=app_state.get("remove_blank_pages", False))
         self.var_dpi = tk.IntVar(value=app_state.get_option("dpi") if app_state.get_option("dpi") is not None else 0)
         self.var_optimize = tk.StringVar(value=app_state.get_option("optimize"))
+        self.var_model_tier = tk.StringVar(value=app_state.get("model_tier", "standard"))
         self.var_gpu = tk.BooleanVar(value=app_state.get_option("use_gpu"))
         self.var_gpu_device = tk.StringVar(value=app_state.get_option("gpu_device") or "Auto")
         self.var_cpu_threads = tk.IntVar(value=app_state.get_option("max_cpu_threads") or 2)
+        self.var_auto_tune = tk.BooleanVar(value=app_state.get("auto_tune", True))
         self.var_lang = tk.StringVar(value=app_state.get("language", "en"))
 
     def on_close_app(self):
@@ -264,19 +312,47 @@ class BiplobOCR(TkinterDnD.Tk):
 
         self.btn_show_log.pack(side="right", padx=5)
 
-    def _init_views(self):
-        """Initialize all views."""
-        self.view_home = HomeView(self.content_area, self)
-        self.view_batch = BatchView(self.content_area, self)
-        self.view_history = HistoryView(self.content_area, self)
-
-        self.view_scan = ScanView(self.content_area, self)
-        self.view_settings = SettingsView(self.content_area, self)
+    VIEW_NAMES = ("home", "scan", "batch", "history", "settings")
 
+    def _init_views(self):
+        """Initialize views. Only Home is built eagerly unless 'lazy_views' is disabled."""
+        self._views = {}
+        self.get_view("home")
+        if not app_state.get("lazy_views", True):
+            for name in self.VIEW_NAMES:
+                self.get_view(name)
 
         self.view_home.pack(fill="both", expand=True)
         self.switch_tab("home")
 
+    def get_view(self, name):
+        """Returns the view for `name`, importing and constructing it on first use."""
+        view = self._views.get(name)
+        if view is not None:
+            return view
+
+        if name == "home":
+            view = HomeView(self.content_area, self)
+        elif name == "scan":
+            from .views.scan_view import ScanView
+            view = ScanView(self.content_area, self)
+        elif name == "batch":
+            from .views.batch_view import BatchView
+            view = BatchView(self.content_area, self)
+        elif name == "history":
+            from .views.history_view import HistoryView
+            view = HistoryView(self.content_area, self)
+        elif name == "settings":
+            from .views.settings_view import SettingsView
+            view = SettingsView(self.content_area, self)
+        else:
+            raise ValueError(f"Unknown view: {name}")
+
+        self._views[name] = view
+        # Keep the view_<name> attributes other views/controllers rely on
+        setattr(self, f"view_{name}", view)
+        return view
+
 
 
     
@@ -300,15 +376,16 @@ class BiplobOCR(TkinterDnD.Tk):
 
     def switch_tab(self, tab):
         """Switch between tabs/views."""
-        views = [self.view_home, self.view_scan, self.view_settings, self.view_history, self.view_batch]
         buttons = [self.btn_home, self.btn_tools, self.btn_batch, self.btn_history, self.btn_settings]
         
-        for v in views:
+        for v in self._views.values():
             v.pack_forget()
         for b in buttons:
             b.state(['!pressed', '!disabled']) 
             b.configure(style="TButton")
 
+        self.get_view(tab)
+
         if tab == "home":
             self.view_home.pack(fill="both", expand=True)
             self.btn_home.configure(style="Accent.TButton")
@@ -374,12 +451,12 @@ class BiplobOCR(TkinterDnD.Tk):
         pdf = None
         if platform_utils.IS_LINUX:
             pdf = platform_utils.linux_file_dialog(
-                title="Select PDF",
+                title="Select PDF or Image",
                 initialdir=app_state.get_initial_dir(),
-                filetypes=[("PDF files", "*.pdf")]
+                filetypes=image_input.input_file_types()
             )
         else:
-            pdf = filedialog.askopenfilename(filetypes=[("PDF files", "*.pdf")])
+            pdf = filedialog.askopenfilename(filetypes=image_input.input_file_types())
 
         if not pdf:
             return
@@ -388,13 +465,15 @@ class BiplobOCR(TkinterDnD.Tk):
             app_state.save_config({"last_open_dir": os.path.dirname(pdf)})
         self.current_pdf_path = pdf
         password = None
-        try: 
-            with pikepdf.open(pdf):
-                pass
-        except pikepdf.PasswordError:
-            password = simpledialog.askstring("Password", "Enter PDF Password:", show="*")
-            if not password:
-                return
+        if not image_input.is_image_file(pdf):
+            import pikepdf
+            try: 
+                with pikepdf.open(pdf):
+                    pass
+            except pikepdf.PasswordError:
+                password = simpledialog.askstring("Password", "Enter PDF Password:", show="*")
+                if not password:
+                    return
         self.current_pdf_password = password
         self.viewer.load_pdf(pdf, password)
         self.btn_process.config(state="normal")
@@ -408,21 +487,23 @@ class BiplobOCR(TkinterDnD.Tk):
         if not paths: return
         file_path = paths[0] # Take the first if multiple dropped
 
-        if not file_path.lower().endswith('.pdf'):
-            messagebox.showerror("Error", "Only PDF files are supported.")
+        if not image_input.is_ocr_input(file_path):
+            messagebox.showerror("Error", "Only PDF and image files (TIFF, JPEG, PNG, BMP) are supported.")
             return
 
         self.current_pdf_path = file_path
         self.switch_tab("scan")
         
         password = None
-        try: 
-            with pikepdf.open(file_path):
-                pass
-        except pikepdf.PasswordError:
-            password = simpledialog.askstring("Password", "Enter PDF Password:", show="*")
-            if not password:
-                return
+        if not image_input.is_image_file(file_path):
+            import pikepdf
+            try: 
+                with pikepdf.open(file_path):
+                    pass
+            except pikepdf.PasswordError:
+                password = simpledialog.askstring("Password", "Enter PDF Password:", show="*")
+                if not password:
+                    return
         
         self.current_pdf_password = password
         self.viewer.load_pdf(file_path, password)
@@ -441,7 +522,7 @@ class BiplobOCR(TkinterDnD.Tk):
         
         count = 0
         for f in raw_paths:
-            if f.lower().endswith('.pdf'):
+            if image_input.is_ocr_input(f):
                 if any(bf["path"] == f for bf in self.batch_files):
                     continue
                 item_id = self.batch_tree.insert("", "end", values=(os.path.basename(f), "Pending"))
@@ -484,6 +565,13 @@ class BiplobOCR(TkinterDnD.Tk):
                     messagebox.showinfo("Saved", "PDF Saved!")
                     fname = os.path.basename(self.current_pdf_path)
                     history.update_output_path(fname, f)
+                    from ..core.search_index import search_index
+                    from ..core import word_boxes
+                    search_index.rename_document(temp_out, f)
+                    # Keep the OCR word boxes with the saved PDF
+                    words_src = word_boxes.words_path_for_pdf(temp_out)
+                    if f.endswith(".pdf") and os.path.exists(words_src):
+                        shutil.copy(words_src, word_boxes.words_path_for_pdf(f))
                 except Exception as e:
                     messagebox.showerror("Error", f"Save failed: {e}")
         
@@ -545,11 +633,15 @@ class BiplobOCR(TkinterDnD.Tk):
             "use_gpu": self.var_gpu.get(),
             "gpu_device": self.var_gpu_device.get(),
             "max_cpu_threads": self.var_cpu_threads.get(),
+            "auto_tune": self.var_auto_tune.get(),
             "deskew": self.var_deskew.get(),
             "clean": self.var_clean.get(),
             "rotate": self.var_rotate.get(),
             "force": self.var_force.get(),
             "rasterize": self.var_rasterize.get(),
+            "two_pass": self.var_two_pass.get(),
+            "model_tier": self.var_model_tier.get(),
+            "remove_blank_pages": self.var_remove_blank.get(),
             "dpi": dpi_val,
             "optimize": self.var_optimize.get()
         }
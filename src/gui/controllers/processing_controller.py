@@ -6,14 +6,13 @@ import os
 import time
 import threading
 import subprocess
-import fitz  # PyMuPDF
-import pikepdf
 from tkinter import filedialog, messagebox
 
-from ...core.constants import TEMP_DIR
-from ...core.ocr_engine import detect_pdf_type, run_ocr, cancel_ocr
+from ...core.constants import get_temp_dir
+from ...core.ocr_engine import detect_pdf_type, run_ocr, cancel_ocr, reset_cancel
 from ...core.config_manager import state as app_state
 from ...core.history_manager import history
+from ...core import image_input
 
 
 class ProcessingController:
@@ -40,9 +39,11 @@ class ProcessingController:
         self.app.status_controller.reset_page_counter()
         
         # PRE-CHECK: Detect potential issues before starting
+        # Born-digital files skip OCR (text fast path), so only mixed files need asking
         if not self.app.var_force.get() and self.app.current_pdf_path:
             pdf_type = detect_pdf_type(self.app.current_pdf_path)
-            if pdf_type in ['text', 'mixed']:
+            ask_types = ['mixed'] if app_state.get("text_fast_path", True) else ['text', 'mixed']
+            if pdf_type in ask_types:
                 msg = app_state.t("msg_text_detected") if app_state.get("language") == "en" else "File contains text."
                 msg += "\n\n" + ("Enable 'Force OCR' to re-process?" if app_state.get("language") == "en" else "Force OCR enabled?")
                 
@@ -51,6 +52,7 @@ class ProcessingController:
 
         self.app.btn_process.config(state="disabled")
         self.stop_flag = False
+        reset_cancel()
         
         # Determine if we can show determinate progress immediately
         determinate = False
@@ -101,13 +103,17 @@ class ProcessingController:
                 "gpu_device": self.app.var_gpu_device.get(),
                 "max_cpu_threads": self.app.var_cpu_threads.get(),
                 "rasterize": self.app.var_rasterize.get(),
+                "two_pass": self.app.var_two_pass.get(),
+                "model_tier": self.app.var_model_tier.get(),
+                "remove_blank_pages": self.app.var_remove_blank.get(),
                 "dpi": current_dpi,
                 "language": ocr_lang
             }
-            temp_out = os.path.join(TEMP_DIR, "processed_output.pdf")
+            temp_out = os.path.join(get_temp_dir(), "processed_output.pdf")
             
             total_pages = 0
             try:
+                import fitz  # PyMuPDF
                 if self.app.viewer and self.app.viewer.pdf_path == self.app.current_pdf_path:
                     total_pages = self.app.viewer.total_pages
                 else:
@@ -216,6 +222,7 @@ class ProcessingController:
 
         self.app.btn_start_batch.config(state="disabled")
         self.stop_flag = False
+        reset_cancel()
         
         self.app.status_controller.show_global_status("Batch Processing Started...", determinate=True)
         self.app.status_controller.update_global_progress(0, len(self.app.batch_files) * 100)
@@ -228,13 +235,13 @@ class ProcessingController:
         files = None
         if platform_utils.IS_LINUX:
             files = platform_utils.linux_file_dialog(
-                title="Select PDF Files",
+                title="Select PDF or Image Files",
                 initialdir=app_state.get_initial_dir(),
                 multiple=True,
-                filetypes=[("PDF files", "*.pdf")]
+                filetypes=image_input.input_file_types()
             )
         else:
-            files = filedialog.askopenfilenames(filetypes=[("PDF files", "*.pdf")])
+            files = filedialog.askopenfilenames(filetypes=image_input.input_file_types())
 
         if not files:
             return
@@ -297,86 +304,125 @@ class ProcessingController:
             "gpu_device": self.app.var_gpu_device.get(),
             "max_cpu_threads": self.app.var_cpu_threads.get(),
             "rasterize": self.app.var_rasterize.get(),
+            "two_pass": self.app.var_two_pass.get(),
+            "model_tier": self.app.var_model_tier.get(),
+            "remove_blank_pages": self.app.var_remove_blank.get(),
             "dpi": current_dpi
         }
         
-        success_count = 0
+        # Documents run side by side on machines calibrated for it; the thread budget is split between them
+        from ...core import calibration
+        concurrency = max(1, min(calibration.get_tuning()["doc_concurrency"], len(self.app.batch_files)))
+        if concurrency > 1:
+            opts["max_cpu_threads"] = max(1, int(opts["max_cpu_threads"]) // concurrency)
+
         total_docs = len(self.app.batch_files)
+        self._batch_lock = threading.Lock()
+        self._batch_progress = {}   # doc index -> percent done (0-100)
+        self._batch_success = 0
+        self._batch_cancelled = False
+
+        if concurrency == 1:
+            for i, item in enumerate(self.app.batch_files):
+                if self.stop_flag or self._batch_cancelled:
+                    break
+                self._run_batch_item(i, item, out_dir, opts, total_docs)
+        else:
+            from concurrent.futures import ThreadPoolExecutor
+            with ThreadPoolExecutor(max_workers=concurrency) as pool:
+                for i, item in enumerate(self.app.batch_files):
+                    pool.submit(self._run_batch_item, i, item, out_dir, opts, total_docs)
+
+        success_count = self._batch_success
+        self.app.after(0, lambda: self._on_batch_complete(success_count, total_docs))
+
+    def _batch_global_value(self):
+        with self._batch_lock:
+            return sum(self._batch_progress.values())
+
+    def _run_batch_item(self, i, item, out_dir, opts, total_docs):
+        """Internal: OCR one batch document (may run on a pool thread)."""
+        import fitz  # PyMuPDF
+        import pikepdf
+
+        if self.stop_flag or self._batch_cancelled:
+            return
+        fpath = item["path"]
+        item_id = item["id"]
+        fname = os.path.basename(fpath)
         
-        for i, item in enumerate(self.app.batch_files):
-            if self.stop_flag:
-                break
-            fpath = item["path"]
-            item_id = item["id"]
-            fname = os.path.basename(fpath)
-            
-            self.app.after(0, lambda id=item_id: self.app.batch_tree.set(id, "Status", "Processing..."))
-            self.app.status_controller.reset_batch_page_counter()
+        self.app.after(0, lambda id=item_id: self.app.batch_tree.set(id, "Status", "Processing..."))
+        self.app.status_controller.reset_batch_page_counter()
+        
+        try:
+            out_name = f"biplob_ocr_{image_input.output_name(fpath)}"
+            out_path = os.path.join(out_dir, out_name)
             
+            doc_total_pages = 1
             try:
-                out_name = f"biplob_ocr_{fname}"
-                out_path = os.path.join(out_dir, out_name)
-                
-                doc_total_pages = 1
-                try:
-                    with fitz.open(fpath) as d:
-                        doc_total_pages = len(d)
-                except:
-                    pass
-                
-                file_start_time = time.time()
-
-                def batch_prog_cb(p, i=i, fname=fname, doc_total_pages=doc_total_pages, 
-                                  file_start_time=file_start_time, total_docs=total_docs, fpath=fpath):
-                    if doc_total_pages > 0:
-                        doc_pct = (p / doc_total_pages) * 100
-                        global_val = (i * 100) + doc_pct
-                        
-                        elapsed = time.time() - file_start_time
-                        avg_p = elapsed / p if p > 0 else 0
-                        rem_p = doc_total_pages - p
-                        etr = int(rem_p * avg_p)
-                        etr_str = f"{etr//60}m {etr%60}s"
-                        
-                        self.app.after(0, lambda v=global_val, p=p, t=doc_total_pages, n=fname, idx=i+1, e=etr_str: 
-                            self.app.status_controller.update_batch_status_detail(v, idx, total_docs, n, p, t, e, fpath))
-
-                def log_cb(msg):
-                    self.app.log_bridge(msg)
+                with fitz.open(fpath) as d:
+                    doc_total_pages = len(d)
+            except:
+                pass
+            
+            file_start_time = time.time()
 
+            def batch_prog_cb(p, i=i, fname=fname, doc_total_pages=doc_total_pages, 
+                              file_start_time=file_start_time, total_docs=total_docs, fpath=fpath):
+                if doc_total_pages > 0:
+                    doc_pct = (p / doc_total_pages) * 100
+                    with self._batch_lock:
+                        self._batch_progress[i] = min(100, doc_pct)
+                    global_val = self._batch_global_value()
+                    
+                    elapsed = time.time() - file_start_time
+                    avg_p = elapsed / p if p > 0 else 0
+                    rem_p = doc_total_pages - p
+                    etr = int(rem_p * avg_p)
+                    etr_str = f"{etr//60}m {etr%60}s"
+                    
+                    self.app.after(0, lambda v=global_val, p=p, t=doc_total_pages, n=fname, idx=i+1, e=etr_str: 
+                        self.app.status_controller.update_batch_status_detail(v, idx, total_docs, n, p, t, e, fpath))
+
+            def log_cb(msg):
+                self.app.log_bridge(msg)
+
+            if not image_input.is_image_file(fpath):
                 try: 
                     with pikepdf.open(fpath):
                         pass
                 except: 
                     raise Exception("Password Required")
 
-                run_ocr(fpath, out_path, None, force=self.app.var_force.get(), options=opts, 
-                       progress_callback=batch_prog_cb, log_callback=log_cb)
-                
-                if self.stop_flag:
-                    raise Exception("Process Cancelled")
-                     
-                from ...core import platform_utils
-                self.app.after(0, lambda id=item_id: self.app.batch_tree.set(id, "Status", platform_utils.sanitize_for_linux("✅ Done")))
-
-                history.add_entry(fname, "Batch Success", "N/A", source_path=fpath, output_path=out_path)
-                success_count += 1
-                
-            except Exception as e:
-                from ...core import platform_utils
-                status = platform_utils.sanitize_for_linux("❌ Failed")
-                err_msg = str(e)
-                if "Process Cancelled" in err_msg or self.stop_flag:
-                    status = platform_utils.sanitize_for_linux("⛔ Cancelled")
-                    self.app.after(0, lambda id=item_id, s=status: self.app.batch_tree.set(id, "Status", s))
-                    history.add_entry(fname, "Batch Cancelled", source_path=fpath)
-                    break
-                self.app.after(0, lambda id=item_id, s=status: self.app.batch_tree.set(id, "Status", s))
-                history.add_entry(fname, "Batch Failed", source_path=fpath)
+            run_ocr(fpath, out_path, None, force=self.app.var_force.get(), options=opts, 
+                   progress_callback=batch_prog_cb, log_callback=log_cb)
+            
+            if self.stop_flag:
+                raise Exception("Process Cancelled")
+                 
+            from ...core import platform_utils
+            self.app.after(0, lambda id=item_id: self.app.batch_tree.set(id, "Status", platform_utils.sanitize_for_linux("✅ Done")))
+
+            history.add_entry(fname, "Batch Success", "N/A", source_path=fpath, output_path=out_path)
+            with self._batch_lock:
+                self._batch_success += 1
             
-            self.app.after(0, lambda v=(i+1)*100: self.app.global_progress.configure(value=v))
+        except Exception as e:
+            from ...core import platform_utils
+            status = platform_utils.sanitize_for_linux("❌ Failed")
+            err_msg = str(e)
+            if "Process Cancelled" in err_msg or self.stop_flag:
+                status = platform_utils.sanitize_for_linux("⛔ Cancelled")
+                self.app.after(0, lambda id=item_id, s=status: self.app.batch_tree.set(id, "Status", s))
+                history.add_entry(fname, "Batch Cancelled", source_path=fpath)
+                self._batch_cancelled = True
+                return
+            self.app.after(0, lambda id=item_id, s=status: self.app.batch_tree.set(id, "Status", s))
+            history.add_entry(fname, "Batch Failed", source_path=fpath)
         
-        self.app.after(0, lambda: self._on_batch_complete(success_count, total_docs))
+        with self._batch_lock:
+            self._batch_progress[i] = 100
+        self.app.after(0, lambda v=self._batch_global_value(): self.app.global_progress.configure(value=v))
 
     def _on_batch_complete(self, success, total):
         """Handle batch processing completion."""
@@ -9,6 +9,8 @@ from ..core.theme import MAIN_FONT, HEADER_FONT
 from ..core import platform_utils
 from ..core.emoji_label import EmojiLabel, render_emoji_image
 from ..core.config_manager import state as app_state # Correct import
+from ..core import sidecar
+from ..core import word_boxes
 
 
 class PDFViewer(ttk.Frame):
@@ -23,6 +25,9 @@ class PDFViewer(ttk.Frame):
         self.is_text_mode = False # Initialized text mode flag
         self.image_ref = None
         self.pdf_path = None
+        self.sidecar_reader = None # Indexed OCR sidecar next to the PDF, if any
+        self.word_reader = None # OCR word boxes next to the PDF, if any
+        self.highlight_terms = [] # Search terms outlined on every page
         
         # Canvas state for selection
         self.start_x = None
@@ -193,8 +198,12 @@ class PDFViewer(ttk.Frame):
 
     def show_text_content(self):
         if not self.doc: return
-        page = self.doc.load_page(self.current_page)
-        text = page.get_text("text")
+        if self.sidecar_reader:
+            # Seek straight to this page's OCR text instead of parsing the text layer
+            text = self.sidecar_reader.get_page(self.current_page)
+        else:
+            page = self.doc.load_page(self.current_page)
+            text = page.get_text("text")
         
         self.text_widget.config(state="normal")
         self.text_widget.delete("1.0", "end")
@@ -219,6 +228,7 @@ class PDFViewer(ttk.Frame):
         self.canvas.create_image(0, 0, image=self.image_ref, anchor="nw")
         
         self.canvas.config(scrollregion=self.canvas.bbox("all"))
+        self.draw_highlights()
 
         # If text mode is active, also update text
         if self.is_text_mode:
@@ -236,6 +246,9 @@ class PDFViewer(ttk.Frame):
                     return
             
             self.total_pages = len(self.doc)
+            self.sidecar_reader = sidecar.open_reader_for_pdf(path, self.total_pages)
+            self.word_reader = word_boxes.open_reader_for_pdf(path, self.total_pages)
+            self.highlight_terms = []
             self.current_page = 0
             self.rotation = 0
             self.lbl_filename.set_text(os.path.basename(path))
@@ -294,6 +307,27 @@ class PDFViewer(ttk.Frame):
             self.show_page()
             self.update_ui_state()
 
+    def go_to_page(self, index, highlight=None):
+        if self.doc and 0 <= index < self.total_pages:
+            self.current_page = index
+            if highlight is not None:
+                self.highlight_terms = highlight.split()
+            self.show_page()
+            self.update_ui_state()
+
+    def draw_highlights(self):
+        """Outlines words matching highlight_terms, using the OCR word boxes."""
+        if not self.highlight_terms or not self.word_reader or self.rotation != 0:
+            return
+        words = self.word_reader.get_page(self.current_page)
+        if not words:
+            return
+        for x0, y0, x1, y1 in words.find(self.highlight_terms):
+            self.canvas.create_rectangle(
+                x0 * self.zoom, y0 * self.zoom, x1 * self.zoom, y1 * self.zoom,
+                outline="#f0b400", width=2
+            )
+
     def zoom_in(self):
         self.zoom += 0.25
         self.show_page()
@@ -346,6 +380,14 @@ class PDFViewer(ttk.Frame):
         
         # Extract Text
         try:
+            words = self.word_reader.get_page(self.current_page) if self.word_reader and self.rotation == 0 else None
+            if words is not None:
+                # Grid lookup in the OCR word boxes instead of re-parsing the text layer
+                text = words.text_in_rect(pdf_rect.x0, pdf_rect.y0, pdf_rect.x1, pdf_rect.y1)
+                if text.strip():
+                    self.show_selection_menu(event, text.strip())
+                return
+
             page = self.doc.load_page(self.current_page)
             if self.rotation != 0:
                 page.set_rotation(self.rotation)
@@ -6,13 +6,17 @@ from ...core.theme import SURFACE_COLOR, BG_COLOR, THEME_COLOR, FG_COLOR, MAIN_F
 from ...core.config_manager import state as app_state
 from ...core import platform_utils
 from ...core.emoji_label import EmojiLabel, render_emoji_image
+from ..widgets.virtual_list import VirtualList
 
 
 
 class HistoryView(ttk.Frame):
+    SEARCH_DELAY_MS = 200
+
     def __init__(self, parent, controller):
         super().__init__(parent, padding=40)
         self.controller = controller
+        self._search_job = None
         self.build_ui()
 
     def build_ui(self):
@@ -30,133 +34,120 @@ class HistoryView(ttk.Frame):
             btn_clear_hist.config(text=app_state.t("btn_clear_history"))
         btn_clear_hist.pack(side="right")
 
+        # Full-text search over OCR output (search_index)
+        search_bar = ttk.Frame(self)
+        search_bar.pack(fill="x")
+        EmojiLabel(search_bar, text=app_state.t("lbl_search_text"), font=(MAIN_FONT, 12)).pack(side="left", padx=(0, 10))
+        self.var_search = tk.StringVar()
+        self.ent_search = ttk.Entry(search_bar, textvariable=self.var_search)
+        self.ent_search.pack(side="left", fill="x", expand=True)
+        self.var_search.trace_add("write", lambda *a: self._schedule_search())
+
+        # Search results replace the history list while a query is entered
+        self.results_list = VirtualList(
+            self, row_factory=lambda parent: SearchResultRow(parent, self), row_height=58,
+            bg=SURFACE_COLOR, empty_factory=self._create_no_results_label
+        )
 
-        # Scrollable Area
-        self.canvas = tk.Canvas(self, bg=SURFACE_COLOR, highlightthickness=0)
-        self.scrollbar = ttk.Scrollbar(self, orient="vertical", command=self.canvas.yview)
-        self.scrollable_frame = ttk.Frame(self.canvas, style="Card.TFrame")
-
-        self.scrollable_frame.bind(
-            "<Configure>",
-            lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+        # Virtualised list: only rows in the viewport are materialised and they are reused on scroll
+        self.history_list = VirtualList(
+            self, row_factory=lambda parent: HistoryRow(parent, self), row_height=58,
+            bg=SURFACE_COLOR, empty_factory=self._create_empty_label
         )
+        self.history_list.pack(fill="both", expand=True, pady=10)
+
+        self.refresh()
 
-        # Store window id to update width later
-        self.canvas_window = self.canvas.create_window((0, 0), window=self.scrollable_frame, anchor="nw")
-        self.canvas.configure(yscrollcommand=self.scrollbar.set)
+    def _create_empty_label(self, parent):
+        return EmojiLabel(parent, text="No History Found", background=SURFACE_COLOR, font=(MAIN_FONT, 14))
 
-        self.canvas.pack(side="left", fill="both", expand=True, pady=10)
-        self.scrollbar.pack(side="right", fill="y", pady=10)
-        
-        # Responsive Width Binding
-        self.canvas.bind('<Configure>', self._on_canvas_configure)
+    def _create_no_results_label(self, parent):
+        return EmojiLabel(parent, text=app_state.t("msg_no_results"), background=SURFACE_COLOR, font=(MAIN_FONT, 14))
 
-        # Mousewheel
-        self.canvas.bind_all("<MouseWheel>", self._on_mousewheel)
+    def _schedule_search(self):
+        # Debounce: search once typing pauses
+        if self._search_job is not None:
+            self.after_cancel(self._search_job)
+        self._search_job = self.after(self.SEARCH_DELAY_MS, self.run_search)
 
-        self.refresh()
-        
-    def _on_canvas_configure(self, event):
-        # Update the width of the frame to fill the canvas
-        canvas_width = event.width
-        self.canvas.itemconfig(self.canvas_window, width=canvas_width)
+    def run_search(self):
+        self._search_job = None
+        query = self.var_search.get().strip()
+        if not query:
+            self.results_list.pack_forget()
+            self.history_list.pack(fill="both", expand=True, pady=10)
+            return
 
-    def _on_mousewheel(self, event):
+        from ...core.search_index import search_index
         try:
-            self.canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-        except: pass
+            results = search_index.search(query)
+        except Exception:
+            results = []
+        self.history_list.pack_forget()
+        self.results_list.pack(fill="both", expand=True, pady=10)
+        self.results_list.set_items(results)
+        self.results_list.scroll_to_top()
 
     def refresh(self):
-        for widget in self.scrollable_frame.winfo_children():
-            widget.destroy()
-            
-        data = history.get_all()
-        if not data:
-            EmojiLabel(self.scrollable_frame, text="No History Found", background=SURFACE_COLOR, font=(MAIN_FONT, 14)).pack(pady=20)
+        """Re-sync with the history store. Rows still showing the same entry are left untouched."""
+        self.history_list.set_items(history.get_all())
 
-            return
-            
-        # Header Row (Inside scrollable frame or separate? separate is better for sticky header but let's put simple labels)
-        # Actually separate header is better, but since rows are responsive, columns might misalign if header is separate and static.
-        # For true responsiveness with aligned columns, grid is best. But simple "Name... ....... Date Status Action" works too.
-        # Let's keep it simple: Just rows.
-        
-        for i, item in enumerate(data):
-            self.create_history_row(i, item)
+    def delete_entry(self, index):
+        """Delete a single entry and apply it incrementally instead of rebuilding the list."""
+        history.delete_entry(index)
+        self.history_list.delete(index)
+        self.controller.view_home.refresh_recent_docs()
+
+    def confirm_clear_all(self):
+        if messagebox.askyesno("Confirm", "Clear entire history log?"):
+            history.clear_all()
+            self.refresh()
+            self.controller.view_home.refresh_recent_docs()
+
+
+class HistoryRow(ttk.Frame):
+    """A reusable history row. Widgets are created once and re-bound via show_item()."""
+
+    def __init__(self, parent, view):
+        super().__init__(parent, style="Card.TFrame", padding=(10, 5))
+        self.view = view
+        self.controller = view.controller
+        self.index = None
+        self.item = None
+        self._shown = {}
 
-    def create_history_row(self, index, item):
-        row = ttk.Frame(self.scrollable_frame, style="Card.TFrame", padding=(10, 5))
-        row.pack(fill="x", pady=2, padx=2) 
-        
-        # Data
-        fname = item.get("filename", "Unknown")
-        date_str = item.get("date", "")
-        status = item.get("status", "")
-        source = item.get("source_path")
-        output = item.get("output_path")
-        
         # Layout: [Name (Expand)] [Date (Fixed)] [Status (Fixed)] [Actions (Fixed)]
-        
+
         # Name
-        EmojiLabel(row, text=fname, font=(MAIN_FONT, 14, "bold"), background=SURFACE_COLOR).pack(side="left", padx=10)
-        
+        self.lbl_title = EmojiLabel(self, font=(MAIN_FONT, 14, "bold"), background=SURFACE_COLOR)
+        self.lbl_title.pack(side="left", padx=10)
+
         # Actions Panel (Right)
-        actions = ttk.Frame(row, style="Card.TFrame")
+        actions = ttk.Frame(self, style="Card.TFrame")
         actions.pack(side="right", padx=10)
 
         # 1. Source System
-        def open_src():
-            if source and os.path.exists(source):
-                self.controller.open_dropped_pdf(source)
-            else:
-                messagebox.showerror("Error", "Source file not found (Moved/Deleted).")
-
-        btn_src = ttk.Button(actions, command=open_src)
-        img_src = render_emoji_image("📄 Src", (MAIN_FONT, 16), "white", btn_src)
+        self.btn_src = ttk.Button(actions, command=self.open_src)
+        img_src = render_emoji_image("📄 Src", (MAIN_FONT, 16), "white", self.btn_src)
         if img_src:
-            btn_src.config(image=img_src, text="")
-            btn_src._img = img_src
+            self.btn_src.config(image=img_src, text="")
+            self.btn_src._img = img_src
         else:
-            from ...core import platform_utils
-            btn_src.config(text=platform_utils.sanitize_for_linux("📄 Src"))
-        btn_src.pack(side="left", padx=2)
+            self.btn_src.config(text=platform_utils.sanitize_for_linux("📄 Src"))
+        self.btn_src.pack(side="left", padx=2)
 
-
-
-        if not source: btn_src.config(state="disabled")
-        
         # 2. Output Open
-        def open_out():
-            if output and os.path.exists(output):
-                self.controller.open_dropped_pdf(output)
-            else:
-                messagebox.showerror("Error", "Output file not found (Moved/Deleted).")
-
-        btn_out = ttk.Button(actions, command=open_out)
-        img_out = render_emoji_image("👁 View", (MAIN_FONT, 12), "white", btn_out)
+        self.btn_out = ttk.Button(actions, command=self.open_out)
+        img_out = render_emoji_image("👁 View", (MAIN_FONT, 12), "white", self.btn_out)
         if img_out:
-            btn_out.config(image=img_out, text="")
-            btn_out._img = img_out
+            self.btn_out.config(image=img_out, text="")
+            self.btn_out._img = img_out
         else:
-            from ...core import platform_utils
-            btn_out.config(text=platform_utils.sanitize_for_linux("👁 View"))
-        btn_out.pack(side="left", padx=2)
-
-
-
-
-        
-        if not output:
-            btn_out.config(state="disabled")
+            self.btn_out.config(text=platform_utils.sanitize_for_linux("👁 View"))
+        self.btn_out.pack(side="left", padx=2)
 
         # 3. Delete
-        def delete_me():
-            if messagebox.askyesno("Delete", f"Delete history for {fname}?"):
-                history.delete_entry(index)
-                self.refresh()
-                self.controller.view_home.refresh_recent_docs()
-
-        btn_del = ttk.Button(actions, style="Danger.TButton", command=delete_me)
+        btn_del = ttk.Button(actions, style="Danger.TButton", command=self.delete_me)
         img_del = render_emoji_image("🗑", (MAIN_FONT, 12), "white", btn_del)
         if img_del:
             btn_del.config(image=img_del, text="")
@@ -165,34 +156,119 @@ class HistoryView(ttk.Frame):
             btn_del.config(text=platform_utils.sanitize_for_linux("🗑"))
         btn_del.pack(side="left", padx=2)
 
+        # Status (Before Actions)
+        self.lbl_status = EmojiLabel(self, width=15, font=(MAIN_FONT, 16, "bold"), background=SURFACE_COLOR)
+        self.lbl_status.pack(side="right", padx=10)
 
+        # Date (Before Status)
+        self.lbl_date = EmojiLabel(self, font=(MAIN_FONT, 12), background=SURFACE_COLOR, foreground="gray")
+        self.lbl_date.pack(side="right", padx=10)
 
+        # Name (Left, Expand)
+        self.lbl_name = EmojiLabel(self, font=(MAIN_FONT, 12), background=SURFACE_COLOR)
+        self.lbl_name.pack(side="left", fill="x", expand=True, padx=10)
 
-        
-        # Status (Before Actions)
-        lbl_status = EmojiLabel(row, text=status, width=15, font=(MAIN_FONT, 16, "bold"), background=SURFACE_COLOR)
+    def _set(self, label, text, font, foreground=None):
+        # Skip re-rendering when the label already shows this exact text/colour
+        key = (text, foreground)
+        if self._shown.get(label) == key:
+            return
+        if foreground:
+            label.config(foreground=foreground)
+        label.set_text(text, font)
+        self._shown[label] = key
 
+    def show_item(self, index, item):
+        self.index = index
+        self.item = item
 
+        fname = item.get("filename", "Unknown")
+        status = item.get("status", "")
 
-        if "Success" in status or "Completed" in status: lbl_status.config(foreground="#4CAF50")
-        elif "Fail" in status: lbl_status.config(foreground="#F44336")
-        else: lbl_status.config(foreground="orange")
-        lbl_status.pack(side="right", padx=10)
-        
-        # Date (Before Status)
-        lbl_date = EmojiLabel(row, text=date_str, font=(MAIN_FONT, 12), background=SURFACE_COLOR)
-        lbl_date.config(foreground="gray")
-        lbl_date.pack(side="right", padx=10)
+        if "Success" in status or "Completed" in status: status_fg = "#4CAF50"
+        elif "Fail" in status: status_fg = "#F44336"
+        else: status_fg = "orange"
 
-        
-        # Name (Left, Expand)
-        lbl_name = EmojiLabel(row, text=fname, font=(MAIN_FONT, 12), background=SURFACE_COLOR)
-        lbl_name.pack(side="left", fill="x", expand=True, padx=10)
+        self._set(self.lbl_title, fname, (MAIN_FONT, 14, "bold"))
+        self._set(self.lbl_status, status, (MAIN_FONT, 16, "bold"), status_fg)
+        self._set(self.lbl_date, item.get("date", ""), (MAIN_FONT, 12))
+        self._set(self.lbl_name, fname, (MAIN_FONT, 12))
 
+        self.btn_src.config(state="normal" if item.get("source_path") else "disabled")
+        self.btn_out.config(state="normal" if item.get("output_path") else "disabled")
 
-    def confirm_clear_all(self):
-        if messagebox.askyesno("Confirm", "Clear entire history log?"):
-            history.clear_all()
-            self.refresh()
-            self.controller.view_home.refresh_recent_docs()
+    def open_src(self):
+        source = self.item.get("source_path") if self.item else None
+        if source and os.path.exists(source):
+            self.controller.open_dropped_pdf(source)
+        else:
+            messagebox.showerror("Error", "Source file not found (Moved/Deleted).")
 
+    def open_out(self):
+        output = self.item.get("output_path") if self.item else None
+        if output and os.path.exists(output):
+            self.controller.open_dropped_pdf(output)
+        else:
+            messagebox.showerror("Error", "Output file not found (Moved/Deleted).")
+
+    def delete_me(self):
+        if self.item is None:
+            return
+        fname = self.item.get("filename", "Unknown")
+        if messagebox.askyesno("Delete", f"Delete history for {fname}?"):
+            self.view.delete_entry(self.index)
+
+
+class SearchResultRow(ttk.Frame):
+    """A reusable search hit row: document, page, snippet and an Open action."""
+
+    def __init__(self, parent, view):
+        super().__init__(parent, style="Card.TFrame", padding=(10, 5))
+        self.view = view
+        self.controller = view.controller
+        self.item = None
+        self._shown = {}
+
+        btn_open = ttk.Button(self, command=self.open_hit)
+        img_open = render_emoji_image("👁 View", (MAIN_FONT, 12), "white", btn_open)
+        if img_open:
+            btn_open.config(image=img_open, text="")
+            btn_open._img = img_open
+        else:
+            btn_open.config(text=platform_utils.sanitize_for_linux("👁 View"))
+        btn_open.pack(side="right", padx=10)
+
+        self.lbl_title = EmojiLabel(self, font=(MAIN_FONT, 12, "bold"), background=SURFACE_COLOR)
+        self.lbl_title.pack(anchor="w", padx=10)
+        self.lbl_snippet = EmojiLabel(self, font=(MAIN_FONT, 11), background=SURFACE_COLOR, foreground="gray")
+        self.lbl_snippet.pack(anchor="w", padx=10)
+
+    def _set(self, label, text, font):
+        if self._shown.get(label) == text:
+            return
+        label.set_text(text, font)
+        self._shown[label] = text
+
+    def show_item(self, index, item):
+        self.item = item
+        title = f"{item.get('filename') or os.path.basename(item['path'])}  -  Page {item['page']}"
+        entries = history.get_all()
+        hist_idx = item.get("history_index")
+        if hist_idx is not None and hist_idx < len(entries):
+            title += f"  ({entries[hist_idx].get('date', '')})"
+        snippet = item.get("snippet", "")
+        if len(snippet) > 140:
+            snippet = snippet[:140] + "..."
+        self._set(self.lbl_title, title, (MAIN_FONT, 12, "bold"))
+        self._set(self.lbl_snippet, snippet, (MAIN_FONT, 11))
+
+    def open_hit(self):
+        if not self.item:
+            return
+        # Prefer the OCR output; fall back to the source document
+        for path in (self.item.get("path"), self.item.get("source_path")):
+            if path and os.path.exists(path):
+                self.controller.open_dropped_pdf(path)
+                self.controller.viewer.go_to_page(self.item["page"] - 1, highlight=self.view.var_search.get())
+                return
+        messagebox.showerror("Error", "Output file not found (Moved/Deleted).")
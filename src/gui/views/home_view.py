@@ -7,10 +7,13 @@ from ...core.theme import SURFACE_COLOR, THEME_COLOR, MAIN_FONT, HEADER_FONT
 from ...core.config_manager import state as app_state
 from ...core import platform_utils
 from ...core.emoji_label import EmojiLabel, render_emoji_image
+from ..widgets.virtual_list import VirtualList
 
 
 
 class HomeView(ttk.Frame):
+    RECENT_LIMIT = 5
+
     def __init__(self, parent, controller):
         super().__init__(parent, padding=40)
         self.controller = controller
@@ -89,102 +92,122 @@ class HomeView(ttk.Frame):
 
 
         
-        self.recent_container = ttk.Frame(self)
-        self.recent_container.pack(fill="both", expand=True)
+        # Recent rows are pooled and re-bound in place instead of being rebuilt on every refresh
+        self.recent_list = VirtualList(
+            self, row_factory=lambda parent: RecentRow(parent, self), row_height=64,
+            scrollbar=False, empty_factory=self._create_empty_label, visible_rows=self.RECENT_LIMIT
+        )
+        self.recent_list.pack(fill="both", expand=True)
         
         self.refresh_recent_docs()
 
+    def _create_empty_label(self, parent):
+        return EmojiLabel(parent, text="No recent activity", foreground="gray", font=(MAIN_FONT, 14))
+
     def refresh_recent_docs(self):
-        for widget in self.recent_container.winfo_children(): widget.destroy()
-        
-        data = history.get_all()
-        if not data:
-            EmojiLabel(self.recent_container, text="No recent activity", foreground="gray", font=(MAIN_FONT, 14)).pack(anchor="w", pady=10)
+        self.recent_list.set_items(history.get_all()[:self.RECENT_LIMIT])
 
-            return
+    def delete_entry(self, index):
+        history.delete_entry(index)
+        # The next entry slides into the window, so re-sync against the store
+        self.refresh_recent_docs()
+        view_history = getattr(self.controller, "view_history", None)
+        if view_history:
+            view_history.history_list.delete(index)
+
+
+class RecentRow(ttk.Frame):
+    """A reusable recent-activity row. Widgets are created once and re-bound via show_item()."""
+
+    def __init__(self, parent, view):
+        super().__init__(parent, style="Card.TFrame", padding=10)
+        self.view = view
+        self.controller = view.controller
+        self.index = None
+        self.item = None
+        self._shown = {}
 
-        for i, item in enumerate(data):
-            if i >= 5: break
-            self.create_mini_history_row(i, item)
-            
-    def create_mini_history_row(self, index, item):
-        row = ttk.Frame(self.recent_container, style="Card.TFrame", padding=10)
-        row.pack(fill="x", pady=2)
-        
-        fname = item.get("filename", "Unknown")
-        date_str = item.get("date", "")
-        status = item.get("status", "")
-        source = item.get("source_path")
-        output = item.get("output_path")
-        
         # Info
-        info_frame = ttk.Frame(row, style="Card.TFrame")
+        info_frame = ttk.Frame(self, style="Card.TFrame")
         info_frame.pack(side="left", fill="x", expand=True)
         
-        EmojiLabel(info_frame, text=fname, font=(MAIN_FONT, 12, "bold"), background=SURFACE_COLOR).pack(anchor="w")
+        self.lbl_name = EmojiLabel(info_frame, font=(MAIN_FONT, 12, "bold"), background=SURFACE_COLOR)
+        self.lbl_name.pack(anchor="w")
         
-        meta_txt = f"{date_str} • {status}"
-        lbl_meta = EmojiLabel(info_frame, text=meta_txt, font=(MAIN_FONT, 12), background=SURFACE_COLOR)
-        lbl_meta.config(foreground="gray")
-        lbl_meta.pack(anchor="w")
+        self.lbl_meta = EmojiLabel(info_frame, font=(MAIN_FONT, 12), background=SURFACE_COLOR, foreground="gray")
+        self.lbl_meta.pack(anchor="w")
 
-        
         # Actions
-        actions = ttk.Frame(row, style="Card.TFrame")
+        actions = ttk.Frame(self, style="Card.TFrame")
         actions.pack(side="right")
         
         # 1. Source System
-        def open_src():
-            if source and os.path.exists(source):
-                self.controller.open_dropped_pdf(source)
-            else:
-                messagebox.showerror("Error", "Source file not found.")
-
-        btn_src = ttk.Button(actions, command=open_src)
-        img_src = render_emoji_image("📂 Src", (MAIN_FONT, 12), "white", btn_src)
+        self.btn_src = ttk.Button(actions, command=self.open_src)
+        img_src = render_emoji_image("📂 Src", (MAIN_FONT, 12), "white", self.btn_src)
         if img_src:
-            btn_src.config(image=img_src, text="")
-            btn_src._img = img_src
+            self.btn_src.config(image=img_src, text="")
+            self.btn_src._img = img_src
         else:
-            btn_src.config(text=platform_utils.sanitize_for_linux("📂 Src"))
-        btn_src.pack(side="left", padx=2)
-        if not source: btn_src.config(state="disabled")
+            self.btn_src.config(text=platform_utils.sanitize_for_linux("📂 Src"))
+        self.btn_src.pack(side="left", padx=2)
 
-        
         # 2. Output Open
-        def open_out():
-            if output and os.path.exists(output):
-                self.controller.open_dropped_pdf(output)
-            else:
-                messagebox.showerror("Error", "Output file not found.")
-
-        btn_out = ttk.Button(actions, command=open_out)
-        img_out = render_emoji_image("👁️ View", (MAIN_FONT, 12), "white", btn_out)
+        self.btn_out = ttk.Button(actions, command=self.open_out)
+        img_out = render_emoji_image("👁️ View", (MAIN_FONT, 12), "white", self.btn_out)
         if img_out:
-            btn_out.config(image=img_out, text="")
-            btn_out._img = img_out
+            self.btn_out.config(image=img_out, text="")
+            self.btn_out._img = img_out
         else:
-            btn_out.config(text=platform_utils.sanitize_for_linux("👁️ View"))
-        btn_out.pack(side="left", padx=2)
-
-        
-        if not output:
-            btn_out.config(state="disabled")
+            self.btn_out.config(text=platform_utils.sanitize_for_linux("👁️ View"))
+        self.btn_out.pack(side="left", padx=2)
 
         # 3. Delete
-        def delete_me():
-            if messagebox.askyesno("Delete", f"Delete history for {fname}?"):
-                # We need to find the correct index in standard history
-                # Since we are iterating 0..5 of get_all(), the 'index' passed in is correct
-                history.delete_entry(index)
-                self.refresh_recent_docs()
-
-        btn_del = ttk.Button(actions, style="Danger.TButton", command=delete_me)
+        btn_del = ttk.Button(actions, style="Danger.TButton", command=self.delete_me)
         img_del = render_emoji_image("🗑️", (MAIN_FONT, 12), "white", btn_del)
         if img_del:
             btn_del.config(image=img_del, text="")
             btn_del._img = img_del
         else:
             btn_del.config(text=platform_utils.sanitize_for_linux("🗑️"))
-
         btn_del.pack(side="left", padx=2)
+
+    def _set(self, label, text, font):
+        # Skip re-rendering when the label already shows this exact text
+        if self._shown.get(label) == text:
+            return
+        label.set_text(text, font)
+        self._shown[label] = text
+
+    def show_item(self, index, item):
+        self.index = index
+        self.item = item
+
+        date_str = item.get("date", "")
+        status = item.get("status", "")
+        self._set(self.lbl_name, item.get("filename", "Unknown"), (MAIN_FONT, 12, "bold"))
+        self._set(self.lbl_meta, f"{date_str} • {status}", (MAIN_FONT, 12))
+
+        self.btn_src.config(state="normal" if item.get("source_path") else "disabled")
+        self.btn_out.config(state="normal" if item.get("output_path") else "disabled")
+
+    def open_src(self):
+        source = self.item.get("source_path") if self.item else None
+        if source and os.path.exists(source):
+            self.controller.open_dropped_pdf(source)
+        else:
+            messagebox.showerror("Error", "Source file not found.")
+
+    def open_out(self):
+        output = self.item.get("output_path") if self.item else None
+        if output and os.path.exists(output):
+            self.controller.open_dropped_pdf(output)
+        else:
+            messagebox.showerror("Error", "Output file not found.")
+
+    def delete_me(self):
+        if self.item is None:
+            return
+        fname = self.item.get("filename", "Unknown")
+        if messagebox.askyesno("Delete", f"Delete history for {fname}?"):
+            # Rows map 1:1 onto the head of get_all(), so the row index is the history index
+            self.view.delete_entry(self.index)
@@ -82,6 +82,8 @@ class ScanView(ttk.Frame):
         self._create_check(opt_group, app_state.t("opt_rotate"), self.controller.var_rotate)
         self._create_check(opt_group, app_state.t("opt_force"), self.controller.var_force)
         self._create_check(opt_group, app_state.t("opt_rasterize"), self.controller.var_rasterize)
+        self._create_check(opt_group, app_state.t("opt_two_pass"), self.controller.var_two_pass)
+        self._create_check(opt_group, app_state.t("opt_remove_blank"), self.controller.var_remove_blank)
 
         
         dpi_frame = ttk.Frame(opt_group)
@@ -94,6 +96,10 @@ class ScanView(ttk.Frame):
         ttk.Combobox(opt_group, textvariable=self.controller.var_optimize, 
                      values=["0", "1", "2", "3"], state="readonly").pack(fill="x")
 
+        EmojiLabel(opt_group, text=app_state.t("lbl_model_tier"), font=(MAIN_FONT, 14)).pack(anchor="w", pady=(10, 2))
+        ttk.Combobox(opt_group, textvariable=self.controller.var_model_tier,
+                     values=["fast", "standard", "best"], state="readonly").pack(fill="x")
+
 
         # Multi-Select Languages
         lang_group = ttk.Frame(self.scan_sidebar, padding=10, style="Card.TFrame")
@@ -5,7 +5,6 @@ Extracted from app.py for better maintainability.
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 import os
-import shutil
 
 from ...core.theme import BG_COLOR, SURFACE_COLOR, FG_COLOR, THEME_COLOR, MAIN_FONT, HEADER_FONT
 from ...core.config_manager import state as app_state
@@ -97,6 +96,23 @@ class SettingsView(ttk.Frame):
                                    variable=self.controller.var_cpu_threads, background=SURFACE_COLOR, 
                                    foreground=FG_COLOR, highlightthickness=0)
         self.s_threads.pack(fill="x", pady=5)
+
+        # Auto-tuning (calibration.py)
+        self._create_check(hw_group, app_state.t("lbl_auto_tune"), self.controller.var_auto_tune)
+        self.controller.var_auto_tune.trace_add("write", lambda *a: self.controller.save_settings_inline())
+
+        btn_calibrate = ttk.Button(hw_group, command=self.run_calibration)
+        img_cal = render_emoji_image(app_state.t("btn_calibrate"), (MAIN_FONT, 12), "white", btn_calibrate)
+        if img_cal:
+            btn_calibrate.config(image=img_cal, text="")
+            btn_calibrate._img = img_cal
+        else:
+            btn_calibrate.config(text=app_state.t("btn_calibrate"))
+        btn_calibrate.pack(anchor="w", pady=(10, 5))
+
+        self.lbl_tuning = EmojiLabel(hw_group, text="", foreground="gray", font=(MAIN_FONT, 10))
+        self.lbl_tuning.pack(anchor="w")
+        self.update_tuning_summary()
         
         # Lang
         lang_group = ttk.Frame(self.settings_scroll_frame, padding=20, style="Card.TFrame")
@@ -146,7 +162,10 @@ class SettingsView(ttk.Frame):
         self.packs_canvas.bind('<Configure>', 
             lambda e: self.packs_canvas.itemconfig(self.packs_window, width=e.width))
 
-        btn_add_pack = ttk.Button(lang_group, command=self.add_data_pack)
+        # Packs can be kept as fast/best variants next to the standard ones (chosen per job)
+        add_row = ttk.Frame(lang_group)
+        add_row.pack(fill="x", pady=10)
+        btn_add_pack = ttk.Button(add_row, command=self.add_data_pack)
         img_add = render_emoji_image("➕ Add Data Pack", (MAIN_FONT, 16), "white", btn_add_pack)
         if img_add:
             btn_add_pack.config(image=img_add, text="")
@@ -154,7 +173,11 @@ class SettingsView(ttk.Frame):
         else:
             from ...core import platform_utils
             btn_add_pack.config(text=platform_utils.sanitize_for_linux("➕ Add Data Pack"))
-        btn_add_pack.pack(anchor="w", pady=10)
+        btn_add_pack.pack(side="left")
+        self.var_pack_tier = tk.StringVar(value="standard")
+        ttk.Combobox(add_row, textvariable=self.var_pack_tier, values=["standard", "fast", "best"],
+                     state="readonly", width=10).pack(side="right")
+        EmojiLabel(add_row, text=app_state.t("lbl_pack_tier"), font=(MAIN_FONT, 12)).pack(side="right", padx=5)
 
 
 
@@ -194,6 +217,22 @@ class SettingsView(ttk.Frame):
 
 
 
+    def run_calibration(self):
+        """Re-run the hardware benchmark on demand."""
+        self.lbl_tuning.config(text=app_state.t("lbl_calibrating"))
+        self.controller.start_calibration(apply_threads=True)
+
+    def update_tuning_summary(self):
+        """Show the tuning values currently in effect."""
+        from ...core import calibration
+        if calibration.is_running():
+            self.lbl_tuning.config(text=app_state.t("lbl_calibrating"))
+            return
+        t = calibration.get_tuning()
+        self.lbl_tuning.config(text=(
+            f"Chunks: {t['chunk_size']} pages (from {t['chunk_threshold']}+) | "
+            f"Jobs: {t['jobs']} | Parallel docs: {t['doc_concurrency']} | DPI cap: {t['max_dpi']}"))
+
     def factory_reset(self):
         """Reset application to factory defaults."""
         print("Factory reset triggered")
@@ -256,15 +295,19 @@ class SettingsView(ttk.Frame):
         for w in self.packs_scroll_frame.winfo_children():
             w.destroy()
         
-        d = get_tessdata_dir()
-        if not os.path.exists(d):
-            return
-        
-        files = sorted([f for f in os.listdir(d) if "traineddata" in f])
+        # Standard packs first, then the side-by-side fast/best variants
+        from ...core import tessdata_manager
+        packs = []
+        for tier in tessdata_manager.TIERS:
+            tier_dir = get_tessdata_dir() if tier == "standard" else tessdata_manager.tier_tessdata_dir(tier)
+            if os.path.exists(tier_dir):
+                packs.extend((tier, tier_dir, f) for f in sorted(os.listdir(tier_dir)) if "traineddata" in f)
         
-        for f in files:
+        for tier, d, f in packs:
             is_disabled = f.endswith(".disabled")
             clean_name = f.replace(".disabled", "")
+            if tier != "standard" and clean_name == "osd.traineddata":
+                continue # Shared from the standard packs
             
             row = ttk.Frame(self.packs_scroll_frame, padding=5)
             row.pack(fill="x", pady=1)
@@ -273,7 +316,8 @@ class SettingsView(ttk.Frame):
             icon = "🔴" if is_disabled else "🟢"
             from ...core import platform_utils
             safe_icon = platform_utils.sanitize_for_linux(icon)
-            lbl = EmojiLabel(row, text=f"{safe_icon} {clean_name}", font=(MAIN_FONT, 16))
+            tier_tag = f"  [{tier}]" if tier != "standard" else ""
+            lbl = EmojiLabel(row, text=f"{safe_icon} {clean_name}{tier_tag}", font=(MAIN_FONT, 16))
 
 
 
@@ -284,13 +328,13 @@ class SettingsView(ttk.Frame):
             lbl.pack(side="left", padx=5)
             
             # Actions - Protect OSD
-            if clean_name == "osd.traineddata":
+            if clean_name == "osd.traineddata" and tier == "standard":
                 ttk.Label(row, text="(System)", font=(MAIN_FONT, 10), 
                           foreground="gray").pack(side="right", padx=10)
                 continue
             
             # Create closures properly
-            def make_toggle_handler(fname, disabled):
+            def make_toggle_handler(d, fname, disabled):
                 def toggle_disable():
                     src = os.path.join(d, fname)
                     if disabled:
@@ -304,7 +348,7 @@ class SettingsView(ttk.Frame):
                         messagebox.showerror("Error", str(e))
                 return toggle_disable
 
-            def make_delete_handler(fname):
+            def make_delete_handler(d, fname):
                 def delete_pack():
                     if messagebox.askyesno("Confirm", f"Delete {fname}?"):
                         try:
@@ -315,7 +359,7 @@ class SettingsView(ttk.Frame):
                 return delete_pack
 
             btn_del = ttk.Button(row, width=3, 
-                                  command=make_delete_handler(f), style="Danger.TButton")
+                                  command=make_delete_handler(d, f), style="Danger.TButton")
             img_trash = render_emoji_image("🗑", (MAIN_FONT, 16), "white", btn_del)
 
 
@@ -333,7 +377,7 @@ class SettingsView(ttk.Frame):
             btn_del.pack(side="right", padx=2)
             
             toggle_txt = "Enable" if is_disabled else "Disable"
-            btn_toggle = ttk.Button(row, command=make_toggle_handler(f, is_disabled))
+            btn_toggle = ttk.Button(row, command=make_toggle_handler(d, f, is_disabled))
             img_tgl = render_emoji_image(toggle_txt, (MAIN_FONT, 12), "white", btn_toggle)
             if img_tgl:
                 btn_toggle.config(image=img_tgl, text="")
@@ -370,8 +414,12 @@ class SettingsView(ttk.Frame):
                 if len(header) < 10:
                     raise Exception("Invalid file content")
             
-            dest = os.path.join(get_tessdata_dir(), os.path.basename(f))
-            shutil.copy(f, dest)
+            from ...core import tessdata_manager
+            tier = self.var_pack_tier.get()
+            dest_dir = get_tessdata_dir() if tier == "standard" else tessdata_manager.tier_tessdata_dir(tier)
+            os.makedirs(dest_dir, exist_ok=True)
+            dest = os.path.join(dest_dir, os.path.basename(f))
+            tessdata_manager.install_user_pack(f, dest)
             
             messagebox.showinfo("Success", f"Installed {os.path.basename(f)}")
             
@@ -0,0 +1,180 @@
+"""
+Virtual List - A scrollable list that only materialises widgets for visible rows.
+Row widgets are pooled and re-bound to new items on scroll instead of being rebuilt.
+"""
+import math
+import tkinter as tk
+from tkinter import ttk
+
+
+class VirtualList(ttk.Frame):
+    """
+    Fixed row-height list backed by a Canvas.
+
+    `row_factory(parent)` must return a widget exposing `show_item(index, item)`.
+    Only enough rows to cover the viewport (+1 for partial rows) are ever created;
+    scrolling moves and re-binds them.
+    """
+
+    def __init__(self, master, row_factory, row_height=60, bg=None, empty_text=None,
+                 empty_factory=None, scrollbar=True, visible_rows=None, **kwargs):
+        super().__init__(master, **kwargs)
+        self.row_factory = row_factory
+        self.row_height = row_height
+        self.items = []
+        self._pool = []          # [(row_widget, canvas_window_id)]
+        self._bound = {}         # row_widget -> (index, item) currently shown
+        self._empty_factory = empty_factory
+        self._empty_text = empty_text
+        self._empty_widget = None
+        self._pending = None
+
+        self.canvas = tk.Canvas(self, highlightthickness=0, bg=bg) if bg else tk.Canvas(self, highlightthickness=0)
+        self.scrollbar = None
+        if scrollbar:
+            self.scrollbar = ttk.Scrollbar(self, orient="vertical", command=self._on_scrollbar)
+            self.scrollbar.pack(side="right", fill="y")
+        self.canvas.configure(yscrollcommand=self._on_yscroll)
+        self.canvas.pack(side="left", fill="both", expand=True)
+
+        self.canvas.configure(yscrollincrement=max(1, row_height // 2))
+        if visible_rows:
+            self.canvas.configure(height=visible_rows * row_height)
+        self.canvas.bind("<Configure>", self._on_canvas_configure)
+        self._bind_wheel_recursive(self.canvas)
+
+    # ==================== PUBLIC API ====================
+
+    def set_items(self, items):
+        """Replace the backing list. Rows already showing the same item are not re-bound."""
+        self.items = list(items)
+        self._refresh_layout()
+
+    def insert(self, index, item):
+        """Insert a single item; only visible rows at or after `index` are re-bound."""
+        index = max(0, min(index, len(self.items)))
+        self.items.insert(index, item)
+        self._refresh_layout()
+
+    def delete(self, index):
+        """Remove a single item; only visible rows at or after `index` are re-bound."""
+        if 0 <= index < len(self.items):
+            del self.items[index]
+            self._refresh_layout()
+
+    def update_item(self, index, item):
+        """Replace a single item in place."""
+        if 0 <= index < len(self.items):
+            self.items[index] = item
+            self._refresh_layout()
+
+    def scroll_to_top(self):
+        self.canvas.yview_moveto(0)
+
+    # ==================== INTERNALS ====================
+
+    def _refresh_layout(self):
+        width = max(1, self.canvas.winfo_width())
+        self.canvas.configure(scrollregion=(0, 0, width, len(self.items) * self.row_height))
+        self._update_empty_state()
+        self._update_visible()
+
+    def _update_empty_state(self):
+        if self.items:
+            if self._empty_widget:
+                self._empty_widget.place_forget()
+            return
+        if not self._empty_widget and (self._empty_factory or self._empty_text):
+            if self._empty_factory:
+                self._empty_widget = self._empty_factory(self.canvas)
+            else:
+                self._empty_widget = ttk.Label(self.canvas, text=self._empty_text)
+        if self._empty_widget:
+            self._empty_widget.place(relx=0.5, y=20, anchor="n")
+
+    def _visible_range(self):
+        height = self.canvas.winfo_height()
+        if height <= 1:
+            # Not mapped yet: assume the requested height
+            height = int(self.canvas.cget("height") or 0) or self.row_height * 10
+        top = max(0, self.canvas.canvasy(0))
+        first = int(top // self.row_height)
+        last = min(len(self.items), int(math.ceil((top + height) / self.row_height)))
+        return first, last
+
+    def _ensure_pool(self, count):
+        width = max(1, self.canvas.winfo_width())
+        while len(self._pool) < count:
+            row = self.row_factory(self.canvas)
+            win = self.canvas.create_window(0, -self.row_height * 2, window=row, anchor="nw",
+                                            width=width, height=self.row_height)
+            self._pool.append((row, win))
+            self._bind_wheel_recursive(row)
+
+    def _update_visible(self):
+        first, last = self._visible_range()
+        needed = max(0, last - first)
+        self._ensure_pool(needed)
+
+        # Rows are assigned by index modulo pool size so a row keeps its item while it stays visible
+        pool_size = len(self._pool)
+        used = set()
+        for index in range(first, last):
+            row, win = self._pool[index % pool_size]
+            used.add(row)
+            item = self.items[index]
+            self.canvas.coords(win, 0, index * self.row_height)
+            current = self._bound.get(row)
+            if current is None or current[0] != index or current[1] is not item:
+                row.show_item(index, item)
+                self._bound[row] = (index, item)
+
+        # Park unused rows off-screen (kept for reuse)
+        for row, win in self._pool:
+            if row not in used:
+                self.canvas.coords(win, 0, -self.row_height * 2)
+                self._bound.pop(row, None)
+
+    def _on_canvas_configure(self, event):
+        for _row, win in self._pool:
+            self.canvas.itemconfig(win, width=event.width)
+        self._refresh_layout()
+
+    def _on_scrollbar(self, *args):
+        self.canvas.yview(*args)
+
+    def _on_yscroll(self, first, last):
+        if self.scrollbar:
+            self.scrollbar.set(first, last)
+        # Coalesce bursts of scroll events into one re-bind pass
+        if self._pending is None:
+            self._pending = self.after_idle(self._flush_scroll)
+
+    def _flush_scroll(self):
+        self._pending = None
+        try:
+            self._update_visible()
+        except tk.TclError:
+            pass
+
+    # ==================== MOUSE WHEEL ====================
+
+    def _bind_wheel_recursive(self, widget):
+        # Bound per widget (not bind_all) so other views keep their own wheel handlers
+        for seq in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            widget.bind(seq, self._on_mousewheel, add="+")
+        for child in widget.winfo_children():
+            self._bind_wheel_recursive(child)
+
+    def _on_mousewheel(self, event):
+        try:
+            if self.canvas.yview() == (0.0, 1.0):
+                return
+            if getattr(event, "num", None) == 4:
+                self.canvas.yview_scroll(-1, "units")
+            elif getattr(event, "num", None) == 5:
+                self.canvas.yview_scroll(1, "units")
+            elif event.delta:
+                self.canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
+        except Exception:
+            pass
@@ -0,0 +1,47 @@
+"""Blank page detection on sparse pages: a few words must never count as blank."""
+import pytest
+
+np = pytest.importorskip("numpy")
+fitz = pytest.importorskip("fitz")
+
+from src.core import page_analysis
+
+
+def _stats(draw=None):
+    """PageStats of a US Letter page (drawn on by draw(page)) rendered the way the engine does."""
+    doc = fitz.open()
+    page = doc.new_page(width=612, height=792)
+    if draw:
+        draw(page)
+    pix = page.get_pixmap(dpi=page_analysis.ANALYSIS_DPI, colorspace=fitz.csGRAY, alpha=False)
+    return page_analysis.analyze(pix.samples, pix.width, pix.height, pix.stride)
+
+
+def _specks(page):
+    for x, y in ((150, 200), (400, 500), (300, 650)):
+        page.draw_circle((x, y), 0.6, color=(0, 0, 0), fill=(0, 0, 0))
+
+
+def test_empty_page_is_blank():
+    assert page_analysis.is_blank(_stats())
+
+
+def test_a_few_specks_are_blank():
+    assert page_analysis.is_blank(_stats(_specks))
+
+
+@pytest.mark.parametrize("text, fontsize", [
+    ("Chapter 2", 14),
+    ("Signed: ____________  Date: 12 March 2024", 10),
+    ("2", 10),
+])
+def test_sparse_text_is_not_blank(text, fontsize):
+    stats = _stats(lambda page: page.insert_text((200, 400), text, fontsize=fontsize))
+    assert stats.ink_ratio <= page_analysis.MAX_INK_RATIO
+    assert not page_analysis.is_blank(stats)
+
+
+def test_signature_rule_is_not_blank():
+    def rule(page):
+        page.draw_line((200, 600), (400, 600), color=(0, 0, 0), width=0.5)
+    assert not page_analysis.is_blank(_stats(rule))
@@ -0,0 +1,76 @@
+"""Full-text search index: query building, Bengali tokenisation, document lifecycle."""
+import os
+
+import pytest
+
+from src.core import search_index
+from src.core.search_index import SearchIndex, build_match_query
+
+BENGALI_PAGE = "আমাদের বিদ্যালয় খুব সুন্দর"   # বিদ্যালয়: vowel sign, virama and nukta
+
+
+@pytest.fixture
+def index(tmp_path, monkeypatch):
+    # Hits are linked to the user's history; not under test here
+    monkeypatch.setattr(SearchIndex, "_link_history", lambda self, results: None)
+    idx = SearchIndex(db_path=str(tmp_path / "search.db"))
+    yield idx
+    if idx._conn is not None:
+        idx._conn.close()
+
+
+def _add(index, path, pages):
+    indexer = index.begin_document(path, filename=os.path.basename(path))
+    for n, text in enumerate(pages):
+        indexer(n, text)
+    indexer.finish()
+    return indexer
+
+
+def _hits(index, text):
+    return [(os.path.basename(r["path"]), r["page"]) for r in index.search(text)]
+
+
+def test_build_match_query():
+    assert build_match_query("  ") is None
+    assert build_match_query("hello") == '"hello"*'
+    assert build_match_query('say "hi there') == '"say" "hi" "there"*'
+
+
+def test_bengali_word_is_one_token(index, tmp_path):
+    if not index._connect() or not index.fts:
+        pytest.skip("SQLite without FTS5")
+    _add(index, str(tmp_path / "bn.pdf"), ["English cover", BENGALI_PAGE])
+    assert _hits(index, "বিদ্যালয়") == [("bn.pdf", 2)]
+    # Split at the virama, the tail would be a token of its own; as one token it is not
+    assert _hits(index, "যালয় সুন্দর") == []
+    assert _hits(index, "দ্যালয় সুন্দর") == []
+
+
+def test_prefix_search_on_last_term(index, tmp_path):
+    if not index._connect() or not index.fts:
+        pytest.skip("SQLite without FTS5")
+    _add(index, str(tmp_path / "doc.pdf"), ["Quarterly Report", BENGALI_PAGE])
+    assert _hits(index, "quarterly rep") == [("doc.pdf", 1)]
+    assert _hits(index, "আমাদের বিদ্যা") == [("doc.pdf", 2)]
+    # Only the last term is a prefix
+    assert _hits(index, "quart report") == []
+
+
+def test_rename_document(index, tmp_path):
+    old, new = str(tmp_path / "processed_output.pdf"), str(tmp_path / "saved.pdf")
+    _add(index, old, ["invoice total"])
+    _add(index, new, ["stale copy of invoice"])
+    index.rename_document(old, new)
+    assert _hits(index, "invoice") == [("saved.pdf", 1)]
+    assert index.search("stale") == []
+
+
+def test_abort_removes_partial_document(index, tmp_path):
+    _add(index, str(tmp_path / "kept.pdf"), ["kept page"])
+    indexer = index.begin_document(str(tmp_path / "cancelled.pdf"))
+    indexer(0, "kept words from a cancelled run")
+    indexer.abort()
+    assert _hits(index, "kept") == [("kept.pdf", 1)]
+    paths = index._connect().execute("SELECT path FROM documents").fetchall()
+    assert [os.path.basename(p) for (p,) in paths] == ["kept.pdf"]
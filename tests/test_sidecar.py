@@ -0,0 +1,77 @@
+"""Sidecar text with its page-offset index (.txt.idx)."""
+import os
+
+from src.core import sidecar
+
+# Empty pages in the middle and at the end; Bengali is 3 bytes per code point in UTF-8
+PAGES = ["Page one", "", "বাংলা লেখা, দ্বিতীয় পৃষ্ঠা", "Last text page", ""]
+
+
+def _write(path, pages=PAGES, on_page=None):
+    with sidecar.SidecarWriter(str(path), on_page=on_page) as writer:
+        for text in pages:
+            writer.write_page(text)
+    return str(path)
+
+
+def test_writer_round_trip(tmp_path):
+    seen = []
+    txt = _write(tmp_path / "doc.txt", on_page=lambda n, text: seen.append((n, text)))
+    assert seen == list(enumerate(PAGES))
+
+    reader = sidecar.open_reader(txt)
+    assert reader is not None
+    assert reader.page_count == len(PAGES)
+    assert [reader.get_page(n) for n in range(len(PAGES))] == PAGES
+    assert reader.get_page(len(PAGES)) == ""
+    assert list(sidecar.iter_text_pages(txt)) == PAGES
+
+
+def test_byte_offsets_with_multibyte_text(tmp_path):
+    txt = _write(tmp_path / "doc.txt")
+    reader = sidecar.SidecarReader(txt)
+    start, end = reader._ranges[4], reader._ranges[5]
+    assert end - start == len(PAGES[2].encode("utf-8"))
+    with open(txt, "rb") as f:
+        f.seek(start)
+        assert f.read(end - start).decode("utf-8") == PAGES[2]
+
+
+def test_build_index_matches_writer(tmp_path):
+    txt = _write(tmp_path / "doc.txt")
+    with open(sidecar.index_path(txt), "rb") as f:
+        written = f.read()
+    os.remove(sidecar.index_path(txt))
+
+    seen = []
+    assert sidecar.build_index(txt, on_page=lambda n, text: seen.append(text)) == len(PAGES)
+    assert seen == PAGES
+    with open(sidecar.index_path(txt), "rb") as f:
+        assert f.read() == written
+
+
+def test_build_index_without_trailing_separator(tmp_path):
+    txt = str(tmp_path / "ocrmypdf.txt")
+    with open(txt, "wb") as f:
+        f.write("first\fদ্বিতীয়".encode("utf-8"))
+    assert sidecar.build_index(txt) == 2
+    assert [sidecar.open_reader(txt).get_page(n) for n in range(2)] == ["first", "দ্বিতীয়"]
+
+
+def test_open_reader_rejects_stale_index(tmp_path):
+    txt = _write(tmp_path / "doc.txt")
+    assert sidecar.open_reader(txt, expected_pages=len(PAGES)) is not None
+    assert sidecar.open_reader(txt, expected_pages=len(PAGES) + 1) is None
+
+    # Text rewritten after its index
+    idx_mtime = os.stat(sidecar.index_path(txt)).st_mtime
+    os.utime(txt, (idx_mtime + 10, idx_mtime + 10))
+    assert sidecar.open_reader(txt) is None
+
+
+def test_open_reader_rejects_bad_index(tmp_path):
+    txt = _write(tmp_path / "doc.txt")
+    with open(sidecar.index_path(txt), "r+b") as f:
+        f.write(b"NOTANIDX")
+    assert sidecar.open_reader(txt) is None
+    assert sidecar.open_reader(str(tmp_path / "missing.txt")) is None
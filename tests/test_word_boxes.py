@@ -0,0 +1,71 @@
+"""Word box files (.words) and their grid index."""
+import pytest
+
+from src.core import word_boxes
+
+PAGE_1 = [  # (x0, y0, x1, y1, text, conf, line) in PDF points
+    (72, 100, 120, 112, "Invoice", 96, 1),
+    (125, 100, 160, 112, "No.", 91, 1),
+    (72, 130, 110, 142, "মোট", None, 2),
+    (115, 130, 170, 142, "টাকা", 40, 2),
+    (400, 700, 450, 712, "  ", 90, 3),   # whitespace only: not stored
+]
+
+
+def _write(path, pages):
+    with word_boxes.WordBoxWriter(str(path)) as writer:
+        for width, height, words in pages:
+            writer.write_page(width, height, words)
+    return str(path)
+
+
+def test_round_trip_and_hit_test(tmp_path):
+    path = _write(tmp_path / "doc.words", [(612, 792, PAGE_1), (612, 792, [])])
+    reader = word_boxes.open_reader(path, expected_pages=2)
+    assert reader is not None
+
+    page = reader.get_page(0)
+    assert (page.width, page.height) == (612, 792)
+    assert page.words == ["Invoice", "No.", "মোট", "টাকা"]
+    assert list(page.confs) == [96, 91, word_boxes.CONF_UNKNOWN, 40]
+    assert page.box(2) == (72, 130, 110, 142)
+
+    # A small rectangle around the centre of "No." and one over both lines
+    assert page.words_in_rect(140, 104, 145, 108) == [1]
+    assert page.text_in_rect(60, 90, 200, 150) == "Invoice No.\nমোট টাকা"
+    assert page.find(["inv", "টা"]) == [page.box(0), page.box(3)]
+
+    assert len(reader.get_page(1)) == 0
+    assert reader.get_page(2) is None
+
+
+def test_open_reader_rejects_mismatch_and_truncation(tmp_path):
+    path = _write(tmp_path / "doc.words", [(612, 792, PAGE_1)])
+    assert word_boxes.open_reader(path, expected_pages=2) is None
+    with open(path, "r+b") as f:
+        f.truncate(len(word_boxes.WORDS_MAGIC) + 20)
+    assert word_boxes.open_reader(path) is None
+    assert word_boxes.open_reader(str(tmp_path / "missing.words")) is None
+
+
+def test_rotated_page_words_are_stored_as_displayed(tmp_path):
+    fitz = pytest.importorskip("fitz")
+    from src.core import ocr_engine
+    ocr_engine._load_pdf_libs()
+
+    doc = fitz.open()
+    page = doc.new_page(width=612, height=792)
+    page.insert_text((100, 150), "Rotated", fontsize=12)
+    page.set_rotation(90)
+    # Turned 90 degrees clockwise: an unrotated point (x, y) is shown at (792 - y, x)
+    assert (page.rect.width, page.rect.height) == (792, 612)
+
+    path = _write(tmp_path / "rotated.words", [(page.rect.width, page.rect.height, ocr_engine._page_words(page))])
+    shown = word_boxes.open_reader(path).get_page(0)
+    assert shown.words == ["Rotated"]
+    x0, y0, x1, y1 = shown.box(0)
+    assert x1 - x0 < y1 - y0  # the word now runs down the page
+
+    x, y = 120, 146           # inside the word on the unrotated page
+    assert shown.words_in_rect(792 - y - 8, x - 25, 792 - y + 8, x + 25) == [0]
+    assert shown.words_in_rect(x - 25, y - 8, x + 25, y + 8) == []